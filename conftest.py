@@ -0,0 +1,26 @@
+"""
+Gemeinsame pytest-Konfiguration
+"""
+
+import os
+import shutil
+import tempfile
+
+from python_prototype.utils.scene_cache import ENV_VAR
+
+_scene_cache_dir = None
+
+
+def pytest_configure(config):
+    """Szenen-Cache pro Testlauf in ein temporäres Verzeichnis umleiten:
+    kein Schreiben nach ~/.cache, keine veralteten Szenen aus früheren Läufen
+    (auch für Beispielskripte, die beim Sammeln simulieren)."""
+    global _scene_cache_dir
+    _scene_cache_dir = tempfile.mkdtemp(prefix='fmcw_scenes_')
+    os.environ[ENV_VAR] = _scene_cache_dir
+
+
+def pytest_unconfigure(config):
+    if _scene_cache_dir is not None:
+        os.environ.pop(ENV_VAR, None)
+        shutil.rmtree(_scene_cache_dir, ignore_errors=True)
@@ -2,11 +2,13 @@ import numpy as np
 import matplotlib.pyplot as plt
 from python_prototype.waveform.chirp_generator import ChirpGenerator
 from python_prototype.signal_processing.range_fft import RangeProcessor
+from python_prototype.waveform.radar_profile import load_profile
+from python_prototype.detection.clustering import cluster_detections
+from python_prototype.utils.scene_cache import simulate_scene
 
 
-# Setup
-gen = ChirpGenerator(f_start=24e9, bandwidth=250e6, 
-                     chirp_duration=256e-6, sample_rate=10e6)
+# Setup (24 GHz, 250 MHz, 256 µs, 10 MHz)
+gen = ChirpGenerator.from_profile(load_profile('k24_long_range'), verbose=True)
 proc = RangeProcessor(gen)
 
 # ===== MULTI-TARGET CONFIGURATION =====
@@ -57,8 +59,10 @@ else:
 
 
 
-# Mischen
-beat_signal = proc.mix_signals(tx_signal, rx_total)
+# Mischen – Beat-Signal der Szene aus dem Disk-Cache (gleich
+# proc.mix_signals(tx_signal, rx_total); 'name' zählt nicht zum Schlüssel)
+scene = targets if multiple_targets else [{'range_m': target_range, 'rcs': 0.01}]
+beat_signal = simulate_scene(gen.profile, scene)[0]
 
 # Range-FFT
 freq_bins, range_bins, range_profile_db = proc.range_fft(
@@ -66,36 +70,38 @@ freq_bins, range_bins, range_profile_db = proc.range_fft(
     window='hann'
 )
 
-# Peak Detection
-peak_idxs = proc.detect_peaks(range_profile_db, snr_db=20, max_peaks=10)
+# Peak Detection → strukturierte Punktwolke (range_m, snr_db, power_db, ...)
+detections = proc.detect_points(range_bins, range_profile_db, snr_db=20, max_peaks=10)
+
+# Benachbarte Peaks (ausgedehnte Ziele) zu einer Messung pro Objekt zusammenfassen
+detections, _ = cluster_detections(detections, eps_range=2 * proc.profile.range_resolution)
 
 # Validierung
 if multiple_targets:
-    expected_ranges = [t['range_m'] for t in targets]
+    expected_ranges = np.array([t['range_m'] for t in targets], dtype=float)
 else:
-    expected_ranges = [target_range]
+    expected_ranges = np.array([target_range])
 
-detected_ranges = range_bins[peak_idxs]
+detected_ranges = detections['range_m']
+peak_idxs = detections['range_bin']
 
 print(f"\n{'='*60}")
 print("DETECTION RESULTS")
 print(f"{'='*60}")
-print(f"Expected Ranges: {expected_ranges}")
+print(f"Expected Ranges: {expected_ranges.tolist()}")
 print(f"Detected Ranges: {[f'{r:.1f}' for r in detected_ranges]}")
 
-# Matching (welcher Peak gehört zu welchem Target?)
-for exp in expected_ranges:
-    # Finde nächsten detektierten Peak
-    if len(detected_ranges) > 0:
-        distances = np.abs(detected_ranges - exp)
-        closest_idx = np.argmin(distances)
-        closest_range = detected_ranges[closest_idx]
-        error = abs(closest_range - exp)
-        
+# Matching (welcher Peak gehört zu welchem Target?) – vektorisiert
+if len(detections) > 0:
+    distances = np.abs(expected_ranges[:, None] - detected_ranges[None, :])
+    closest = detections[np.argmin(distances, axis=1)]
+    errors = np.min(distances, axis=1)
+
+    for exp, det, error in zip(expected_ranges, closest, errors):
         print(f"\nTarget @ {exp}m:")
-        print(f"  Detected: {closest_range:.1f}m")
+        print(f"  Detected: {det['range_m']:.1f}m  (SNR {det['snr_db']:.1f} dB)")
         print(f"  Error:    {error:.2f}m")
-        
+
         if error < 1.0:
             print(f"  ✅ MATCH")
         else:
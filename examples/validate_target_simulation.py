@@ -2,10 +2,10 @@ import numpy as np
 import matplotlib.pyplot as plt
 from python_prototype.waveform.chirp_generator import ChirpGenerator
 from python_prototype.signal_processing.range_fft import RangeProcessor
+from python_prototype.waveform.radar_profile import load_profile
 
-# Setup
-gen = ChirpGenerator(f_start=24e9, bandwidth=250e6, 
-                     chirp_duration=256e-6, sample_rate=1e6)
+# Setup (24 GHz, 250 MHz, 256 µs, 1 MHz)
+gen = ChirpGenerator.from_profile(load_profile('k24_short_range'), verbose=True)
 proc = RangeProcessor(gen)
 
 # Simuliere Target bei 50m
@@ -0,0 +1,308 @@
+# hardware_integration/batch_processing.py
+"""
+Headless Batch-Verarbeitung ganzer Aufnahme-Verzeichnisse.
+
+Jede Aufnahme (.npy oder Rohdaten, Frames (n_chirps, n_samples)) wird in
+Segmente von segment_frames Frames zerlegt; die Segmente laufen auf einem
+Prozess-Pool durch die Kette
+
+    [Interferenz] → Range-FFT → Doppler-FFT → CA-CFAR → Detektionen
+
+und werden inkrementell (blockweise) in je eine HDF5-Datei
+<stem>_<start>.h5 geschrieben (RadarH5Writer: range_profile, optional
+rd_map, detections). Fertige Segmente werden atomar umbenannt und im
+Journal checkpoint.jsonl vermerkt; ein abgebrochener Lauf setzt beim
+nächsten Aufruf ohne Doppelarbeit fort. Der Journal-Schlüssel enthält
+Pfad, Größe und Änderungszeit der Aufnahme sowie alle Einstellungen –
+geänderte Eingaben oder Parameter werden neu gerechnet.
+
+CLI:
+    fmcw-batch recordings/ --out results/ --profile k24_long_range --workers 16
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+from python_prototype.waveform.radar_profile import RadarProfile, load_profile
+
+CHECKPOINT_FILE = 'checkpoint.jsonl'
+
+
+@dataclass(frozen=True)
+class BatchOptions:
+    """Verarbeitungs-Einstellungen (gehen in den Checkpoint-Schlüssel ein)."""
+    threshold_db: float = 15.0
+    max_peaks: Optional[int] = 64
+    interference: Optional[str] = None
+    save_rd_map: bool = False
+    dtype: str = 'float64'            # nur für Rohdaten
+    frames_per_batch: int = 32        # Frames pro FFT-Aufruf und HDF5-Flush
+
+
+@dataclass
+class BatchStats:
+    """Ergebnis eines Batch-Laufs."""
+    segments_total: int = 0
+    segments_done: int = 0
+    segments_skipped: int = 0
+    frames: int = 0
+    detections: int = 0
+    bytes_in: int = 0
+    elapsed_s: float = 0.0
+    failed: List[str] = field(default_factory=list)
+
+    @property
+    def frames_per_s(self) -> float:
+        return self.frames / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    @property
+    def mb_per_s(self) -> float:
+        return self.bytes_in / 1e6 / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+
+def _job_key(path: str, start: int, stop: int, profile: RadarProfile,
+             options: BatchOptions) -> str:
+    st = os.stat(path)
+    payload = json.dumps({'path': os.path.abspath(path), 'size': st.st_size,
+                          'mtime_ns': st.st_mtime_ns, 'start': start, 'stop': stop,
+                          'profile': {k: v for k, v in profile.to_dict().items()
+                                      if k != 'name'},
+                          'options': asdict(options)}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def read_checkpoint(out_dir: str) -> Dict[str, dict]:
+    """Abgeschlossene Segmente aus dem Journal (Schlüssel → Eintrag)."""
+    path = os.path.join(out_dir, CHECKPOINT_FILE)
+    done = {}
+    if not os.path.exists(path):
+        return done
+    with open(path) as fh:
+        for line in fh:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue        # abgebrochene letzte Zeile
+            if os.path.exists(os.path.join(out_dir, entry['output'])):
+                done[entry['key']] = entry
+    return done
+
+
+def _append_checkpoint(fh, entry: dict) -> None:
+    fh.write(json.dumps(entry) + '\n')
+    fh.flush()
+    os.fsync(fh.fileno())
+
+
+def process_segment(path: str, start: int, stop: int, out_path: str,
+                    profile: RadarProfile, options: BatchOptions) -> dict:
+    """
+    Verarbeitet die Frames [start, stop) einer Aufnahme (läuft im Worker).
+
+    Die Ausgabe entsteht unter out_path + '.tmp' und wird erst nach dem
+    Schließen atomar umbenannt – halbe Dateien tragen nie den Zielnamen.
+    """
+    from hardware_integration.capture import open_recording
+    from python_prototype.detection.cfar_kernels import cfar_noise_db, cfar_peaks_2d
+    from python_prototype.detection.point_cloud import DETECTION_DTYPE, detections_from_rd_map
+    from python_prototype.signal_processing.doppler import range_doppler_map
+    from python_prototype.signal_processing.interference import InterferenceMitigator
+    from python_prototype.utils.hdf5_storage import RadarH5Writer
+
+    t0 = time.perf_counter()
+    frame_shape = (profile.n_chirps, profile.n_samples)
+    frames = open_recording(path, frame_shape, options.dtype)[start:stop]
+    mitigator = (InterferenceMitigator(method=options.interference)
+                 if options.interference else None)
+    frame_period = profile.n_chirps * profile.chirp_duration
+
+    shapes = {'range_profile': (profile.n_range_bins,)}
+    if options.save_rd_map:
+        shapes['rd_map'] = (profile.n_chirps, profile.n_range_bins)
+    tmp_path = out_path + '.tmp'
+    n_detections = 0
+    with RadarH5Writer(tmp_path, frame_shapes=shapes,
+                       record_dtypes={'detections': DETECTION_DTYPE},
+                       chirp_generator=profile, swmr=False,
+                       metadata={'source': os.path.abspath(path), 'first_frame': start}) as writer:
+        for b in range(0, len(frames), options.frames_per_batch):
+            block = np.asarray(frames[b:b + options.frames_per_batch], dtype=np.float64)
+            if mitigator is not None:
+                block = mitigator.apply(block)
+            rd_db = range_doppler_map(block, profile, profile.window)
+            # Leistungsmittel über alle Doppler-Bins = nichtkohärente Integration
+            power = 10 ** (rd_db / 10)
+            range_db = 10 * np.log10(power.mean(axis=-2))
+
+            frame_idx = start + b + np.arange(len(block))
+            detections = []
+            for i, k in enumerate(frame_idx):
+                rows, cols, _ = cfar_peaks_2d(rd_db[i], threshold_db=options.threshold_db,
+                                              max_peaks=options.max_peaks)
+                # SNR gegen dieselbe lokale CA-CFAR-Schätzung, die detektiert hat
+                detections.append(detections_from_rd_map(
+                    rows, cols, rd_db[i], profile.range_axis, profile.velocity_axis,
+                    cfar_noise_db(rd_db[i], rows, cols), frame=k,
+                    timestamp=k * frame_period))
+            n_detections += sum(len(d) for d in detections)
+
+            # Ein Resize/Flush pro Block statt pro Frame
+            data = {'range_profile': range_db, 'detections': detections}
+            if options.save_rd_map:
+                data['rd_map'] = rd_db
+            writer.write_frames(frame_idx * frame_period, **data)
+    os.replace(tmp_path, out_path)
+
+    return {'frames': len(frames), 'detections': n_detections,
+            'bytes_in': int(frames.nbytes), 'seconds': time.perf_counter() - t0}
+
+
+def plan_jobs(paths: Sequence[str], profile: RadarProfile,
+              options: BatchOptions, segment_frames: int = 512) -> List[dict]:
+    """Zerlegt alle Aufnahmen in Segment-Aufträge (Pfad, Frames, Ausgabe, Schlüssel)."""
+    from hardware_integration.capture import open_recording
+
+    frame_shape = (profile.n_chirps, profile.n_samples)
+    jobs = []
+    for path in paths:
+        n_frames = len(open_recording(path, frame_shape, options.dtype))
+        stem = os.path.splitext(os.path.basename(path))[0]
+        for start in range(0, n_frames, segment_frames):
+            stop = min(start + segment_frames, n_frames)
+            jobs.append({'path': path, 'start': start, 'stop': stop,
+                         'output': f"{stem}_{start:08d}.h5",
+                         'key': _job_key(path, start, stop, profile, options)})
+    return jobs
+
+
+def run_batch(paths: Sequence[str], out_dir: str, profile: RadarProfile,
+              options: BatchOptions = BatchOptions(), segment_frames: int = 512,
+              n_workers: Optional[int] = None, resume: bool = True,
+              log=None) -> BatchStats:
+    """
+    Verarbeitet alle Aufnahmen parallel mit Checkpointing.
+
+    Args:
+        paths: Aufnahmen (.npy oder Rohdaten mit options.dtype)
+        out_dir: Ausgabeverzeichnis (HDF5-Segmente + checkpoint.jsonl)
+        profile: Radar-Konfiguration (Frame = n_chirps × n_samples)
+        options: Verarbeitungs-Einstellungen
+        segment_frames: Frames pro Auftrag / Ausgabedatei
+        n_workers: Prozesse (None = os.cpu_count(), 1 = ohne Pool)
+        resume: Fertige Segmente aus dem Journal überspringen
+        log: Datei-Objekt für Fortschrittsmeldungen (None = still)
+
+    Returns:
+        BatchStats (Durchsatz nur über die in diesem Lauf gerechneten Segmente)
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = plan_jobs(paths, profile, options, segment_frames)
+    done = read_checkpoint(out_dir) if resume else {}
+    todo = [job for job in jobs if job['key'] not in done]
+    stats = BatchStats(segments_total=len(jobs), segments_skipped=len(jobs) - len(todo))
+
+    def report(job, result):
+        stats.segments_done += 1
+        stats.frames += result['frames']
+        stats.detections += result['detections']
+        stats.bytes_in += result['bytes_in']
+        stats.elapsed_s = time.perf_counter() - t0
+        _append_checkpoint(journal, dict(job, **result))
+        if log is not None:
+            n = stats.segments_done + stats.segments_skipped
+            print(f"[{n}/{stats.segments_total}] {job['output']}: "
+                  f"{result['frames']} Frames, {result['detections']} Detektionen "
+                  f"| gesamt {stats.frames_per_s:.1f} Frames/s, "
+                  f"{stats.mb_per_s:.1f} MB/s", file=log, flush=True)
+
+    def failed(job, exc):
+        stats.failed.append(job['output'])
+        if log is not None:
+            print(f"FEHLER {job['output']}: {exc}", file=log, flush=True)
+
+    def args_of(job):
+        return (job['path'], job['start'], job['stop'],
+                os.path.join(out_dir, job['output']), profile, options)
+
+    t0 = time.perf_counter()
+    n_workers = n_workers or os.cpu_count() or 1
+    with open(os.path.join(out_dir, CHECKPOINT_FILE), 'a') as journal:
+        if n_workers == 1 or len(todo) <= 1:
+            for job in todo:
+                try:
+                    result = process_segment(*args_of(job))
+                except Exception as exc:
+                    failed(job, exc)
+                else:
+                    report(job, result)
+        else:
+            # spawn: Worker erben keine Threads (Numba, asyncio) des Elternprozesses
+            ctx = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=min(n_workers, len(todo)),
+                                     mp_context=ctx) as pool:
+                futures = {pool.submit(process_segment, *args_of(job)): job
+                           for job in todo}
+                for future in as_completed(futures):
+                    job = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as exc:
+                        failed(job, exc)
+                    else:
+                        report(job, result)
+
+    stats.elapsed_s = time.perf_counter() - t0
+    return stats
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Batch-Verarbeitung von FMCW-Aufnahmen (Range/Doppler/CFAR → HDF5)")
+    parser.add_argument('input', help="Verzeichnis mit Aufnahmen")
+    parser.add_argument('--out', required=True, help="Ausgabeverzeichnis")
+    parser.add_argument('--profile', default='k24_short_range',
+                        help="Profilname oder Pfad zu einer YAML-Datei")
+    parser.add_argument('--pattern', default='*.npy', help="Glob-Muster der Aufnahmen")
+    parser.add_argument('--dtype', default='float64', help="Datentyp von Rohdaten")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--segment-frames', type=int, default=512)
+    parser.add_argument('--threshold-db', type=float, default=15.0)
+    parser.add_argument('--max-peaks', type=int, default=64)
+    parser.add_argument('--interference', choices=('zero', 'taper', 'interpolate'),
+                        help="Interferenz-Unterdrückung vor der Range-FFT")
+    parser.add_argument('--save-rd-map', action='store_true')
+    parser.add_argument('--no-resume', action='store_true',
+                        help="Checkpoint ignorieren und alles neu rechnen")
+    args = parser.parse_args(argv)
+
+    paths = sorted(glob.glob(os.path.join(args.input, args.pattern)))
+    if not paths:
+        print(f"Keine Aufnahmen ({args.pattern}) in {args.input}", file=sys.stderr)
+        return 1
+
+    options = BatchOptions(threshold_db=args.threshold_db, max_peaks=args.max_peaks,
+                           interference=args.interference,
+                           save_rd_map=args.save_rd_map, dtype=args.dtype)
+    stats = run_batch(paths, args.out, load_profile(args.profile), options,
+                      segment_frames=args.segment_frames, n_workers=args.workers,
+                      resume=not args.no_resume, log=sys.stdout)
+
+    print(f"{stats.segments_done} Segmente gerechnet, {stats.segments_skipped} übersprungen, "
+          f"{len(stats.failed)} fehlgeschlagen | {stats.frames} Frames in "
+          f"{stats.elapsed_s:.1f} s ({stats.frames_per_s:.1f} Frames/s, "
+          f"{stats.mb_per_s:.1f} MB/s)")
+    return 1 if stats.failed else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
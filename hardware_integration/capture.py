@@ -0,0 +1,173 @@
+# hardware_integration/capture.py
+
+import asyncio
+import time
+import numpy as np
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from python_prototype.signal_processing.range_fft import RangeProcessor
+
+
+def open_recording(path: str, block_shape: Tuple[int, ...],
+                   dtype=np.float64) -> np.ndarray:
+    """
+    Bindet eine Aufnahme als Block-Array (n_blocks, *block_shape) ein.
+
+    .npy-Dateien werden per Memory-Map geladen, rohe Binärdateien (z.B.
+    HackRF-Captures) per np.memmap mit dtype. Ein unvollständiger Block am
+    Dateiende wird ignoriert; die Datei wird nie komplett gelesen.
+    """
+    if str(path).endswith('.npy'):
+        data = np.load(path, mmap_mode='r')
+    else:
+        data = np.memmap(path, dtype=dtype, mode='r')
+
+    block_shape = tuple(int(s) for s in block_shape)
+    block_size = int(np.prod(block_shape))
+    n_blocks = data.size // block_size
+    if n_blocks == 0:
+        raise ValueError(f"Recording {path} is shorter than one block "
+                         f"of shape {block_shape}")
+    # Flache View auf ganze Blöcke (Rest am Dateiende wird ignoriert)
+    return data.reshape(-1)[:n_blocks * block_size].reshape((n_blocks,) + block_shape)
+
+
+class SampleSource:
+    """
+    Basisklasse für Sample-Quellen der Echtzeit-Akquisition.
+
+    Eine Quelle liefert Blöcke fester Form (block_shape) asynchron über
+    blocks(). Mit realtime=True wird im Takt von block_period geliefert,
+    so wie ein SDR-Gerät (z.B. HackRF) die Daten anliefern würde.
+
+    Hinweis: Der gelieferte Block ist nur bis zum nächsten Schritt des
+    Iterators gültig (Quellen dürfen ihren Ausgabepuffer wiederverwenden).
+    """
+
+    def __init__(self, block_shape: Tuple[int, ...], dtype=np.float64,
+                 block_period: float = 0.0, realtime: bool = True):
+        self.block_shape = tuple(int(s) for s in block_shape)
+        self.dtype = np.dtype(dtype)
+        self.block_period = float(block_period)
+        self.realtime = realtime
+
+    async def blocks(self) -> AsyncIterator[np.ndarray]:
+        raise NotImplementedError
+        yield  # pragma: no cover
+
+    async def _pace(self, t0: float, k: int) -> None:
+        """Wartet bis zum Soll-Zeitpunkt des k-ten Blocks (absoluter Takt)."""
+        if self.realtime and self.block_period > 0:
+            delay = t0 + k * self.block_period - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                return
+        # Event-Loop trotzdem kurz freigeben
+        await asyncio.sleep(0)
+
+    def close(self) -> None:
+        pass
+
+
+class FileReplaySource(SampleSource):
+    """
+    Spielt eine Aufnahme blockweise ab.
+
+    Unterstützt .npy-Dateien (per Memory-Map geladen) und rohe Binärdateien
+    (z.B. HackRF-Captures), die per np.memmap eingebunden werden. Die Datei
+    wird nie komplett in den RAM gelesen.
+    """
+
+    def __init__(self, path: str, block_shape: Tuple[int, ...],
+                 dtype=np.float64, sample_rate: Optional[float] = None,
+                 realtime: bool = True, loop: bool = False):
+        """
+        Args:
+            path: Pfad zur Aufnahme (.npy oder Rohdaten)
+            block_shape: Form eines Blocks, z.B. (n_chirps, n_samples)
+            dtype: Datentyp (nur für Rohdaten relevant)
+            sample_rate: Abtastrate [Hz] für den Echtzeit-Takt
+            realtime: Im Takt der Abtastrate abspielen
+            loop: Aufnahme endlos wiederholen
+        """
+        blocks = open_recording(path, block_shape, dtype)
+        block_shape = blocks.shape[1:]
+        block_size = int(np.prod(block_shape))
+        block_period = block_size / sample_rate if sample_rate else 0.0
+        super().__init__(block_shape, blocks.dtype, block_period, realtime)
+
+        self._data = blocks
+        self.n_blocks = len(blocks)
+        self.loop = loop
+
+    async def blocks(self) -> AsyncIterator[np.ndarray]:
+        t0 = time.perf_counter()
+        k = 0
+        while True:
+            for i in range(self.n_blocks):
+                await self._pace(t0, k)
+                yield self._data[i]
+                k += 1
+            if not self.loop:
+                return
+
+    def close(self) -> None:
+        self._data = None
+
+
+class SimulatedSource(SampleSource):
+    """
+    Simulierter Geräte-Ersatz: liefert Beat-Frames (n_chirps, n_samples).
+
+    Die Echos der (statischen) Targets werden einmal berechnet; pro Block
+    wird nur neues Rauschen addiert. Der Takt entspricht n_chirps Chirps.
+    """
+
+    def __init__(self, processor: RangeProcessor,
+                 targets: List[Dict[str, float]],
+                 n_chirps: int = 16, noise_std: float = 0.0,
+                 n_blocks: Optional[int] = None, seed: Optional[int] = None,
+                 realtime: bool = True):
+        """
+        Args:
+            processor: RangeProcessor für simulate_target / mix_signals
+            targets: Liste von Dicts mit 'range_m' und optional 'rcs'
+            n_chirps: Chirps pro Block
+            noise_std: Standardabweichung des additiven Rauschens
+            n_blocks: Anzahl Blöcke (None = endlos)
+            seed: Seed für den Zufallsgenerator
+            realtime: Im Takt der Chirp-Dauer liefern
+        """
+        n_samples = processor.n_samples
+        super().__init__((n_chirps, n_samples), np.float64,
+                         n_chirps * processor.chirp_duration, realtime)
+
+        rx_total = np.zeros(n_samples)
+        tx = None
+        for target in targets:
+            _, tx, rx = processor.simulate_target(
+                range_m=target['range_m'], rcs=target.get('rcs', 1.0))
+            rx_total += rx
+        if tx is None:
+            _, tx, _ = processor.chirp_gen.generate_chirp()
+
+        self._clean = np.broadcast_to(processor.mix_signals(tx, rx_total),
+                                      self.block_shape)
+        self._out = np.empty(self.block_shape)
+        self._rng = np.random.default_rng(seed)
+        self.noise_std = noise_std
+        self.n_blocks = n_blocks
+
+    async def blocks(self) -> AsyncIterator[np.ndarray]:
+        t0 = time.perf_counter()
+        k = 0
+        while self.n_blocks is None or k < self.n_blocks:
+            await self._pace(t0, k)
+            if self.noise_std > 0:
+                self._rng.standard_normal(out=self._out)
+                self._out *= self.noise_std
+                self._out += self._clean
+            else:
+                self._out[...] = self._clean
+            yield self._out
+            k += 1
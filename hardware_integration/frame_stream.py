@@ -0,0 +1,401 @@
+# hardware_integration/frame_stream.py
+"""
+Frame-Streaming zwischen Knoten (TCP oder Unix-Socket).
+
+Protokoll (little endian):
+
+    Stream-Header (einmal pro Verbindung):
+        b'FMCW' | version u16 | länge u32 | JSON
+        JSON = {"profile": RadarProfile.to_dict(), "dtype": "<f8",
+                "frame_shape": [n_chirps, n_samples]}
+
+    Pro Frame:
+        b'FRME' | seq u64 | timestamp f64 | nbytes u32 | rohe Samples
+
+Der Empfänger allokiert anhand des Stream-Headers einmalig einen Ring
+von Frame-Puffern und liest die Nutzdaten per recv_into direkt hinein –
+keine Kopie und keine Allokation pro Frame.
+
+FrameStreamServer spielt eine beliebige SampleSource (FileReplaySource,
+SimulatedSource) im Echtzeit-Takt an jeden verbundenen Client ab; damit
+lassen sich Mehrknoten-Setups auf einem Rechner testen.
+"""
+
+import asyncio
+import json
+import os
+import socket
+import struct
+import time
+import numpy as np
+from typing import AsyncIterator, Callable, Optional, Tuple, Union
+
+from python_prototype.waveform.radar_profile import RadarProfile
+from hardware_integration.capture import SampleSource
+
+MAGIC = b'FMCW'
+FRAME_MAGIC = b'FRME'
+PROTOCOL_VERSION = 1
+_STREAM_HEADER = struct.Struct('<4sHI')
+_FRAME_HEADER = struct.Struct('<4sQdI')
+
+Address = Union[Tuple[str, int], str]
+
+
+def encode_stream_header(profile: RadarProfile, frame_shape, dtype) -> bytes:
+    meta = json.dumps({'profile': profile.to_dict(),
+                       'dtype': np.dtype(dtype).str,
+                       'frame_shape': [int(s) for s in frame_shape]}).encode()
+    return _STREAM_HEADER.pack(MAGIC, PROTOCOL_VERSION, len(meta)) + meta
+
+
+def _decode_stream_meta(meta: bytes):
+    info = json.loads(meta.decode())
+    return (RadarProfile.from_dict(info['profile']), tuple(info['frame_shape']),
+            np.dtype(info['dtype']))
+
+
+def _check_stream_header(header: bytes) -> int:
+    magic, version, length = _STREAM_HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ConnectionError(f"Not an FMCW frame stream (magic {magic!r})")
+    if version != PROTOCOL_VERSION:
+        raise ConnectionError(f"Unsupported protocol version {version} "
+                              f"(expected {PROTOCOL_VERSION})")
+    return length
+
+
+def _check_frame_header(header, frame_nbytes: int) -> Tuple[int, float]:
+    magic, seq, timestamp, nbytes = _FRAME_HEADER.unpack(header)
+    if magic != FRAME_MAGIC:
+        raise ConnectionError(f"Corrupt frame header (magic {magic!r})")
+    if nbytes != frame_nbytes:
+        raise ConnectionError(f"Frame payload is {nbytes} bytes, expected {frame_nbytes}")
+    return seq, timestamp
+
+
+def _new_socket(address: Address) -> socket.socket:
+    if isinstance(address, str):
+        return socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+
+def _connect(address: Address) -> socket.socket:
+    sock = _new_socket(address)
+    try:
+        sock.connect(address)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def _recv_exact_into(sock: socket.socket, view: memoryview) -> bool:
+    """Füllt view vollständig; False bei sauberem Verbindungsende vor dem ersten Byte."""
+    got = 0
+    while got < len(view):
+        n = sock.recv_into(view[got:])
+        if n == 0:
+            if got == 0:
+                return False
+            raise ConnectionError("Connection closed in the middle of a message")
+        got += n
+    return True
+
+
+# ===== SERVER =====
+
+class FrameStreamServer:
+    """
+    Streamt Frames einer SampleSource an verbundene Clients.
+
+    Jede Verbindung erhält eine eigene Quelle aus source_factory (eine
+    Aufnahme wird also pro Client von vorne abgespielt). Den Takt gibt
+    die Quelle vor (realtime=True → Echtzeit).
+
+    Beispiel:
+        server = FrameStreamServer(
+            lambda: FileReplaySource('capture.npy', (64, 2560), sample_rate=10e6),
+            profile, port=5555)
+        asyncio.run(server.serve_forever())
+    """
+
+    def __init__(self, source_factory: Callable[[], SampleSource],
+                 profile: RadarProfile, host: str = '127.0.0.1', port: int = 0,
+                 path: Optional[str] = None):
+        """
+        Args:
+            source_factory: Erzeugt pro Verbindung eine neue SampleSource
+            profile: Radar-Konfiguration (wird im Stream-Header übertragen)
+            host, port: TCP-Adresse (port=0 → freien Port wählen)
+            path: Pfad eines Unix-Sockets (statt TCP)
+        """
+        self.source_factory = source_factory
+        self.profile = profile
+        self.host, self.port, self.path = host, port, path
+        self.frames_sent = 0
+        self._server = None
+
+    @property
+    def address(self) -> Address:
+        """Adresse für FrameStreamClient (nach start())."""
+        if self.path is not None:
+            return self.path
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def start(self) -> None:
+        if self.path is not None:
+            self._server = await asyncio.start_unix_server(self._handle, self.path)
+        else:
+            self._server = await asyncio.start_server(self._handle, self.host, self.port)
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        # Unix-Socket-Datei entfernen, sonst scheitert ein erneutes start()
+        # auf demselben Pfad mit EADDRINUSE
+        if self.path is not None:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+
+    async def _handle(self, reader: asyncio.StreamReader,
+                      writer: asyncio.StreamWriter) -> None:
+        source = self.source_factory()
+        sock = writer.get_extra_info('socket')
+        if sock is not None and sock.family != socket.AF_UNIX:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # drain() erst zurück, wenn der Sendepuffer leer ist: der Transport
+        # hält nur eine Referenz auf den Block, den die Quelle wiederverwendet
+        writer.transport.set_write_buffer_limits(high=0)
+        try:
+            writer.write(encode_stream_header(self.profile, source.block_shape,
+                                              source.dtype))
+            nbytes = int(np.prod(source.block_shape)) * source.dtype.itemsize
+            seq = 0
+            async for block in source.blocks():
+                writer.write(_FRAME_HEADER.pack(FRAME_MAGIC, seq, time.time(), nbytes))
+                # Buffer-Protokoll: bei C-zusammenhängenden Blöcken ohne Kopie
+                writer.write(memoryview(np.ascontiguousarray(block)).cast('B'))
+                await writer.drain()
+                seq += 1
+                self.frames_sent += 1
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            source.close()
+            writer.close()
+
+
+# ===== CLIENT =====
+
+class FrameStreamClient:
+    """
+    Blockierender Empfänger für einen Frame-Stream.
+
+    Die Frames landen per recv_into in einem vorallokierten Ring aus
+    n_buffers Puffern. Ein zurückgegebener Frame bleibt gültig, bis
+    n_buffers weitere Frames empfangen wurden.
+    """
+
+    def __init__(self, address: Address, n_buffers: int = 4,
+                 timeout: Optional[float] = None):
+        """
+        Args:
+            address: (host, port) für TCP oder Pfad eines Unix-Sockets
+            n_buffers: Anzahl Frame-Puffer im Ring
+            timeout: Socket-Timeout [s] (None = blockierend)
+        """
+        self._sock = _connect(address)
+        self._sock.settimeout(timeout)
+
+        header = bytearray(_STREAM_HEADER.size)
+        if not _recv_exact_into(self._sock, memoryview(header)):
+            raise ConnectionError("Connection closed before stream header")
+        meta = bytearray(_check_stream_header(header))
+        if not _recv_exact_into(self._sock, memoryview(meta)):
+            raise ConnectionError("Connection closed before stream header")
+        self.profile, self.frame_shape, self.dtype = _decode_stream_meta(meta)
+
+        self._buffers = np.empty((n_buffers,) + self.frame_shape, dtype=self.dtype)
+        self._views = [memoryview(b).cast('B') for b in self._buffers]
+        self._frame_header = bytearray(_FRAME_HEADER.size)
+        self._frame_header_view = memoryview(self._frame_header)
+        self._next = 0
+        self.frames_received = 0
+
+    @property
+    def frame_nbytes(self) -> int:
+        return self._buffers[0].nbytes
+
+    def recv_frame(self) -> Optional[Tuple[np.ndarray, int, float]]:
+        """
+        Empfängt den nächsten Frame.
+
+        Returns:
+            (frame, seq, timestamp) oder None am Stream-Ende
+        """
+        if not _recv_exact_into(self._sock, self._frame_header_view):
+            return None
+        seq, timestamp = _check_frame_header(self._frame_header, self.frame_nbytes)
+
+        k = self._next
+        if not _recv_exact_into(self._sock, self._views[k]):
+            raise ConnectionError("Connection closed before frame payload")
+        self._next = (k + 1) % len(self._buffers)
+        self.frames_received += 1
+        return self._buffers[k], seq, timestamp
+
+    def __iter__(self):
+        while True:
+            frame = self.recv_frame()
+            if frame is None:
+                return
+            yield frame
+
+    def close(self) -> None:
+        self._sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class StreamSource(SampleSource):
+    """
+    SampleSource über einen Frame-Stream (für RealtimeRangePipeline).
+
+    Liest asynchron per loop.sock_recv_into in einen einzigen
+    vorallokierten Puffer; der Block ist – wie bei allen Quellen – nur
+    bis zum nächsten Iterator-Schritt gültig. Den Takt bestimmt der Server.
+    """
+
+    def __init__(self, address: Address, profile: RadarProfile,
+                 frame_shape: Tuple[int, ...], dtype=np.float64):
+        """
+        Args:
+            address: Server-Adresse
+            profile, frame_shape, dtype: Erwartetes Format (wird gegen den
+                Stream-Header geprüft, z.B. aus FrameStreamClient.profile)
+        """
+        n_chirps = frame_shape[0] if len(frame_shape) > 1 else 1
+        super().__init__(frame_shape, dtype, n_chirps * profile.chirp_duration,
+                         realtime=False)
+        self.address = address
+        self.profile = profile
+        self._buffer = np.empty(self.block_shape, dtype=self.dtype)
+
+    async def _recv_exact_into(self, loop, sock, view: memoryview) -> bool:
+        got = 0
+        while got < len(view):
+            n = await loop.sock_recv_into(sock, view[got:])
+            if n == 0:
+                if got == 0:
+                    return False
+                raise ConnectionError("Connection closed in the middle of a message")
+            got += n
+        return True
+
+    async def blocks(self) -> AsyncIterator[np.ndarray]:
+        loop = asyncio.get_running_loop()
+        sock = _new_socket(self.address)
+        sock.setblocking(False)
+        try:
+            # Verbindungsaufbau ohne die Event-Loop (Akquisition) zu blockieren
+            await loop.sock_connect(sock, self.address)
+            header = bytearray(_STREAM_HEADER.size)
+            if not await self._recv_exact_into(loop, sock, memoryview(header)):
+                return
+            meta = bytearray(_check_stream_header(header))
+            await self._recv_exact_into(loop, sock, memoryview(meta))
+            profile, frame_shape, dtype = _decode_stream_meta(meta)
+            if (profile, frame_shape, dtype) != (self.profile, self.block_shape, self.dtype):
+                raise ValueError(f"Stream format {profile}, {frame_shape}, {dtype} does not "
+                                 f"match the expected {self.profile}, {self.block_shape}, "
+                                 f"{self.dtype}")
+
+            frame_header = bytearray(_FRAME_HEADER.size)
+            header_view = memoryview(frame_header)
+            payload = memoryview(self._buffer).cast('B')
+            while await self._recv_exact_into(loop, sock, header_view):
+                _check_frame_header(frame_header, len(payload))
+                if not await self._recv_exact_into(loop, sock, payload):
+                    raise ConnectionError("Connection closed before frame payload")
+                yield self._buffer
+        finally:
+            sock.close()
+
+
+# ===== REPLAY-SERVER (CLI) =====
+
+def main(argv=None) -> int:
+    """
+    Replay-Server, z.B.:
+        python -m hardware_integration.frame_stream --profile k24_short_range \\
+            --targets 20 45 --port 5555
+        python -m hardware_integration.frame_stream --profile k24_long_range \\
+            --file capture.npy --unix /tmp/fmcw.sock
+    """
+    import argparse
+    from python_prototype.waveform.radar_profile import load_profile
+    from python_prototype.signal_processing.range_fft import RangeProcessor
+    from hardware_integration.capture import FileReplaySource, SimulatedSource
+
+    parser = argparse.ArgumentParser(description="FMCW Frame-Stream Replay-Server")
+    parser.add_argument('--profile', default='k24_short_range')
+    parser.add_argument('--file', help="Aufnahme (.npy/Rohdaten); sonst Simulation")
+    parser.add_argument('--targets', type=float, nargs='*', default=[20.0, 45.0],
+                        help="Simulierte Ziel-Entfernungen [m]")
+    parser.add_argument('--noise', type=float, default=0.0)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5555)
+    parser.add_argument('--unix', metavar='PATH', help="Unix-Socket statt TCP")
+    parser.add_argument('--no-realtime', action='store_true',
+                        help="So schnell wie möglich statt im Echtzeit-Takt")
+    args = parser.parse_args(argv)
+
+    profile = load_profile(args.profile)
+    realtime = not args.no_realtime
+    frame_shape = (profile.n_chirps, profile.n_samples)
+
+    if args.file:
+        def factory():
+            return FileReplaySource(args.file, frame_shape,
+                                    sample_rate=profile.sample_rate, realtime=realtime)
+    else:
+        processor = RangeProcessor.from_profile(profile)
+        targets = [{'range_m': r} for r in args.targets]
+
+        def factory():
+            return SimulatedSource(processor, targets, n_chirps=profile.n_chirps,
+                                   noise_std=args.noise, realtime=realtime)
+
+    server = FrameStreamServer(factory, profile, args.host, args.port, args.unix)
+
+    async def run():
+        await server.start()
+        print(f"Streaming '{args.profile}' frames {frame_shape} on {server.address}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
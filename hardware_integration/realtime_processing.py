@@ -0,0 +1,221 @@
+# hardware_integration/realtime_processing.py
+
+import asyncio
+import multiprocessing as mp
+import threading
+import time
+import numpy as np
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from python_prototype.signal_processing.range_fft import RangeProcessor
+from python_prototype.utils.ring_buffer import BlockRingBuffer
+from hardware_integration.capture import SampleSource
+
+
+@dataclass
+class PipelineStats:
+    """Laufzeit-Statistik der Echtzeit-Pipeline."""
+    blocks_received: int = 0
+    blocks_processed: int = 0
+    blocks_dropped: int = 0
+    latency_mean_s: float = 0.0
+    latency_p95_s: float = 0.0
+    latency_max_s: float = 0.0
+    processing_mean_s: float = 0.0
+    callback_mean_s: float = 0.0
+    block_period_s: float = 0.0
+
+    @property
+    def keeps_up(self) -> bool:
+        """True, wenn kein Block verworfen wurde und die Verarbeitung
+        im Mittel (inkl. on_result) schneller als die Blockperiode ist."""
+        if self.blocks_dropped > 0:
+            return False
+        if self.block_period_s <= 0:
+            return True
+        return self.processing_mean_s + self.callback_mean_s < self.block_period_s
+
+
+# Layout der geteilten Statistik (float64): Zähler + Latenz-Historie
+_ST_PROCESSED = 0
+_ST_PROC_SUM = 1
+_ST_CALLBACK_SUM = 2
+_ST_HEADER = 3
+
+
+def _process_block(proc: RangeProcessor, block: np.ndarray, window: str):
+    """Range-Pipeline für einen Block (n_chirps, n_samples)."""
+    return proc.range_fft(block, window=window)
+
+
+def _consume(ring: BlockRingBuffer, proc: RangeProcessor, window: str,
+             stats: np.ndarray, stop: Callable[[], bool],
+             on_result: Optional[Callable] = None,
+             idle_sleep: float = 1e-4) -> None:
+    """
+    Consumer-Schleife (Thread oder Prozess).
+
+    Liest Blöcke ohne Kopie aus dem Ringpuffer, verarbeitet sie und trägt
+    Latenz (Akquisition → Rückkehr aus on_result) in stats ein. Verarbeitungs-
+    und Callback-Zeit werden getrennt aufsummiert.
+    """
+    n_hist = len(stats) - _ST_HEADER
+    while True:
+        item = ring.peek()
+        if item is None:
+            if stop():
+                return
+            time.sleep(idle_sleep)
+            continue
+
+        block, stamp, seq = item
+        t_start = time.perf_counter()
+        result = _process_block(proc, block, window)
+        t_processed = time.perf_counter()
+        ring.release()
+
+        if on_result is not None:
+            on_result(seq, result)
+        t_end = time.perf_counter()
+
+        k = int(stats[_ST_PROCESSED])
+        stats[_ST_HEADER + k % n_hist] = t_end - stamp
+        stats[_ST_PROC_SUM] += t_processed - t_start
+        stats[_ST_CALLBACK_SUM] += t_end - t_processed
+        stats[_ST_PROCESSED] = k + 1
+
+
+def _process_worker(shm_name, n_slots, block_shape, dtype, profile, interference,
+                    window, stats_shared, stop_event):
+    """Einstiegspunkt des Consumer-Prozesses."""
+    ring = BlockRingBuffer.attach(shm_name, n_slots, block_shape, dtype)
+    proc = RangeProcessor.from_profile(profile)
+    proc.interference = interference
+    stats = np.frombuffer(stats_shared.get_obj(), dtype=np.float64)
+    try:
+        _consume(ring, proc, window, stats, stop_event.is_set)
+    finally:
+        ring.close()
+
+
+class RealtimeRangePipeline:
+    """
+    Asyncio-basierte Echtzeit-Akquisition mit Range-Verarbeitung.
+
+    Der asyncio-Task liest Blöcke aus einer SampleSource und legt sie in
+    einen lock-freien Ringpuffer. Ein Verarbeitungs-Thread (mode='thread')
+    oder -Prozess (mode='process') entnimmt die Blöcke und führt die
+    Range-FFT aus. Ist der Puffer voll, wird der Block verworfen und
+    gezählt – die Akquisition blockiert nie.
+    """
+
+    def __init__(self, source: SampleSource, processor: RangeProcessor,
+                 n_slots: int = 32, mode: str = 'thread',
+                 window: str = 'hann',
+                 on_result: Optional[Callable] = None,
+                 latency_history: int = 4096):
+        """
+        Args:
+            source: Sample-Quelle (Datei-Replay oder Simulation)
+            processor: RangeProcessor mit passenden Radar-Parametern (im
+                       Prozess-Modus werden Profil und Interferenz-Stufe
+                       übernommen)
+            n_slots: Kapazität des Ringpuffers in Blöcken
+            mode: 'thread' oder 'process'
+            window: Fenster-Typ für die Range-FFT
+            on_result: Callback(seq, (freq, range_bins, profile_db)),
+                       nur im Thread-Modus
+            latency_history: Anzahl gespeicherter Latenz-Werte
+        """
+        if mode not in ('thread', 'process'):
+            raise ValueError(f"Unknown mode '{mode}' (use 'thread' or 'process')")
+        if mode == 'process' and on_result is not None:
+            raise ValueError("on_result is only supported in thread mode")
+
+        self.source = source
+        self.processor = processor
+        self.n_slots = n_slots
+        self.mode = mode
+        self.window = window
+        self.on_result = on_result
+        self.latency_history = latency_history
+
+        self.blocks_received = 0
+        self.blocks_dropped = 0
+        self._stats = None
+
+    async def run(self, max_blocks: Optional[int] = None) -> PipelineStats:
+        """
+        Startet Akquisition und Verarbeitung, bis die Quelle endet oder
+        max_blocks Blöcke empfangen wurden.
+
+        Returns:
+            PipelineStats nach Abarbeitung aller gepufferten Blöcke
+        """
+        shared = self.mode == 'process'
+        ring = BlockRingBuffer(self.n_slots, self.source.block_shape,
+                               self.source.dtype, shared=shared)
+        self.blocks_received = 0
+        self.blocks_dropped = 0
+
+        n_stats = _ST_HEADER + self.latency_history
+        if shared:
+            # spawn: Worker erben keine Threads/JIT-Zustände (Numba, asyncio)
+            # des Elternprozesses – fork danach kann beim Beenden hängen
+            ctx = mp.get_context('spawn')
+            stats_shared = ctx.Array('d', n_stats)
+            self._stats = np.frombuffer(stats_shared.get_obj(), dtype=np.float64)
+            stop_event = ctx.Event()
+            worker = ctx.Process(
+                target=_process_worker,
+                args=(ring.name, self.n_slots, self.source.block_shape,
+                      self.source.dtype, self.processor.profile,
+                      self.processor.interference, self.window,
+                      stats_shared, stop_event),
+                daemon=True)
+        else:
+            self._stats = np.zeros(n_stats)
+            stop_event = threading.Event()
+            worker = threading.Thread(
+                target=_consume,
+                args=(ring, self.processor, self.window, self._stats,
+                      stop_event.is_set, self.on_result),
+                daemon=True)
+
+        worker.start()
+        try:
+            async for block in self.source.blocks():
+                stamp = time.perf_counter()
+                if not ring.try_push(block, stamp, self.blocks_received):
+                    self.blocks_dropped += 1
+                self.blocks_received += 1
+                if max_blocks is not None and self.blocks_received >= max_blocks:
+                    break
+        finally:
+            stop_event.set()
+            # join() blockiert – im Executor, damit der Event-Loop frei bleibt
+            await asyncio.get_running_loop().run_in_executor(None, worker.join)
+            ring.close()
+
+        return self.stats()
+
+    def stats(self) -> PipelineStats:
+        """Aktuelle Statistik (auch während des Laufs abrufbar)."""
+        stats = PipelineStats(blocks_received=self.blocks_received,
+                              blocks_dropped=self.blocks_dropped,
+                              block_period_s=self.source.block_period)
+        if self._stats is None:
+            return stats
+
+        n_processed = int(self._stats[_ST_PROCESSED])
+        stats.blocks_processed = n_processed
+        if n_processed > 0:
+            n_hist = len(self._stats) - _ST_HEADER
+            latencies = self._stats[_ST_HEADER:_ST_HEADER + min(n_processed, n_hist)]
+            stats.latency_mean_s = float(np.mean(latencies))
+            stats.latency_p95_s = float(np.percentile(latencies, 95))
+            stats.latency_max_s = float(np.max(latencies))
+            stats.processing_mean_s = float(self._stats[_ST_PROC_SUM] / n_processed)
+            stats.callback_mean_s = float(self._stats[_ST_CALLBACK_SUM] / n_processed)
+        return stats
@@ -0,0 +1,172 @@
+"""
+Tests für das Frame-Streaming zwischen Knoten
+"""
+
+import asyncio
+import os
+import socket
+import threading
+import numpy as np
+import pytest
+from python_prototype.waveform.radar_profile import load_profile
+from python_prototype.signal_processing.range_fft import RangeProcessor
+from hardware_integration.capture import FileReplaySource, SimulatedSource
+from hardware_integration.frame_stream import (
+    FrameStreamClient, FrameStreamServer, StreamSource)
+from hardware_integration.realtime_processing import RealtimeRangePipeline
+
+
+@pytest.fixture
+def profile():
+    return load_profile('k24_short_range')
+
+
+class _ServerThread:
+    """Startet den asyncio-Server in einem Hintergrund-Thread."""
+
+    def __init__(self, server: FrameStreamServer):
+        self.server = server
+        self.loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def run():
+            asyncio.set_event_loop(self.loop)
+            self.loop.run_until_complete(server.start())
+            started.set()
+            self.loop.run_forever()
+
+        self.thread = threading.Thread(target=run, daemon=True)
+        self.thread.start()
+        started.wait(5)
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self.server.close(), self.loop).result(5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(5)
+
+
+def _recording(tmp_path, profile, n_frames=6):
+    rng = np.random.default_rng(0)
+    frames = rng.standard_normal((n_frames, 4, profile.n_samples))
+    path = tmp_path / 'capture.npy'
+    np.save(path, frames)
+    return path, frames
+
+
+@pytest.mark.parametrize("transport", ['tcp', 'unix'])
+def test_replay_roundtrip(tmp_path, profile, transport):
+    path, frames = _recording(tmp_path, profile)
+    sock_path = str(tmp_path / 'fmcw.sock') if transport == 'unix' else None
+    server = FrameStreamServer(
+        lambda: FileReplaySource(path, frames.shape[1:], realtime=False),
+        profile, path=sock_path)
+    thread = _ServerThread(server)
+    try:
+        with FrameStreamClient(server.address, n_buffers=2, timeout=5) as client:
+            assert client.profile == profile
+            assert client.frame_shape == frames.shape[1:]
+            received = [(frame.copy(), seq) for frame, seq, _ in client]
+    finally:
+        thread.stop()
+
+    assert [seq for _, seq in received] == list(range(len(frames)))
+    assert all(np.array_equal(r, f) for (r, _), f in zip(received, frames))
+
+
+def test_client_reuses_preallocated_buffers(tmp_path, profile):
+    path, frames = _recording(tmp_path, profile)
+    server = FrameStreamServer(
+        lambda: FileReplaySource(path, frames.shape[1:], realtime=False), profile)
+    thread = _ServerThread(server)
+    try:
+        with FrameStreamClient(server.address, n_buffers=3, timeout=5) as client:
+            bases = [frame.__array_interface__['data'][0] for frame, _, _ in client]
+    finally:
+        thread.stop()
+    assert len(set(bases)) == 3
+    assert bases[:3] == bases[3:6]
+
+
+def test_stream_source_feeds_pipeline(profile):
+    """Test: Simulierter Sender → Socket → RealtimeRangePipeline"""
+    processor = RangeProcessor.from_profile(profile)
+    n_chirps = 4
+    server = FrameStreamServer(
+        lambda: SimulatedSource(processor, [{'range_m': 30.0, 'rcs': 10.0}],
+                                n_chirps=n_chirps, n_blocks=10, realtime=False),
+        profile)
+    thread = _ServerThread(server)
+    try:
+        source = StreamSource(server.address, profile, (n_chirps, profile.n_samples))
+        results = []
+        pipeline = RealtimeRangePipeline(
+            source, processor, n_slots=16,
+            on_result=lambda seq, res: results.append(res[2][0].copy()))
+        stats = asyncio.run(pipeline.run())
+    finally:
+        thread.stop()
+
+    assert stats.blocks_received == 10
+    assert stats.blocks_processed == 10
+    assert abs(profile.range_axis[np.argmax(results[-1])] - 30.0) < 1.0
+
+
+def test_stream_source_rejects_format_mismatch(tmp_path, profile):
+    path, frames = _recording(tmp_path, profile)
+    server = FrameStreamServer(
+        lambda: FileReplaySource(path, frames.shape[1:], realtime=False), profile)
+    thread = _ServerThread(server)
+
+    async def consume():
+        source = StreamSource(server.address, profile, (8, profile.n_samples))
+        async for _ in source.blocks():
+            pass
+
+    try:
+        with pytest.raises(ValueError, match="does not match"):
+            asyncio.run(consume())
+    finally:
+        thread.stop()
+
+
+def test_unix_server_restarts_on_same_path(tmp_path, profile):
+    path, frames = _recording(tmp_path, profile)
+    sock_path = str(tmp_path / 'fmcw.sock')
+
+    async def start_twice():
+        server = FrameStreamServer(
+            lambda: FileReplaySource(path, frames.shape[1:], realtime=False),
+            profile, path=sock_path)
+        for _ in range(2):
+            await server.start()
+            assert os.path.exists(sock_path)
+            await server.close()
+            assert not os.path.exists(sock_path)
+
+    asyncio.run(start_twice())
+
+
+def test_stream_source_connect_does_not_block_loop(profile):
+    """Verbindungsaufbau läuft über die Event-Loop (andere Tasks laufen weiter)"""
+    with socket.socket() as listener:
+        listener.bind(('127.0.0.1', 0))
+        address = listener.getsockname()
+        # Port ohne Listener → Verbindung wird abgelehnt
+
+    async def run():
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        task = asyncio.ensure_future(ticker())
+        source = StreamSource(address, profile, (4, profile.n_samples))
+        with pytest.raises(ConnectionError):
+            async for _ in source.blocks():
+                pass
+        task.cancel()
+        return ticks
+
+    assert len(asyncio.run(run())) > 0
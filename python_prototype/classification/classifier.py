@@ -0,0 +1,224 @@
+# python_prototype/classification/classifier.py
+"""
+Klassifikation aktiver Tracks mit einem trainierten scikit-learn-Modell.
+
+- Modelle werden pro Prozess nur einmal geladen (Cache über Pfad + mtime,
+  ein neu geschriebenes Modell wird automatisch nachgeladen).
+- Die Merkmals-Historie jedes Tracks liegt in einem Ringpuffer
+  (FeatureStore) – ein zusammenhängendes Array für alle Tracks.
+- Pro Frame werden ALLE Tracks mit einem einzigen predict_proba-Aufruf
+  auf einer zusammenhängenden Merkmalsmatrix klassifiziert.
+"""
+
+import os
+import numpy as np
+import joblib
+from functools import lru_cache
+from typing import Tuple
+
+# Merkmale pro Detektion (Spalten aus DETECTION_DTYPE)
+DETECTION_FEATURES = ('range_m', 'velocity_mps', 'snr_db', 'power_db')
+
+
+@lru_cache(maxsize=8)
+def _load_model_cached(path: str, mtime_ns: int):
+    return joblib.load(path)
+
+
+def load_model(path):
+    """
+    Lädt ein mit joblib gespeichertes Modell (gecacht pro Prozess).
+
+    Der Cache-Schlüssel enthält die Änderungszeit der Datei; wird das
+    Modell neu trainiert und überschrieben, wird es beim nächsten Aufruf
+    neu geladen.
+    """
+    path = os.path.abspath(os.fspath(path))
+    return _load_model_cached(path, os.stat(path).st_mtime_ns)
+
+
+def detection_features(detections: np.ndarray) -> np.ndarray:
+    """Merkmalsmatrix (n, len(DETECTION_FEATURES)) aus einem Detektions-Array."""
+    features = np.empty((len(detections), len(DETECTION_FEATURES)))
+    for k, name in enumerate(DETECTION_FEATURES):
+        features[:, k] = detections[name]
+    return np.nan_to_num(features, nan=0.0)
+
+
+class FeatureStore:
+    """
+    Ringpuffer der letzten `history` Merkmalsvektoren pro Track.
+
+    Speicher: ein Array (capacity, history, n_features). Track-IDs werden
+    über ein sortiertes ID-Array (searchsorted) auf Slots abgebildet –
+    update() und features() sind für alle Tracks eines Frames vektorisiert.
+    """
+
+    def __init__(self, n_features: int, history: int = 16, capacity: int = 256):
+        """
+        Args:
+            n_features: Merkmale pro Messung
+            history: Anzahl gespeicherter Messungen pro Track
+            capacity: Anfängliche Anzahl Track-Slots (wächst bei Bedarf)
+        """
+        self.n_features = n_features
+        self.history = history
+        self._data = np.zeros((capacity, history, n_features))
+        self._count = np.zeros(capacity, dtype=np.int64)     # Messungen gesamt
+        self._owner = np.full(capacity, -1, dtype=np.int64)  # Track-ID pro Slot
+        self._sorted_ids = np.empty(0, dtype=np.int64)
+        self._sorted_slots = np.empty(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self._sorted_ids)
+
+    @property
+    def track_ids(self) -> np.ndarray:
+        """Aktive Track-IDs (aufsteigend sortiert)."""
+        return self._sorted_ids.copy()
+
+    def _lookup(self, track_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Slots der Track-IDs; zweite Rückgabe = Maske 'bekannt'."""
+        if len(self._sorted_ids) == 0:
+            return np.full(len(track_ids), -1), np.zeros(len(track_ids), dtype=bool)
+        pos = np.searchsorted(self._sorted_ids, track_ids)
+        pos = np.minimum(pos, len(self._sorted_ids) - 1)
+        known = self._sorted_ids[pos] == track_ids
+        return np.where(known, self._sorted_slots[pos], -1), known
+
+    def _allocate(self, track_ids: np.ndarray) -> np.ndarray:
+        free = np.flatnonzero(self._owner < 0)
+        if len(free) < len(track_ids):
+            capacity = max(2 * len(self._owner), len(self._owner) + len(track_ids))
+            grow = capacity - len(self._owner)
+            self._data = np.concatenate(
+                (self._data, np.zeros((grow,) + self._data.shape[1:])))
+            self._count = np.concatenate((self._count, np.zeros(grow, dtype=np.int64)))
+            self._owner = np.concatenate((self._owner, np.full(grow, -1, dtype=np.int64)))
+            free = np.flatnonzero(self._owner < 0)
+
+        slots = free[:len(track_ids)]
+        self._owner[slots] = track_ids
+        self._count[slots] = 0
+        ids = np.concatenate((self._sorted_ids, track_ids))
+        all_slots = np.concatenate((self._sorted_slots, slots))
+        order = np.argsort(ids, kind='stable')
+        self._sorted_ids, self._sorted_slots = ids[order], all_slots[order]
+        return slots
+
+    def update(self, track_ids, features: np.ndarray) -> None:
+        """
+        Fügt pro Track einen Merkmalsvektor an (neue Tracks werden angelegt).
+
+        Args:
+            track_ids: (n,) eindeutige Track-IDs dieses Frames
+            features: (n, n_features)
+        """
+        track_ids = np.asarray(track_ids, dtype=np.int64)
+        features = np.asarray(features, dtype=np.float64)
+        if features.shape != (len(track_ids), self.n_features):
+            raise ValueError(f"features must have shape ({len(track_ids)}, "
+                             f"{self.n_features}), got {features.shape}")
+
+        slots, known = self._lookup(track_ids)
+        if not known.all():
+            slots[~known] = self._allocate(track_ids[~known])
+
+        self._data[slots, self._count[slots] % self.history] = features
+        self._count[slots] += 1
+
+    def remove(self, track_ids) -> None:
+        """Entfernt beendete Tracks; ihre Slots werden wiederverwendet."""
+        track_ids = np.asarray(track_ids, dtype=np.int64)
+        slots, known = self._lookup(track_ids)
+        self._owner[slots[known]] = -1
+        keep = ~np.isin(self._sorted_ids, track_ids[known])
+        self._sorted_ids = self._sorted_ids[keep]
+        self._sorted_slots = self._sorted_slots[keep]
+
+    def features(self, track_ids=None) -> np.ndarray:
+        """
+        Aggregierte Merkmale pro Track: [letzter Wert, Mittel, Std] über
+        die gespeicherte Historie.
+
+        Returns:
+            C-zusammenhängende Matrix (n_tracks, 3 · n_features)
+        """
+        if track_ids is None:
+            track_ids = self._sorted_ids
+        track_ids = np.asarray(track_ids, dtype=np.int64)
+        slots, known = self._lookup(track_ids)
+        if not known.all():
+            raise KeyError(f"Unknown track ids: {track_ids[~known].tolist()}")
+
+        data = self._data[slots]                              # (n, H, F)
+        count = self._count[slots]
+        n_valid = np.minimum(count, self.history)
+        valid = np.arange(self.history)[None, :] < n_valid[:, None]
+        last = data[np.arange(len(slots)), (count - 1) % self.history]
+
+        weights = valid[:, :, None] / n_valid[:, None, None]
+        mean = np.sum(data * weights, axis=1)
+        var = np.sum((data - mean[:, None, :])**2 * weights, axis=1)
+
+        out = np.empty((len(slots), 3 * self.n_features))
+        F = self.n_features
+        out[:, :F] = last
+        out[:, F:2 * F] = mean
+        out[:, 2 * F:] = np.sqrt(var)
+        return out
+
+
+class TrackClassifier:
+    """
+    Klassifikation aller aktiven Tracks pro Frame.
+
+    Beispiel:
+        clf = TrackClassifier.from_file('models/target_classifier.joblib')
+        clf.update(track_ids, detection_features(dets))
+        labels, proba = clf.classify()
+    """
+
+    def __init__(self, model, n_features: int = len(DETECTION_FEATURES),
+                 history: int = 16):
+        """
+        Args:
+            model: Trainiertes Modell mit predict_proba (z.B. sklearn)
+            n_features: Merkmale pro Messung
+            history: Länge der Merkmals-Historie pro Track
+        """
+        if not hasattr(model, 'predict_proba'):
+            raise TypeError(f"{type(model).__name__} has no predict_proba()")
+        self.model = model
+        self.classes = np.asarray(getattr(model, 'classes_', []))
+        self.store = FeatureStore(n_features, history)
+
+    @classmethod
+    def from_file(cls, path, **kwargs) -> 'TrackClassifier':
+        """Erzeugt einen Classifier mit gecacht geladenem Modell."""
+        return cls(load_model(path), **kwargs)
+
+    def update(self, track_ids, features: np.ndarray) -> None:
+        self.store.update(track_ids, features)
+
+    def remove(self, track_ids) -> None:
+        self.store.remove(track_ids)
+
+    def classify(self, track_ids=None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Klassifiziert die Tracks mit EINEM predict_proba-Aufruf.
+
+        Args:
+            track_ids: Zu klassifizierende Tracks (None = alle aktiven)
+
+        Returns:
+            labels: (n,) wahrscheinlichste Klasse pro Track
+            probabilities: (n, n_classes)
+        """
+        X = self.store.features(track_ids)
+        if len(X) == 0:
+            return self.classes[:0], np.empty((0, len(self.classes)))
+        proba = self.model.predict_proba(X)
+        labels = self.classes[np.argmax(proba, axis=1)] if len(self.classes) else \
+            np.argmax(proba, axis=1)
+        return labels, proba
@@ -0,0 +1,90 @@
+"""
+Unit Tests für Track-Klassifikation und FeatureStore
+"""
+
+import os
+import numpy as np
+import joblib
+import pytest
+from sklearn.linear_model import LogisticRegression
+from python_prototype.classification.classifier import (
+    FeatureStore, TrackClassifier, load_model)
+
+
+@pytest.fixture
+def model_path(tmp_path):
+    rng = np.random.default_rng(0)
+    # Klasse 0: langsam, Klasse 1: schnell (Merkmale: last/mean/std von 2 Größen)
+    X = rng.normal(size=(200, 6))
+    y = (X[:, 1] > 0).astype(int)
+    model = LogisticRegression().fit(X, y)
+    path = tmp_path / 'model.joblib'
+    joblib.dump(model, path)
+    return path
+
+
+def test_feature_store_ring_buffer():
+    store = FeatureStore(n_features=2, history=3, capacity=2)
+    for k in range(5):
+        store.update([10, 20], [[k, 0.0], [2 * k, 1.0]])
+
+    feats = store.features([10, 20])
+    assert feats.flags['C_CONTIGUOUS']
+    # Track 10: letzte 3 Werte 2, 3, 4
+    assert np.allclose(feats[0, :2], [4, 0])
+    assert np.allclose(feats[0, 2:4], [3, 0])
+    assert feats[0, 4] == pytest.approx(np.std([2, 3, 4]))
+    assert np.allclose(feats[1, :2], [8, 1])
+
+
+def test_feature_store_partial_history_and_growth():
+    store = FeatureStore(n_features=1, history=8, capacity=1)
+    store.update([5, 3, 9], [[1.0], [2.0], [3.0]])
+    store.update([3], [[4.0]])
+    assert np.array_equal(store.track_ids, [3, 5, 9])
+
+    feats = store.features([3, 9])
+    assert np.allclose(feats[:, 0], [4.0, 3.0])     # letzter Wert
+    assert np.allclose(feats[:, 1], [3.0, 3.0])     # Mittel nur über gültige Einträge
+    assert np.allclose(feats[:, 2], [1.0, 0.0])
+
+
+def test_feature_store_remove_reuses_slot():
+    store = FeatureStore(n_features=1, history=4, capacity=2)
+    store.update([1, 2], [[1.0], [2.0]])
+    store.remove([1])
+    store.update([7], [[7.0]])
+    assert len(store) == 2
+    assert store.features([7])[0, 1] == 7.0          # keine Reste von Track 1
+    with pytest.raises(KeyError):
+        store.features([1])
+
+
+def test_load_model_is_cached(model_path):
+    first = load_model(model_path)
+    assert load_model(str(model_path)) is first
+
+    # Neues Modell → neue mtime → neu laden
+    joblib.dump(joblib.load(model_path), model_path)
+    os.utime(model_path, ns=(0, os.stat(model_path).st_mtime_ns + 10**9))
+    assert load_model(model_path) is not first
+
+
+def test_classify_batched(model_path):
+    clf = TrackClassifier.from_file(model_path, n_features=2, history=4)
+    calls = []
+    original = clf.model.predict_proba
+    clf.model.predict_proba = lambda X: calls.append(X.shape) or original(X)
+
+    clf.update([1, 2, 3], [[0.0, -2.0], [0.0, 2.0], [0.0, 1.5]])
+    labels, proba = clf.classify()
+
+    assert calls == [(3, 6)]
+    assert proba.shape == (3, 2)
+    assert np.array_equal(labels, [0, 1, 1])
+
+
+def test_classify_empty(model_path):
+    clf = TrackClassifier.from_file(model_path, n_features=2)
+    labels, proba = clf.classify()
+    assert len(labels) == 0 and proba.shape == (0, 2)
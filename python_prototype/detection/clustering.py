@@ -0,0 +1,235 @@
+# python_prototype/detection/clustering.py
+"""
+Clustering von Detektionen zu Objekten (DBSCAN im Range/Doppler/Winkel-Raum).
+
+Ausgedehnte Ziele (z.B. ein Verkehrsflugzeug mit RCS 100) belegen viele
+benachbarte Bins. Die Detektionen werden in skalierte Koordinaten
+(range/eps_range, velocity/eps_velocity, angle/eps_angle) übertragen;
+dort gilt "benachbart" bei euklidischem Abstand <= 1. Fehlt ein Wert
+einzelner Detektionen (NaN, z.B. Winkel nur von einem Teil der Knoten),
+schränkt diese Achse die Nachbarschaft nicht ein.
+
+Die Nachbarsuche läuft über ein Grid-Hash (Zellgröße 1, nur die 3^d
+Nachbarzellen werden verglichen) oder einen KD-Tree – beides skaliert
+nahezu linear mit der Anzahl Detektionen. Pro Cluster wird eine Messung
+mit leistungsgewichtetem Schwerpunkt ausgegeben.
+"""
+
+import itertools
+import numpy as np
+from typing import Tuple
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import cKDTree
+from python_prototype.detection.point_cloud import empty_detections
+
+
+def _scaled_coordinates(detections: np.ndarray, eps_range: float,
+                        eps_velocity: float, eps_angle: float) -> np.ndarray:
+    """
+    (n, d)-Koordinaten; Dimensionen ganz ohne gültige Werte entfallen,
+    einzelne NaN bleiben erhalten (Achse ohne Einschränkung).
+    """
+    columns = []
+    for name, eps in (('range_m', eps_range), ('velocity_mps', eps_velocity),
+                      ('angle_deg', eps_angle)):
+        values = detections[name].astype(np.float64)
+        if eps is None or np.all(np.isnan(values)):
+            continue
+        columns.append(values / eps)
+    if not columns:
+        raise ValueError("No coordinate to cluster on: every dimension is disabled "
+                         "(eps=None) or NaN for all detections")
+    return np.stack(columns, axis=1)
+
+
+def grid_neighbor_pairs(points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Alle Paare (i, j), i < j, mit Abstand <= 1 über ein Grid-Hash.
+
+    Punkte werden nach Zelle floor(x) sortiert; für jeden Nachbar-Offset
+    wird der passende Zellbereich per searchsorted gefunden. Verglichen
+    werden nur Punkte in benachbarten Zellen; die Kandidatenpaare aller
+    Zellpaare eines Offsets werden in einem Schritt erzeugt (repeat/cumsum
+    statt Schleife über die Zellen).
+    """
+    n, d = points.shape
+    cells = np.floor(points).astype(np.int64)
+    cells -= cells.min(axis=0)
+    dims = cells.max(axis=0) + 3                      # +Rand für Offsets -1/+1
+    strides = np.cumprod(np.concatenate(([1], dims[:-1])))
+    keys = (cells + 1) @ strides
+
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    uniq, first, counts = np.unique(sorted_keys, return_index=True, return_counts=True)
+
+    pairs_i, pairs_j = [], []
+    for offset in itertools.product((-1, 0, 1), repeat=d):
+        delta = int(np.dot(offset, strides))
+        if delta < 0:
+            continue                                  # symmetrisch: nur halbe Offsets
+        pos = np.searchsorted(uniq, uniq + delta)
+        pos_clipped = np.minimum(pos, len(uniq) - 1)
+        hit = (pos < len(uniq)) & (uniq[pos_clipped] == uniq + delta)
+        a, b = np.flatnonzero(hit), pos_clipped[hit]
+        if len(a) == 0:
+            continue
+
+        # Kreuzprodukt der Punkte jedes Zellpaars (a, b), flach hintereinander
+        size = counts[a] * counts[b]
+        pair = np.repeat(np.arange(len(a)), size)
+        t = np.arange(size.sum()) - np.repeat(np.cumsum(size) - size, size)
+        i = order[first[a][pair] + t // counts[b][pair]]
+        j = order[first[b][pair] + t % counts[b][pair]]
+
+        diff = points[i] - points[j]
+        close = np.einsum('ij,ij->i', diff, diff) <= 1.0
+        close &= i < j if delta == 0 else i != j
+        i, j = i[close], j[close]
+        pairs_i.append(np.minimum(i, j))
+        pairs_j.append(np.maximum(i, j))
+
+    if not pairs_i:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+    return np.concatenate(pairs_i), np.concatenate(pairs_j)
+
+
+def _complete_pairs(points: np.ndarray, method: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Nachbarpaare für Punkte ohne NaN."""
+    if points.shape[1] == 0:                          # keine Achse → alle benachbart
+        i, j = np.triu_indices(len(points), k=1)
+        return i, j
+    if method == 'grid':
+        return grid_neighbor_pairs(points)
+    pairs = cKDTree(points).query_pairs(1.0, output_type='ndarray')
+    return pairs[:, 0], pairs[:, 1]
+
+
+def neighbor_pairs(points: np.ndarray, method: str = 'grid') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Alle Paare (i, j), i < j, mit Abstand <= 1; NaN-Koordinaten schränken
+    nicht ein (Abstand nur über die bei beiden Punkten gültigen Achsen).
+
+    Punkte werden nach ihrem NaN-Muster gruppiert (höchstens 2^d Gruppen);
+    für jedes Gruppenpaar läuft die Suche im gemeinsamen Unterraum.
+    """
+    if method not in ('grid', 'kdtree'):
+        raise ValueError(f"Unknown method '{method}' (use 'grid' or 'kdtree')")
+    missing = np.isnan(points)
+    if not missing.any():
+        return _complete_pairs(points, method)
+
+    patterns, group = np.unique(missing, axis=0, return_inverse=True)
+    group = group.ravel()
+    pairs_i, pairs_j = [], []
+    for ga, gb in itertools.combinations_with_replacement(range(len(patterns)), 2):
+        members = np.flatnonzero((group == ga) | (group == gb))
+        axes = ~(patterns[ga] | patterns[gb])
+        i, j = _complete_pairs(points[np.ix_(members, axes)], method)
+        i, j = members[i], members[j]
+        if ga != gb:                                  # Paare innerhalb einer Gruppe
+            cross = group[i] != group[j]              # zählen bei (ga, ga)/(gb, gb)
+            i, j = i[cross], j[cross]
+        pairs_i.append(i)
+        pairs_j.append(j)
+    return np.concatenate(pairs_i), np.concatenate(pairs_j)
+
+
+def dbscan_labels(points: np.ndarray, min_samples: int = 1,
+                  method: str = 'grid') -> np.ndarray:
+    """
+    DBSCAN mit eps = 1 auf skalierten Koordinaten.
+
+    Args:
+        points: (n, d) skalierte Koordinaten (NaN = Achse ohne Einschränkung)
+        min_samples: Mindestanzahl Punkte (inkl. selbst) für einen Kernpunkt
+        method: 'grid' (Grid-Hash) oder 'kdtree'
+
+    Returns:
+        Cluster-Labels 0..k-1, Rauschen = -1
+    """
+    n = len(points)
+    if n == 0:
+        return np.empty(0, dtype=np.int64)
+
+    i, j = neighbor_pairs(points, method)
+
+    n_neighbors = 1 + np.bincount(i, minlength=n) + np.bincount(j, minlength=n)
+    core = n_neighbors >= min_samples
+
+    # Cluster = Zusammenhangskomponenten der Kernpunkte
+    both_core = core[i] & core[j]
+    graph = coo_matrix((np.ones(both_core.sum()), (i[both_core], j[both_core])),
+                       shape=(n, n))
+    _, components = connected_components(graph, directed=False)
+
+    labels = np.full(n, -1, dtype=np.int64)
+    core_idx = np.flatnonzero(core)
+    _, labels[core_idx] = np.unique(components[core_idx], return_inverse=True)
+
+    # Randpunkte: Label eines benachbarten Kernpunkts übernehmen
+    border_i = ~core[i] & core[j]
+    border_j = core[i] & ~core[j]
+    labels[i[border_i]] = labels[j[border_i]]
+    labels[j[border_j]] = labels[i[border_j]]
+    return labels
+
+
+def cluster_detections(detections: np.ndarray, eps_range: float = 1.5,
+                       eps_velocity: float = 1.0, eps_angle: float = 3.0,
+                       min_samples: int = 1, method: str = 'grid'
+                       ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fasst Detektionen eines Frames zu Objekt-Messungen zusammen.
+
+    Args:
+        detections: Structured Array (DETECTION_DTYPE)
+        eps_range: Nachbarschaftsradius Range [m]
+        eps_velocity: Nachbarschaftsradius Geschwindigkeit [m/s]
+        eps_angle: Nachbarschaftsradius Winkel [°]
+        min_samples: DBSCAN-Kernpunkt-Schwelle (1 = kein Rauschen)
+        method: 'grid' oder 'kdtree'
+
+    Returns:
+        clusters: Eine Detektion pro Objekt (leistungsgewichtete
+                  Schwerpunkte, power = Summe, snr = Maximum),
+                  nach Leistung absteigend sortiert
+        labels: Cluster-Index pro Eingangs-Detektion (-1 = Rauschen)
+    """
+    if len(detections) == 0:
+        return empty_detections(0), np.empty(0, dtype=np.int64)
+
+    points = _scaled_coordinates(detections, eps_range, eps_velocity, eps_angle)
+    labels = dbscan_labels(points, min_samples, method)
+
+    valid = labels >= 0
+    n_clusters = int(labels.max()) + 1 if valid.any() else 0
+    lab = labels[valid]
+    dets = detections[valid]
+
+    weights = 10 ** (dets['power_db'].astype(np.float64) / 10)
+    weight_sum = np.bincount(lab, weights, minlength=n_clusters)
+
+    clusters = empty_detections(n_clusters)
+    for name in ('range_m', 'velocity_mps', 'angle_deg', 'timestamp'):
+        # Schwerpunkt über die gültigen Werte; ohne gültigen Wert bleibt NaN
+        values = dets[name].astype(np.float64)
+        valid_w = np.where(np.isnan(values), 0.0, weights)
+        total = np.bincount(lab, valid_w * np.nan_to_num(values), minlength=n_clusters)
+        w_valid = np.bincount(lab, valid_w, minlength=n_clusters)
+        clusters[name] = np.divide(total, w_valid, out=np.full(n_clusters, np.nan),
+                                   where=w_valid > 0)
+
+    # Stärkste Detektion je Cluster liefert Bins, Frame und SNR
+    order = np.lexsort((-dets['power_db'], lab))
+    strongest = order[np.searchsorted(lab[order], np.arange(n_clusters))]
+    for name in ('frame', 'range_bin', 'doppler_bin', 'snr_db'):
+        clusters[name] = dets[name][strongest]
+    clusters['power_db'] = 10 * np.log10(weight_sum)
+
+    sort = np.argsort(-clusters['power_db'], kind='stable')
+    remap = np.empty(n_clusters, dtype=np.int64)
+    remap[sort] = np.arange(n_clusters)
+    labels[valid] = remap[lab]
+    return clusters[sort], labels
@@ -0,0 +1,165 @@
+# python_prototype/detection/point_cloud.py
+"""
+Detektionen als kompakte Punktwolke (NumPy Structured Array).
+
+Eine Zeile pro Detektion, feste Felder – keine Python-Objekte pro
+Detektion. Das Format wird unverändert an Tracker, HDF5-Writer
+(RadarH5Writer, record_dtypes) und pandas weitergereicht.
+"""
+
+import numpy as np
+
+DETECTION_DTYPE = np.dtype([
+    ('frame', np.int64),
+    ('timestamp', np.float64),
+    ('range_m', np.float32),
+    ('velocity_mps', np.float32),
+    ('angle_deg', np.float32),
+    ('snr_db', np.float32),
+    ('power_db', np.float32),
+    ('range_bin', np.int32),
+    ('doppler_bin', np.int32),
+])
+
+
+def empty_detections(n: int = 0) -> np.ndarray:
+    """Detektions-Array der Länge n (Winkel/Geschwindigkeit = NaN, Bins = -1)."""
+    dets = np.zeros(n, dtype=DETECTION_DTYPE)
+    dets['velocity_mps'] = np.nan
+    dets['angle_deg'] = np.nan
+    dets['doppler_bin'] = -1
+    return dets
+
+
+def detections_from_peaks(peak_idx: np.ndarray, range_bins: np.ndarray,
+                          range_profile_db: np.ndarray, noise_floor_db: float,
+                          frame: int = 0, timestamp: float = np.nan) -> np.ndarray:
+    """
+    Wandelt Peak-Indizes eines Range-Profils in Detektionen um.
+
+    Args:
+        peak_idx: Indizes aus detect_peaks / cfar_peaks_2d
+        range_bins: Range-Achse [m]
+        range_profile_db: Range-Profil [dB]
+        noise_floor_db: Geschätzter Noise-Floor [dB] (für SNR)
+        frame, timestamp: Frame-Nummer und Zeitstempel
+    """
+    peak_idx = np.asarray(peak_idx, dtype=np.intp)
+    dets = empty_detections(len(peak_idx))
+    dets['frame'] = frame
+    dets['timestamp'] = timestamp
+    dets['range_bin'] = peak_idx
+    dets['range_m'] = range_bins[peak_idx]
+    dets['power_db'] = range_profile_db[peak_idx]
+    dets['snr_db'] = dets['power_db'] - noise_floor_db
+    return dets
+
+
+def detections_from_rd_map(rows: np.ndarray, cols: np.ndarray, rd_map_db: np.ndarray,
+                           range_axis: np.ndarray, velocity_axis: np.ndarray,
+                           noise_floor_db, frame: int = 0,
+                           timestamp: float = np.nan) -> np.ndarray:
+    """
+    Wandelt (Doppler-, Range-)Indizes einer RD-Map in Detektionen um.
+
+    Args:
+        rows, cols: Doppler- und Range-Bin-Indizes (z.B. aus cfar_peaks_2d)
+        rd_map_db: Range-Doppler-Map [dB], Form (n_doppler, n_range)
+        range_axis, velocity_axis: Achsen der Map
+        noise_floor_db: Skalar, Wert pro Detektion (z.B. cfar_noise_db)
+                        oder Map gleicher Form (lokale CFAR-Schätzung)
+    """
+    rows = np.asarray(rows, dtype=np.intp)
+    cols = np.asarray(cols, dtype=np.intp)
+    dets = empty_detections(len(rows))
+    dets['frame'] = frame
+    dets['timestamp'] = timestamp
+    dets['range_bin'] = cols
+    dets['doppler_bin'] = rows
+    dets['range_m'] = range_axis[cols]
+    dets['velocity_mps'] = velocity_axis[rows]
+    dets['power_db'] = rd_map_db[rows, cols]
+    noise = np.asarray(noise_floor_db)
+    dets['snr_db'] = dets['power_db'] - (noise[rows, cols] if noise.ndim == 2 else noise)
+    return dets
+
+
+class DetectionBuffer:
+    """
+    Vorallokierter, spaltenorientierter Puffer für Detektionen vieler Frames.
+
+    append() kopiert die Detektionen eines Frames an das Ende; Spalten und
+    Frames werden als Views (ohne Kopie) herausgegeben. Bei Überlauf wird
+    die Kapazität verdoppelt (amortisiert O(1) pro Detektion).
+    """
+
+    def __init__(self, capacity: int = 4096, max_frames: int = 1024):
+        self._data = empty_detections(capacity)
+        self._frame_start = np.zeros(max_frames + 1, dtype=np.int64)
+        self.n = 0
+        self.n_frames = 0
+
+    def __len__(self) -> int:
+        return self.n
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    def _grow(self, min_capacity: int) -> None:
+        capacity = max(2 * len(self._data), min_capacity)
+        grown = empty_detections(capacity)
+        grown[:self.n] = self._data[:self.n]
+        self._data = grown
+
+    def append(self, detections: np.ndarray) -> np.ndarray:
+        """
+        Hängt die Detektionen EINES Frames an.
+
+        Returns:
+            View auf die eingefügten Zeilen
+        """
+        k = len(detections)
+        if self.n + k > len(self._data):
+            self._grow(self.n + k)
+        if self.n_frames + 1 >= len(self._frame_start):
+            self._frame_start = np.concatenate(
+                (self._frame_start, np.zeros(len(self._frame_start), dtype=np.int64)))
+
+        start = self.n
+        self._data[start:start + k] = detections
+        self.n += k
+        self.n_frames += 1
+        self._frame_start[self.n_frames] = self.n
+        return self._data[start:self.n]
+
+    def view(self) -> np.ndarray:
+        """Alle gespeicherten Detektionen (View)."""
+        return self._data[:self.n]
+
+    def column(self, name: str) -> np.ndarray:
+        """Eine Spalte als (strided) View, z.B. column('range_m')."""
+        return self._data[name][:self.n]
+
+    def frame(self, k: int) -> np.ndarray:
+        """Detektionen des k-ten angehängten Frames (View)."""
+        if not 0 <= k < self.n_frames:
+            raise IndexError(f"frame {k} out of range (0..{self.n_frames - 1})")
+        return self._data[self._frame_start[k]:self._frame_start[k + 1]]
+
+    def clear(self) -> None:
+        """Leert den Puffer; der Speicher bleibt allokiert."""
+        self.n = 0
+        self.n_frames = 0
+
+    def to_dataframe(self, copy: bool = False):
+        """
+        pandas-DataFrame über den Puffer (ohne Kopie, solange copy=False).
+
+        Achtung: Ohne Kopie ist der DataFrame nur bis zum nächsten
+        clear()/Überlauf gültig.
+        """
+        import pandas as pd
+        data = self.view()
+        return pd.DataFrame({name: data[name] for name in DETECTION_DTYPE.names},
+                            copy=copy)
@@ -0,0 +1,137 @@
+"""
+Unit Tests für die CFAR-/Peak-Kernel (Numba vs. NumPy-Referenz)
+"""
+
+import numpy as np
+import pytest
+from python_prototype.waveform.chirp_generator import ChirpGenerator
+from python_prototype.signal_processing.range_fft import RangeProcessor
+from python_prototype.detection.cfar_kernels import (
+    NUMBA_AVAILABLE, ca_cfar_threshold_numpy, cfar_noise_db, cfar_peaks_2d,
+    local_maxima_numpy,
+    non_max_suppression_numpy, threshold_peaks)
+
+needs_numba = pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed")
+
+
+@pytest.fixture
+def rd_map():
+    """Rausch-Map (Exponential-verteilte Leistung) mit 4 Punktzielen [dB]"""
+    rng = np.random.default_rng(42)
+    power = rng.exponential(1.0, size=(64, 256))
+    for r, c, snr in [(10, 40, 300), (32, 128, 100), (33, 131, 30), (50, 200, 1000)]:
+        power[r, c] += snr
+    return 10 * np.log10(power)
+
+
+def test_finds_targets(rd_map):
+    """Test: Punktziele werden gefunden, Nachbar-Peak per NMS unterdrückt"""
+    rows, cols, values = cfar_peaks_2d(rd_map, threshold_db=13, backend='numpy')
+
+    found = set(zip(rows.tolist(), cols.tolist()))
+    assert {(10, 40), (32, 128), (50, 200)} <= found
+    assert (33, 131) not in found
+    assert (rows[0], cols[0]) == (50, 200)
+    assert np.all(np.diff(values) <= 0)
+
+
+def test_cfar_threshold_interior_matches_direct_sum():
+    """Test: Integralbild-CFAR = direkte Mittelung der Trainingszellen"""
+    power = np.random.default_rng(0).exponential(size=(20, 30))
+    thr = ca_cfar_threshold_numpy(power, guard=(1, 2), train=(2, 3), scale=1.0)
+
+    i, j = 10, 15
+    outer = power[i - 3:i + 4, j - 5:j + 6]
+    inner = power[i - 1:i + 2, j - 2:j + 3]
+    expected = (outer.sum() - inner.sum()) / (outer.size - inner.size)
+    assert thr[i, j] == pytest.approx(expected)
+
+
+def test_noise_at_cells_matches_threshold_map(rd_map):
+    """Test: Rauschschätzung an einzelnen Zellen = CFAR-Map (scale 1) dort"""
+    rows, cols, values = cfar_peaks_2d(rd_map, threshold_db=13, backend='numpy')
+    thr = ca_cfar_threshold_numpy(10 ** (rd_map / 10), (1, 2), (4, 8), scale=1.0)
+    noise = cfar_noise_db(rd_map, rows, cols)
+    assert np.allclose(noise, 10 * np.log10(thr[rows, cols]))
+    assert np.all(values - noise > 13)
+
+
+def test_local_maxima_edges():
+    x = np.array([[3.0, 1.0, 0.0],
+                  [1.0, 0.0, 2.0]])
+    assert np.array_equal(np.argwhere(local_maxima_numpy(x)), [[0, 0], [1, 2]])
+
+
+def _greedy_nms(rows, cols, radius):
+    """Sequentielle Greedy-NMS als Referenz"""
+    keep = []
+    for k in range(len(rows)):
+        keep.append(not any(keep[p] and abs(rows[p] - rows[k]) <= radius[0]
+                            and abs(cols[p] - cols[k]) <= radius[1] for p in range(k)))
+    return np.array(keep, dtype=bool)
+
+
+@pytest.mark.parametrize("radius", [(2, 3), (0, 2), (1, 0), (5, 5)])
+def test_vectorized_nms_matches_greedy(radius):
+    """Test: Vektorisierte NMS = sequentielle Greedy-NMS (auch Ketten)"""
+    rng = np.random.default_rng(sum(radius))
+    rows = rng.integers(0, 20, 400)
+    cols = rng.integers(0, 40, 400)
+    keep = non_max_suppression_numpy(rows, cols, None, radius)
+    assert np.array_equal(keep, _greedy_nms(rows, cols, radius))
+    # Kette: 0 unterdrückt 1, 1 darf 2 dann nicht mehr unterdrücken
+    chain = np.array([0, 2, 4])
+    assert non_max_suppression_numpy(np.zeros(3, int), chain, None, (0, 2)).tolist() == \
+        [True, False, True]
+    assert not non_max_suppression_numpy(rows[:0], cols[:0], None, radius).any()
+
+
+def test_threshold_peaks(rd_map):
+    """Test: Feste Schwelle + lokale Maxima + NMS"""
+    rows, cols, values = threshold_peaks(rd_map, 20.0, backend='numpy')
+    assert list(zip(rows.tolist(), cols.tolist())) == [(50, 200), (10, 40), (32, 128)]
+    assert np.all(values > 20.0)
+    _, cols_1d, _ = threshold_peaks(rd_map[32], 10.0, nms_radius=(0, 3), backend='numpy')
+    assert cols_1d.tolist() == [128]
+
+
+@needs_numba
+def test_threshold_peaks_numba_matches_numpy(rd_map):
+    for a, b in zip(threshold_peaks(rd_map, 8.0, backend='numpy'),
+                    threshold_peaks(rd_map, 8.0, backend='numba')):
+        assert np.array_equal(a, b)
+
+
+@needs_numba
+@pytest.mark.parametrize("shape", [(64, 256), (7, 33), (1, 500)])
+def test_numba_matches_numpy(shape):
+    """Test: Numba-Kernel liefern identische Ergebnisse wie der Referenzpfad"""
+    rng = np.random.default_rng(sum(shape))
+    power = rng.exponential(1.0, size=shape)
+    power[rng.integers(0, shape[0], 20), rng.integers(0, shape[1], 20)] += 200
+    rd = 10 * np.log10(power)
+
+    ref = cfar_peaks_2d(rd, backend='numpy')
+    jit = cfar_peaks_2d(rd, backend='numba')
+    for a, b in zip(ref, jit):
+        assert np.array_equal(a, b)
+
+
+@needs_numba
+def test_range_profile_1d():
+    """Test: 1D-Range-Profil aus der Range-FFT, beide Pfade identisch"""
+    gen = ChirpGenerator(24e9, 250e6, 256e-6, 1e6, verbose=False)
+    proc = RangeProcessor(gen)
+    _, tx, rx1 = proc.simulate_target(30.0, rcs=0.1)
+    _, _, rx2 = proc.simulate_target(60.0, rcs=1.6)
+    rng = np.random.default_rng(3)
+    beat = proc.mix_signals(tx, rx1 + rx2) + 1e-12 * rng.standard_normal(gen.n_samples)
+    _, range_bins, profile = proc.range_fft(beat)
+
+    ref = cfar_peaks_2d(profile, backend='numpy', max_peaks=5)
+    jit = cfar_peaks_2d(profile, backend='numba', max_peaks=5)
+    for a, b in zip(ref, jit):
+        assert np.array_equal(a, b)
+
+    detected = np.sort(range_bins[ref[1][:2]])
+    assert np.allclose(detected, [30.0, 60.0], atol=1.0)
@@ -0,0 +1,116 @@
+"""
+Unit Tests für das Clustering von Detektionen
+"""
+
+import numpy as np
+import pytest
+from python_prototype.detection.point_cloud import empty_detections
+from python_prototype.detection.clustering import (
+    cluster_detections, dbscan_labels, grid_neighbor_pairs, neighbor_pairs)
+
+
+def _make_detections(ranges, velocities, powers):
+    dets = empty_detections(len(ranges))
+    dets['range_m'] = ranges
+    dets['velocity_mps'] = velocities
+    dets['power_db'] = powers
+    dets['range_bin'] = np.arange(len(ranges))
+    return dets
+
+
+def test_extended_target_becomes_one_object():
+    """Test: Benachbarte Bins eines ausgedehnten Ziels → eine Messung"""
+    # Ziel A: 5 Bins um 100 m, Ziel B: 3 Bins um 140 m mit anderer Geschwindigkeit
+    dets = _make_detections(
+        ranges=[99.0, 99.6, 100.2, 100.8, 101.4, 140.0, 140.6, 141.2],
+        velocities=[5.0, 5.0, 5.2, 5.0, 4.8, -3.0, -3.0, -3.0],
+        powers=[20, 26, 30, 26, 20, 15, 18, 15])
+
+    clusters, labels = cluster_detections(dets, eps_range=1.0, eps_velocity=1.0)
+
+    assert len(clusters) == 2
+    assert np.array_equal(labels, [0, 0, 0, 0, 0, 1, 1, 1])
+    # Symmetrische Leistung → Schwerpunkt auf dem stärksten Bin
+    assert clusters['range_m'][0] == pytest.approx(100.2, abs=1e-4)
+    assert clusters['range_m'][1] == pytest.approx(140.6, abs=1e-4)
+    assert clusters['range_bin'][0] == 2
+    assert clusters['power_db'][0] > 30
+
+
+def test_power_weighted_centroid():
+    dets = _make_detections([10.0, 11.0], [0.0, 0.0], [30.0, 20.0])
+    clusters, _ = cluster_detections(dets, eps_range=1.5)
+    expected = (10.0 * 1000 + 11.0 * 100) / 1100
+    assert clusters['range_m'][0] == pytest.approx(expected, rel=1e-6)
+
+
+def test_min_samples_marks_noise():
+    dets = _make_detections([10.0, 10.5, 11.0, 50.0], [0.0] * 4, [20.0] * 4)
+    clusters, labels = cluster_detections(dets, eps_range=1.0, min_samples=2)
+    assert len(clusters) == 1
+    assert labels[3] == -1
+
+
+def test_range_only_detections():
+    """Test: Fehlende Geschwindigkeit/Winkel (NaN) werden ignoriert"""
+    dets = empty_detections(3)
+    dets['range_m'] = [20.0, 20.5, 30.0]
+    dets['power_db'] = [10.0, 12.0, 10.0]
+    clusters, labels = cluster_detections(dets, eps_range=1.0)
+    assert len(clusters) == 2
+    assert labels[0] == labels[1] != labels[2]
+
+
+def test_partial_nan_does_not_constrain():
+    """Test: Fehlende Geschwindigkeit einzelner Detektionen → Achse frei"""
+    dets = _make_detections([20.0, 20.5, 21.0, 21.2], [5.0, np.nan, -5.0, np.nan],
+                            [10.0, 10.0, 10.0, 10.0])
+    clusters, labels = cluster_detections(dets, eps_range=1.0, eps_velocity=1.0)
+    # 0 und 2 sind über die Geschwindigkeit getrennt, aber über 1 (NaN) verbunden
+    assert len(set(labels.tolist())) == 1
+    assert clusters['velocity_mps'][0] == pytest.approx(0.0)
+    assert not np.isnan(clusters['range_m'][0])
+
+
+@pytest.mark.parametrize("method", ["grid", "kdtree"])
+def test_neighbor_pairs_with_nan_match_brute_force(method):
+    rng = np.random.default_rng(7)
+    points = rng.uniform(0, 6, size=(200, 3))
+    points[rng.random(points.shape) < 0.2] = np.nan
+
+    i, j = neighbor_pairs(points, method)
+    diff = np.nan_to_num(points[:, None, :] - points[None, :, :])
+    close = np.sum(diff**2, axis=-1) <= 1.0
+    brute = set(zip(*np.nonzero(np.triu(close, k=1))))
+    assert len(i) == len(brute)
+    assert set(zip(i.tolist(), j.tolist())) == brute
+
+
+def test_no_usable_dimension():
+    dets = _make_detections([20.0, 21.0], [np.nan, np.nan], [10.0, 10.0])
+    with pytest.raises(ValueError, match="No coordinate"):
+        cluster_detections(dets, eps_range=None)
+
+
+@pytest.mark.parametrize("min_samples", [1, 3])
+def test_grid_matches_kdtree(min_samples):
+    rng = np.random.default_rng(1)
+    points = rng.uniform(0, 20, size=(500, 3))
+
+    i, j = grid_neighbor_pairs(points)
+    brute = {(a, b) for a in range(len(points)) for b in range(a + 1, len(points))
+             if np.sum((points[a] - points[b])**2) <= 1.0}
+    assert set(zip(i.tolist(), j.tolist())) == brute
+
+    grid = dbscan_labels(points, min_samples, method='grid')
+    tree = dbscan_labels(points, min_samples, method='kdtree')
+    # Kernpunkte sind eindeutig zugeordnet; gleiche Partition bis auf Umbenennung
+    assert np.array_equal(grid == -1, tree == -1)
+    mapping = {}
+    for g, t in zip(grid, tree):
+        assert mapping.setdefault(g, t) == t
+
+
+def test_empty_input():
+    clusters, labels = cluster_detections(empty_detections(0))
+    assert len(clusters) == 0 and len(labels) == 0
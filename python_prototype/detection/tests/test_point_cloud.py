@@ -0,0 +1,84 @@
+"""
+Unit Tests für die strukturierte Detektions-Punktwolke
+"""
+
+import numpy as np
+import pytest
+from python_prototype.waveform.radar_profile import RadarProfile
+from python_prototype.signal_processing.range_fft import RangeProcessor
+from python_prototype.detection.point_cloud import (
+    DETECTION_DTYPE, DetectionBuffer, detections_from_rd_map, empty_detections)
+from python_prototype.utils.hdf5_storage import RadarH5Reader, RadarH5Writer
+
+
+@pytest.fixture
+def proc():
+    return RangeProcessor.from_profile(RadarProfile(24e9, 250e6, 256e-6, 1e6))
+
+
+def test_detect_points_matches_detect_peaks(proc):
+    """Test: detect_points liefert dieselben Peaks als Structured Array"""
+    _, tx, rx = proc.simulate_target(50.0, rcs=0.1)
+    _, range_bins, profile = proc.range_fft(proc.mix_signals(tx, rx))
+
+    peaks = proc.detect_peaks(profile, snr_db=15, max_peaks=5)
+    dets = proc.detect_points(range_bins, profile, snr_db=15, max_peaks=5,
+                              frame=7, timestamp=1.5)
+
+    assert dets.dtype == DETECTION_DTYPE
+    assert np.array_equal(dets['range_bin'], peaks)
+    assert np.allclose(dets['range_m'], range_bins[peaks])
+    assert abs(dets['range_m'][0] - 50.0) < 1.0
+    assert np.all(dets['snr_db'] >= 15)
+    assert np.all(dets['frame'] == 7) and np.all(dets['timestamp'] == 1.5)
+    assert np.all(np.isnan(dets['velocity_mps']))
+
+
+def test_detections_from_rd_map():
+    rd = np.zeros((8, 16))
+    rd[2, 5] = 30.0
+    dets = detections_from_rd_map([2], [5], rd, np.arange(16) * 0.5,
+                                  np.arange(8) - 4.0, noise_floor_db=-10.0)
+    assert dets['range_m'][0] == 2.5
+    assert dets['velocity_mps'][0] == -2.0
+    assert dets['snr_db'][0] == 40.0
+
+
+def test_buffer_views_and_growth():
+    """Test: Frames werden ohne Kopie herausgegeben, Puffer wächst bei Bedarf"""
+    buf = DetectionBuffer(capacity=4, max_frames=2)
+    for k in range(5):
+        dets = empty_detections(k)
+        dets['frame'] = k
+        dets['range_m'] = np.arange(k)
+        buf.append(dets)
+
+    assert len(buf) == 10 and buf.n_frames == 5
+    assert buf.capacity >= 10
+    assert np.all(buf.frame(3)['frame'] == 3)
+    assert len(buf.frame(0)) == 0
+    assert np.shares_memory(buf.frame(4), buf.view())
+    assert np.shares_memory(buf.column('range_m'), buf.view())
+    with pytest.raises(IndexError):
+        buf.frame(5)
+
+    df = buf.to_dataframe()
+    assert list(df.columns) == list(DETECTION_DTYPE.names)
+    assert df['range_m'].sum() == pytest.approx(buf.column('range_m').sum())
+
+    buf.clear()
+    assert len(buf) == 0 and buf.capacity >= 10
+
+
+def test_buffer_to_hdf5(tmp_path):
+    """Test: Punktwolke lässt sich direkt im HDF5-Writer ablegen"""
+    buf = DetectionBuffer()
+    path = str(tmp_path / 'dets.h5')
+    with RadarH5Writer(path, record_dtypes={'detections': DETECTION_DTYPE}) as w:
+        for k in range(3):
+            dets = empty_detections(2)
+            dets['frame'] = k
+            w.write_frame(timestamp=float(k), detections=buf.append(dets))
+
+    with RadarH5Reader(path) as r:
+        assert r.records('detections', 2).tobytes() == buf.frame(2).tobytes()
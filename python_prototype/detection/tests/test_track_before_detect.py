@@ -0,0 +1,103 @@
+"""
+Unit Tests für Track-before-Detect
+"""
+
+import numpy as np
+import pytest
+from scipy.ndimage import maximum_filter1d
+from python_prototype.detection.cfar_kernels import cfar_peaks_2d
+from python_prototype.detection.track_before_detect import TrackBeforeDetect
+
+
+def _brute_force(frames, step):
+    """Viterbi über genau die übergebenen Frames (Referenz)"""
+    score = frames[0].copy()
+    for z in frames[1:]:
+        score = maximum_filter1d(score, 2 * step + 1, mode='nearest') + z
+    return score / len(frames)
+
+
+def _noisy_profiles(n_frames, n_bins=256, snr_db=6.0, start_bin=60.0, bins_per_frame=0.5,
+                    seed=0):
+    """Rayleigh-Rauschen + schwaches, langsam wanderndes Ziel (dB)"""
+    rng = np.random.default_rng(seed)
+    noise = (rng.standard_normal((n_frames, n_bins))
+             + 1j * rng.standard_normal((n_frames, n_bins))) / np.sqrt(2)
+    target_bins = np.rint(start_bin + bins_per_frame * np.arange(n_frames)).astype(int)
+    noise[np.arange(n_frames), target_bins] += 10 ** (snr_db / 20)
+    return 20 * np.log10(np.abs(noise)), target_bins
+
+
+def test_sliding_window_matches_brute_force():
+    rng = np.random.default_rng(1)
+    frames = rng.exponential(size=(12, 40))
+    tbd = TrackBeforeDetect(40, n_frames=4, max_step=1, in_db=False)
+    for k, frame in enumerate(frames):
+        score = tbd.update(frame)
+        window = frames[max(0, k - 3):k + 1] / np.median(frames[max(0, k - 3):k + 1],
+                                                          axis=1, keepdims=True)
+        assert np.allclose(score, _brute_force(window, 1))
+    assert tbd.ready and tbd.frames_integrated == 4
+
+
+def test_weak_target_detected_after_integration():
+    profiles, target_bins = _noisy_profiles(16)
+    range_axis = np.arange(profiles.shape[1]) * 0.6
+
+    # Einzelbild-CFAR findet das Ziel (SNR 6 dB) kaum
+    single_hits = sum(
+        np.any(np.abs(cfar_peaks_2d(p, threshold_db=12.0)[1] - b) <= 2)
+        for p, b in zip(profiles, target_bins))
+    assert single_hits <= 2
+
+    tbd = TrackBeforeDetect(profiles.shape[1], n_frames=8, max_step=1)
+    hits = 0
+    for k, (p, b) in enumerate(zip(profiles, target_bins)):
+        tbd.update(p)
+        if tbd.ready:
+            dets = tbd.detect(range_axis, threshold_db=3.0, frame=k)
+            # Endpunkt der besten Bahn darf um max_step-Sprünge abweichen
+            near = np.abs(dets['range_bin'] - b) <= 2
+            hits += int(near.any())
+            assert np.sum(~near) <= 1
+            assert np.all(dets['frame'] == k)
+    assert hits >= 8
+
+
+def test_range_doppler_maps():
+    rng = np.random.default_rng(2)
+    maps = rng.exponential(size=(6, 16, 32))
+    maps[:, 5, 10] += 10.0
+    tbd = TrackBeforeDetect((16, 32), n_frames=6, max_step=(1, 1), in_db=False)
+    for m in maps:
+        tbd.update(m)
+    dets = tbd.detect(np.arange(32.0), np.arange(16.0) - 8, threshold_db=3.0)
+    assert (dets['doppler_bin'][0], dets['range_bin'][0]) == (5, 10)
+    assert dets['velocity_mps'][0] == -3.0
+
+
+def test_doppler_axis_wraps():
+    # Ziel läuft über die Doppler-Grenze: Bins 2, 1, 0, 15, 14, 13
+    rng = np.random.default_rng(3)
+    maps = rng.exponential(size=(6, 16, 32))
+    maps[np.arange(6), (2 - np.arange(6)) % 16, 10] += 10.0
+    tbd = TrackBeforeDetect((16, 32), n_frames=6, max_step=(1, 1), in_db=False)
+    for m in maps:
+        tbd.update(m)
+    # Bahn über alle 6 Frames (mit 'nearest' nur die letzten drei)
+    assert tbd.score[13, 10] > 13.0
+    dets = tbd.detect(np.arange(32.0), np.arange(16.0) - 8, threshold_db=3.0)
+    assert (dets['doppler_bin'][0], dets['range_bin'][0]) == (13, 10)
+    assert len(tbd.detect(np.arange(32.0), np.arange(16.0) - 8,
+                          threshold_db=0.0, max_peaks=2)) <= 2
+
+
+def test_invalid_input():
+    with pytest.raises(ValueError):
+        TrackBeforeDetect(32, n_frames=0)
+    tbd = TrackBeforeDetect(32)
+    with pytest.raises(ValueError):
+        tbd.update(np.zeros(16))
+    tbd.update(np.zeros(32))
+    tbd.reset()
+    assert tbd.n_updates == 0 and not tbd.ready
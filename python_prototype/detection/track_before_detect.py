@@ -0,0 +1,175 @@
+# python_prototype/detection/track_before_detect.py
+"""
+Track-before-Detect (TBD) für schwache Ziele nahe am Noise-Floor.
+
+Statt jeden Frame einzeln zu schwellen, wird die normierte Leistung
+z_k(x) = P_k(x) / median(P_k) entlang physikalisch möglicher Bahnen über
+K Frames aufsummiert (Viterbi-Rekursion):
+
+    S_k(x) = z_k(x) + max_{|x' - x| <= max_step} S_{k-1}(x')
+
+Das Maximum über die Nachbarschaft ist ein Max-Filter über die ganze
+Map; pro Frame wird also nur ein vektorisierter Filter ausgewertet.
+Die Doppler-Achse ist periodisch (FFT-Bins, Aliasing bei ±v_max) und
+wird mit mode='wrap' gefiltert; die Range-Achse hat echte Ränder.
+
+Gleitendes Fenster:
+    Für ein exaktes K-Frame-Fenster werden K Teil-Scores gehalten (Bahnen,
+    die vor 0 … K-1 Frames begonnen haben). Ein neuer Frame startet eine
+    Bahn im Slot der abgelaufenen, dann werden alle Teil-Scores in einem
+    Filter-Aufruf verlängert; der älteste ist der K-Frame-Score. Aufwand
+    und Speicher pro Frame: O(K · Map-Größe), unabhängig von der Laufzeit.
+
+Bei Rauschen ist z ~ 1; ein Ziel mit SNR s pro Frame hebt den über K
+Frames gemittelten Score um etwa den Faktor (1 + s), während die
+Schwankung des Rauschens mit K sinkt – die Detektionsschwelle kann pro
+Frame entsprechend niedriger liegen.
+"""
+
+import numpy as np
+from typing import Optional, Sequence, Tuple, Union
+from scipy.ndimage import maximum_filter
+from python_prototype.detection.point_cloud import detections_from_peaks, detections_from_rd_map
+
+
+class TrackBeforeDetect:
+    """
+    Inkrementelle TBD-Integration über die letzten K Range-Profile
+    bzw. Range-Doppler-Maps.
+
+    Beispiel:
+        tbd = TrackBeforeDetect(proc.profile.n_range_bins, n_frames=8, max_step=1)
+        for beat in frames:
+            _, ranges, profile_db = proc.range_fft(beat)
+            tbd.update(profile_db)
+            dets = tbd.detect(ranges, threshold_db=6)
+    """
+
+    def __init__(self, shape: Union[int, Tuple[int, ...]], n_frames: int = 8,
+                 max_step: Union[int, Sequence[int]] = 1, in_db: bool = True):
+        """
+        Args:
+            shape: Form einer Map: n_range_bins oder (n_doppler, n_range)
+            n_frames: Fensterlänge K [Frames]
+            max_step: Maximale Bewegung pro Frame [Bins], skalar oder pro Achse
+            in_db: Eingaben in dB (sonst linearer Leistungsbereich)
+        """
+        shape = (int(shape),) if np.isscalar(shape) else tuple(int(s) for s in shape)
+        if n_frames < 1:
+            raise ValueError("n_frames must be >= 1")
+        steps = np.broadcast_to(np.asarray(max_step, dtype=int), (len(shape),))
+        if np.any(steps < 0):
+            raise ValueError("max_step must be >= 0")
+
+        self.shape = shape
+        self.n_frames = n_frames
+        self.in_db = in_db
+        self.steps = steps.copy()
+        self._footprint = (1,) + tuple(2 * int(s) + 1 for s in steps)
+        # Range-Doppler-Maps: (n_doppler, n_range), Doppler-Achse periodisch
+        self._modes = ('wrap', 'nearest') if len(shape) == 2 else ('nearest',) * len(shape)
+
+        # Teil-Scores: Slot j enthält Bahnen, die im Frame start[j] begonnen haben
+        self._partial = np.zeros((n_frames,) + shape)
+        self._start = np.full(n_frames, -1, dtype=np.int64)
+        self.score = np.zeros(shape)
+        self.n_updates = 0
+
+    @property
+    def ready(self) -> bool:
+        """True, sobald das Fenster einmal voll ist (Score über K Frames)."""
+        return self.n_updates >= self.n_frames
+
+    @property
+    def frames_integrated(self) -> int:
+        return min(self.n_updates, self.n_frames)
+
+    def reset(self) -> None:
+        self._partial[...] = 0.0
+        self._start[...] = -1
+        self.score[...] = 0.0
+        self.n_updates = 0
+
+    def _normalize(self, frame: np.ndarray) -> np.ndarray:
+        frame = np.asarray(frame, dtype=np.float64)
+        if frame.shape != self.shape:
+            raise ValueError(f"Expected map of shape {self.shape}, got {frame.shape}")
+        power = 10 ** (frame / 10) if self.in_db else frame
+        return power / max(np.median(power), np.finfo(float).tiny)
+
+    def update(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Nimmt einen Frame auf und liefert den integrierten Score
+        (mittlere normierte Leistung entlang der besten Bahn, linear).
+
+        Bis zum K-ten Frame wird über alle bisherigen Frames integriert.
+        """
+        z = self._normalize(frame)
+        k = self.n_updates
+
+        # Neue Bahn im Slot der ältesten (jetzt K+1 Frames langen) Bahn
+        slot = k % self.n_frames
+        self._partial[slot] = 0.0
+        self._start[slot] = k
+
+        # Alle Bahnen in einem Filter-Aufruf verlängern (Achse 0 = Slots)
+        maximum_filter(self._partial, size=self._footprint, mode=('nearest',) + self._modes,
+                       output=self._partial)
+        self._partial += z
+
+        oldest = (k + 1) % self.n_frames if k + 1 >= self.n_frames else 0
+        np.divide(self._partial[oldest], k - self._start[oldest] + 1, out=self.score)
+        self.n_updates = k + 1
+        return self.score
+
+    def score_db(self) -> np.ndarray:
+        """Integrierter Score in dB über dem Rauschniveau (0 dB ≈ Rauschen)."""
+        return 10 * np.log10(np.maximum(self.score, np.finfo(float).tiny))
+
+    def detect(self, range_axis: np.ndarray, velocity_axis: Optional[np.ndarray] = None,
+               threshold_db: float = 3.0, max_peaks: Optional[int] = None,
+               frame: int = 0, timestamp: float = np.nan) -> np.ndarray:
+        """
+        Schwelle auf dem integrierten Score relativ zu dessen Median.
+
+        Der Median ist das Niveau der besten reinen Rausch-Bahnen (inkl.
+        des Max-Filter-Bias). Ein lokales CFAR-Fenster wäre ungeeignet: der
+        Max-Filter verschmiert ein Ziel über ±K·max_step Bins in die
+        Trainingszellen. Aus demselben Grund unterdrückt die NMS in diesem
+        Radius. Sie ist ebenfalls ein Max-Filter (Zelle = Maximum ihrer
+        Nachbarschaft), der Aufwand hängt also nur von der Map-Größe ab,
+        nicht von der Zahl der Kandidaten über der Schwelle.
+
+        Args:
+            range_axis: Range-Achse [m]
+            velocity_axis: Doppler-Achse [m/s] (nur für 2D-Maps)
+            threshold_db: Schwelle über dem Median des Scores [dB]
+            max_peaks: Maximale Anzahl Detektionen
+            frame, timestamp: Frame-Nummer und Zeitstempel
+
+        Returns:
+            Detektionen (DETECTION_DTYPE), nach Stärke sortiert; power_db ist
+            der Score in dB (0 dB ≈ Rauschen), snr_db der Abstand zum Median
+        """
+        score = self.score if self.score.ndim == 2 else self.score[None, :]
+        level = np.median(score)
+
+        # Mindestens 3×3, damit auch bei max_step=0 nur lokale Maxima bleiben
+        radius = np.maximum(self.steps * max(self.frames_integrated - 1, 1), 1)
+        if self.score.ndim == 2:
+            size, modes = 2 * radius + 1, self._modes
+        else:
+            size, modes = (1, 2 * radius[0] + 1), ('nearest', 'nearest')
+        strongest = maximum_filter(score, size=tuple(int(s) for s in size), mode=modes)
+        mask = (score > level * 10 ** (threshold_db / 10)) & (score >= strongest)
+        rows, cols = np.nonzero(mask)
+        order = np.argsort(-score[rows, cols], kind='stable')[:max_peaks]
+        rows, cols = rows[order], cols[order]
+
+        score_db = self.score_db()
+        noise_db = 10 * np.log10(max(level, np.finfo(float).tiny))
+        if self.score.ndim == 1:
+            return detections_from_peaks(cols, range_axis, score_db, noise_db,
+                                         frame=frame, timestamp=timestamp)
+        return detections_from_rd_map(rows, cols, score_db, range_axis, velocity_axis,
+                                      noise_db, frame=frame, timestamp=timestamp)
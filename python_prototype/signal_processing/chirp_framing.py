@@ -0,0 +1,209 @@
+# python_prototype/signal_processing/chirp_framing.py
+
+import numpy as np
+from typing import List, Optional
+from scipy.signal import fftconvolve, find_peaks
+from numpy.lib.stride_tricks import as_strided, sliding_window_view
+from python_prototype.waveform.chirp_generator import ChirpGenerator
+
+
+class ChirpFramer:
+    """
+    Zerlegt einen kontinuierlichen ADC-Stream in ausgerichtete Chirp-Frames.
+
+    Chirp-Grenzen werden entweder per Sync-Korrelation gegen den (einmal
+    berechneten) TX-Chirp oder über steigende Flanken eines Trigger-Kanals
+    gefunden. Je n_chirps Chirps wird ein Frame (n_chirps, n_out) ausgegeben;
+    die ersten settle_samples jedes Chirps (Einschwingvorgang der Rampe)
+    werden verworfen.
+
+    Sind die Chirp-Starts eines Frames äquidistant, ist der Frame eine
+    Strided-View auf den internen Puffer (keine Kopie). Bei Jitter werden
+    die Chirps in einen wiederverwendeten Frame-Puffer gesammelt.
+
+    WICHTIG: Ausgegebene Frames sind nur bis zum nächsten push() gültig.
+    """
+
+    def __init__(self, chirp_generator: ChirpGenerator, n_chirps: int,
+                 mode: str = 'correlation', settle_samples: int = 0,
+                 threshold: float = 0.6, min_spacing: Optional[int] = None,
+                 capacity: Optional[int] = None):
+        """
+        Args:
+            chirp_generator: Liefert Chirp-Länge und TX-Referenz
+            n_chirps: Chirps pro Frame
+            mode: 'correlation' (Sync gegen TX-Chirp) oder 'trigger'
+            settle_samples: Verworfene Samples am Anfang jedes Chirps
+            threshold: Korrelation: normierte Schwelle (0..1);
+                       Trigger: Pegel der steigenden Flanke
+            min_spacing: Minimaler Abstand zweier Chirp-Starts [Samples]
+                         (Default: 0.9 * n_samples)
+            capacity: Startgröße des internen Puffers [Samples]
+        """
+        if mode not in ('correlation', 'trigger'):
+            raise ValueError(f"Unknown mode '{mode}' (use 'correlation' or 'trigger')")
+
+        if n_chirps < 1:
+            raise ValueError("n_chirps must be >= 1")
+        self.n_chirps = int(n_chirps)
+        self.n_samples = chirp_generator.n_samples
+        self.settle_samples = int(settle_samples)
+        self.n_out = self.n_samples - self.settle_samples
+        if self.n_out <= 0:
+            raise ValueError(f"settle_samples ({settle_samples}) must be smaller "
+                             f"than n_samples ({self.n_samples})")
+
+        self.mode = mode
+        self.threshold = threshold
+        self.min_spacing = int(min_spacing or 0.9 * self.n_samples)
+
+        # TX-Referenz nur einmal erzeugen (zeitumgekehrt für die Faltung)
+        _, tx, _ = chirp_generator.generate_chirp()
+        self._template_rev = np.ascontiguousarray(tx[::-1])
+        self._template_norm = np.sqrt(np.sum(tx**2))
+
+        capacity = capacity or 4 * self.n_chirps * self.n_samples
+        self._buf = np.empty(capacity)
+        self._sync = np.empty(capacity)
+        self._len = 0               # gültige Samples im Puffer
+        self._offset = 0            # absoluter Index von _buf[0]
+        self._searched = 0          # absoluter Index: bis hier gesucht
+        self._last_start = None     # absoluter Index des letzten Chirp-Starts
+        self._pending: List[int] = []
+        self._gather_pool: List[np.ndarray] = []
+
+        self.frames_emitted = 0
+        self.chirps_found = 0
+
+    # ===== PUFFER-VERWALTUNG =====
+
+    def _append(self, samples: np.ndarray, sync: np.ndarray) -> None:
+        """Verwirft verbrauchte Samples und hängt neue an."""
+        keep_from = max(self._searched - 1, self._offset)
+        if self._pending:
+            keep_from = min(keep_from, self._pending[0])
+        drop = keep_from - self._offset
+        if drop > 0:
+            n_keep = self._len - drop
+            self._buf[:n_keep] = self._buf[drop:self._len]
+            self._sync[:n_keep] = self._sync[drop:self._len]
+            self._len = n_keep
+            self._offset = keep_from
+
+        n_new = len(samples)
+        if self._len + n_new > len(self._buf):
+            capacity = max(2 * len(self._buf), self._len + n_new)
+            for name in ('_buf', '_sync'):
+                grown = np.empty(capacity)
+                grown[:self._len] = getattr(self, name)[:self._len]
+                setattr(self, name, grown)
+
+        self._buf[self._len:self._len + n_new] = samples
+        self._sync[self._len:self._len + n_new] = sync
+        self._len += n_new
+
+    # ===== GRENZ-DETEKTION =====
+
+    def _find_starts(self) -> np.ndarray:
+        """Sucht neue Chirp-Starts (absolute Indizes) im ungesuchten Bereich."""
+        L = self.n_samples
+        end = self._offset + self._len
+        a = max(self._searched - 1, self._offset)
+
+        # Am Stream-Anfang gilt das Sample vor Index 0 als "low" bzw. als
+        # Korrelationsminimum, damit auch ein Chirp ab Sample 0 erkannt wird
+        at_stream_start = self._searched == 0
+
+        if self.mode == 'trigger':
+            seg = self._sync[a - self._offset:self._len]
+            high = seg >= self.threshold
+            if at_stream_start:
+                high = np.concatenate(([False], high))
+                a -= 1
+            starts = np.flatnonzero(high[1:] & ~high[:-1]) + 1 + a
+            self._searched = max(end, self._searched)
+            return starts
+
+        b = end - L                     # letzter vollständiger Startindex
+        if b - a < 2:
+            return np.empty(0, dtype=np.int64)
+
+        seg = self._sync[a - self._offset:b - self._offset + L]
+        corr = fftconvolve(seg, self._template_rev, mode='valid')
+
+        # Normierte Kreuzkorrelation: durch lokale Energie teilen
+        csum = np.concatenate(([0.0], np.cumsum(seg**2)))
+        local_energy = csum[L:] - csum[:-L]
+        ncc = corr / (self._template_norm * np.sqrt(local_energy) + 1e-12)
+
+        if at_stream_start:
+            ncc = np.concatenate(([-2.0], ncc))
+            a -= 1
+        peaks, _ = find_peaks(ncc, height=self.threshold,
+                              distance=self.min_spacing)
+        starts = peaks + a
+        starts = starts[starts >= self._searched]
+        self._searched = b
+        return starts
+
+    # ===== FRAMING =====
+
+    def _frame(self, starts: np.ndarray) -> np.ndarray:
+        """Baut einen Frame aus n_chirps Starts (View wenn äquidistant)."""
+        rel = starts - self._offset + self.settle_samples
+        step = np.diff(rel)
+        itemsize = self._buf.itemsize
+        if len(step) == 0 or np.all(step == step[0]):
+            stride = int(step[0]) if len(step) else self.n_samples
+            base = self._buf[rel[0]:]
+            return as_strided(base, shape=(self.n_chirps, self.n_out),
+                              strides=(stride * itemsize, itemsize),
+                              writeable=False)
+
+        k = self._n_gathered
+        if k == len(self._gather_pool):
+            self._gather_pool.append(np.empty((self.n_chirps, self.n_out)))
+        self._n_gathered += 1
+        windows = sliding_window_view(self._buf[:self._len], self.n_out)
+        return np.take(windows, rel, axis=0, out=self._gather_pool[k])
+
+    def push(self, samples: np.ndarray,
+             sync: Optional[np.ndarray] = None) -> List[np.ndarray]:
+        """
+        Verarbeitet einen neuen Block des Streams.
+
+        Args:
+            samples: Neue ADC-Samples
+            sync: Sync-/Trigger-Kanal gleicher Länge (Default: samples)
+
+        Returns:
+            Liste fertiger Frames (n_chirps, n_out), ggf. leer
+        """
+        samples = np.asarray(samples, dtype=np.float64)
+        if sync is None:
+            if self.mode == 'trigger':
+                raise ValueError("trigger mode requires a sync/trigger channel")
+            sync = samples
+        elif len(sync) != len(samples):
+            raise ValueError("sync channel must have the same length as samples")
+
+        self._append(samples, sync)
+
+        for s in self._find_starts():
+            if self._last_start is not None and s - self._last_start < self.min_spacing:
+                continue
+            self._pending.append(int(s))
+            self._last_start = int(s)
+            self.chirps_found += 1
+
+        frames = []
+        self._n_gathered = 0
+        end = self._offset + self._len
+        while len(self._pending) >= self.n_chirps:
+            starts = np.asarray(self._pending[:self.n_chirps])
+            if starts[-1] + self.n_samples > end:
+                break
+            frames.append(self._frame(starts))
+            del self._pending[:self.n_chirps]
+            self.frames_emitted += 1
+        return frames
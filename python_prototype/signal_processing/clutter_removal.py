@@ -0,0 +1,146 @@
+# python_prototype/signal_processing/clutter_removal.py
+"""
+Clutter-Unterdrückung (statische Ziele) über die Slow-Time-Achse.
+
+Alle Funktionen arbeiten auf Frames der Form (..., n_chirps, n_samples):
+Achse -2 ist die Chirp-Achse (Slow-Time), Achse -1 Fast-Time bzw. Range-Bins.
+Da die Range-FFT linear ist, kann die Stufe wahlweise auf den Beat-Signalen
+(vor range_fft) oder auf komplexen Range-Spektren laufen – NICHT auf
+dB-Profilen.
+"""
+
+import numpy as np
+from typing import Optional
+
+
+def mti_two_pulse(frames: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Zwei-Puls-MTI (Canceller): y[n] = x[n] - x[n-1]
+
+    Returns:
+        Array der Form (..., n_chirps-1, n_samples)
+    """
+    return np.subtract(frames[..., 1:, :], frames[..., :-1, :], out=out)
+
+
+def mti_three_pulse(frames: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Drei-Puls-MTI: y[n] = x[n] - 2 x[n-1] + x[n-2]
+
+    Tiefere Nullstelle bei Doppler 0 als der Zwei-Puls-Canceller.
+
+    Returns:
+        Array der Form (..., n_chirps-2, n_samples)
+    """
+    mid = frames[..., 1:-1, :]
+    out = np.subtract(frames[..., 2:, :], mid, out=out)
+    out -= mid
+    out += frames[..., :-2, :]
+    return out
+
+
+def mean_subtraction(frames: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Zieht pro Range-Bin den Mittelwert über alle Chirps des Frames ab.
+
+    out=frames ist erlaubt (in-place).
+    """
+    mean = frames.mean(axis=-2, keepdims=True)
+    return np.subtract(frames, mean, out=out)
+
+
+class BackgroundSubtractor:
+    """
+    Adaptive Hintergrund-Karte mit exponentieller Mittelung.
+
+    B ← (1 - alpha) · B + alpha · mean_chirps(frame)
+
+    Die Karte wird in-place aktualisiert; subtrahiert wird jeweils der
+    Hintergrund VOR dem Update des aktuellen Frames. Langsam veränderliche
+    Reflektoren (Gebäude, Boden) verschwinden so auch über Frames hinweg.
+    """
+
+    def __init__(self, n_samples: int, alpha: float = 0.05, dtype=np.float64):
+        """
+        Args:
+            n_samples: Anzahl Samples bzw. Range-Bins pro Chirp
+            alpha: Lernrate (0 < alpha <= 1)
+            dtype: Datentyp der Karte (complex für Range-Spektren)
+        """
+        if not 0 < alpha <= 1:
+            raise ValueError(f"alpha must be in (0, 1], got {alpha}")
+        self.alpha = alpha
+        self.background = np.zeros(n_samples, dtype=dtype)
+        self._frame_mean = np.zeros(n_samples, dtype=dtype)
+        self.initialized = False
+
+    def reset(self) -> None:
+        self.background[:] = 0
+        self.initialized = False
+
+    def apply(self, frames: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Args:
+            frames: (n_chirps, n_samples) oder Batch (n_frames, n_chirps, n_samples)
+            out: Optionaler Ausgabepuffer (out=frames erlaubt)
+
+        Returns:
+            Frames ohne Hintergrund, gleiche Form wie die Eingabe
+        """
+        if out is None:
+            out = np.empty(frames.shape, dtype=np.result_type(frames, self.background))
+        # Über Indizes statt reshape: reshape eines nicht zusammenhängenden
+        # out (z.B. Slice eines vorallokierten Würfels) wäre eine Kopie, in
+        # die das Ergebnis verloren geschrieben würde
+        for idx in np.ndindex(frames.shape[:-2]):
+            frame, frame_out = frames[idx], out[idx]
+            np.mean(frame, axis=0, out=self._frame_mean)
+            if not self.initialized:
+                # Erster Frame: Hintergrund direkt übernehmen
+                self.background[:] = self._frame_mean
+                self.initialized = True
+            np.subtract(frame, self.background, out=frame_out)
+            # B += alpha * (mean - B)
+            self._frame_mean -= self.background
+            self._frame_mean *= self.alpha
+            self.background += self._frame_mean
+        return out
+
+
+class ClutterFilter:
+    """
+    Einheitliche Schnittstelle für die Clutter-Unterdrückung.
+
+    Modi:
+        'mti2'       – Zwei-Puls-Canceller (liefert n_chirps-1 Chirps)
+        'mti3'       – Drei-Puls-Canceller (liefert n_chirps-2 Chirps)
+        'mean'       – Mittelwert-Subtraktion pro Bin
+        'background' – exponentiell gemittelte Hintergrund-Karte
+    """
+
+    MODES = ('mti2', 'mti3', 'mean', 'background')
+
+    def __init__(self, mode: str = 'mean', n_samples: Optional[int] = None,
+                 alpha: float = 0.05, dtype=np.float64):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown clutter mode '{mode}', use one of {self.MODES}")
+        if mode == 'background' and n_samples is None:
+            raise ValueError("mode 'background' requires n_samples")
+
+        self.mode = mode
+        self._background = (BackgroundSubtractor(n_samples, alpha, dtype)
+                            if mode == 'background' else None)
+
+    @property
+    def chirp_loss(self) -> int:
+        """Anzahl Chirps, die der Filter pro Frame verbraucht."""
+        return {'mti2': 1, 'mti3': 2}.get(self.mode, 0)
+
+    def apply(self, frames: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        if self.mode == 'mti2':
+            return mti_two_pulse(frames, out)
+        if self.mode == 'mti3':
+            return mti_three_pulse(frames, out)
+        if self.mode == 'mean':
+            return mean_subtraction(frames, out)
+        return self._background.apply(frames, out)
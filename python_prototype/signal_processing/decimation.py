@@ -0,0 +1,103 @@
+# python_prototype/signal_processing/decimation.py
+
+import numpy as np
+from functools import lru_cache
+from scipy.signal import firwin, resample_poly
+from python_prototype.waveform.radar_profile import RadarProfile
+from python_prototype.signal_processing.range_fft import RangeProcessor
+
+
+@lru_cache(maxsize=32)
+def design_antialias_taps(sample_rate: float, decimation: int, f_pass: float,
+                          taps_per_phase: int = 16, beta: float = 8.0) -> np.ndarray:
+    """
+    Entwirft den Anti-Alias-Tiefpass für die Polyphasen-Dezimation.
+
+    Grenzfrequenz liegt in der Mitte zwischen Durchlass (f_pass, max. Beat-
+    Frequenz) und neuer Nyquist-Frequenz fs/(2D). Die Länge ist ein
+    Vielfaches von D, damit jede Polyphasen-Komponente gleich lang ist.
+
+    Returns:
+        FIR-Koeffizienten (read-only, gecacht)
+    """
+    f_nyq_out = sample_rate / (2 * decimation)
+    cutoff = 0.5 * (f_pass + f_nyq_out)
+    n_taps = taps_per_phase * decimation + 1
+    taps = firwin(n_taps, cutoff, window=('kaiser', beta), fs=sample_rate)
+    taps.setflags(write=False)
+    return taps
+
+
+class Decimator:
+    """
+    Polyphasen-Dezimation vor dem RangeProcessor.
+
+    Wird nur ein Range-Bereich bis max_range_m benötigt, reicht eine
+    Abtastrate knapp über 2·f_beat(max_range_m). Die Beat-Signale werden
+    gefiltert und um den Faktor D dezimiert (scipy.signal.resample_poly,
+    batched über alle Chirps). Danach sind FFTs und Puffer D-mal kleiner;
+    Range-Auflösung und Bin-Abstand bleiben gleich.
+    """
+
+    def __init__(self, profile: RadarProfile, max_range_m: float,
+                 margin: float = 1.25, taps_per_phase: int = 16):
+        """
+        Args:
+            profile: Radar-Konfiguration der Eingangsdaten
+            max_range_m: Größte interessierende Entfernung [m]
+            margin: Übergangsbereich: fs_out >= 2 · margin · f_beat_max
+            taps_per_phase: Filterlänge pro Polyphasen-Zweig
+        """
+        if max_range_m > profile.max_range:
+            raise ValueError(f"max_range_m={max_range_m} m exceeds the profile's "
+                             f"max range {profile.max_range:.1f} m")
+        if margin < 1.0:
+            raise ValueError(f"margin must be >= 1, got {margin}")
+
+        f_beat_max = profile.range_to_beat(max_range_m)
+        N = profile.n_samples
+
+        # Größter Faktor, der die Bandbreite erhält und N teilt
+        # (→ ganzzahlige Samples pro Chirp nach der Dezimation)
+        d_max = max(int(profile.sample_rate // (2 * margin * f_beat_max)), 1)
+        decimation = next(d for d in range(d_max, 0, -1) if N % d == 0)
+
+        self.profile = profile
+        self.max_range_m = max_range_m
+        self.f_beat_max = f_beat_max
+        self.decimation = decimation
+        self.output_profile = profile.with_changes(
+            sample_rate=profile.sample_rate / decimation, max_range_m=None)
+        self.taps = design_antialias_taps(profile.sample_rate, decimation,
+                                          f_beat_max, taps_per_phase)
+        self._processor = None
+
+    @property
+    def n_out(self) -> int:
+        return self.profile.n_samples // self.decimation
+
+    @property
+    def processor(self) -> RangeProcessor:
+        """RangeProcessor für die dezimierten Daten (lazy erzeugt)."""
+        if self._processor is None:
+            self._processor = RangeProcessor.from_profile(self.output_profile)
+        return self._processor
+
+    def process(self, beat_signal: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            beat_signal: (..., n_samples) – einzelner Chirp oder Frame
+
+        Returns:
+            Dezimiertes Signal (..., n_samples // D)
+        """
+        if self.decimation == 1:
+            return beat_signal
+        return resample_poly(beat_signal, 1, self.decimation, axis=-1,
+                             window=self.taps)
+
+
+@lru_cache(maxsize=32)
+def get_decimator(profile: RadarProfile, max_range_m: float) -> Decimator:
+    """Gecachter Decimator pro (Profil, Max-Range)."""
+    return Decimator(profile, max_range_m)
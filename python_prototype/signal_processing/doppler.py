@@ -0,0 +1,47 @@
+# python_prototype/signal_processing/doppler.py
+"""
+Range-Doppler-Verarbeitung für ganze Frames.
+
+Range-FFT über die Samples (rfft, nur die n_range_bins positiven Bins),
+danach Doppler-FFT über die Chirps. Beide Schritte laufen über beliebig
+viele Frames auf einmal (führende Batch-Achsen), die Doppler-Achse ist
+fftshift-sortiert wie RadarProfile.velocity_axis.
+"""
+
+import numpy as np
+from python_prototype.waveform.radar_profile import RadarProfile
+from python_prototype.signal_processing.windowing import window_coefficients
+
+
+def range_doppler_map(frames: np.ndarray, profile: RadarProfile,
+                      range_window: str = 'hann', doppler_window: str = 'hann',
+                      in_db: bool = True) -> np.ndarray:
+    """
+    Range-Doppler-Map(s) aus Beat-Frames.
+
+    Args:
+        frames: (..., n_chirps, n_samples) Beat-Signal
+        profile: Radar-Konfiguration (Achsen: range_axis, velocity_axis)
+        range_window, doppler_window: Fenster über Samples bzw. Chirps
+        in_db: 20·log10(|X| + 1e-10) statt komplexem Spektrum
+
+    Returns:
+        (..., n_chirps, n_range_bins) – dB oder komplex
+    """
+    frames = np.asarray(frames)
+    n_chirps, n_samples = frames.shape[-2:]
+    if n_samples != profile.n_samples:
+        raise ValueError(f"Last axis must be n_samples={profile.n_samples}, got {n_samples}")
+
+    spectrum = np.fft.rfft(frames * window_coefficients(range_window, n_samples), axis=-1)
+    spectrum = spectrum[..., :profile.n_range_bins]
+    spectrum *= window_coefficients(doppler_window, n_chirps)[:, None]
+    rd = np.fft.fftshift(np.fft.fft(spectrum, axis=-2), axes=-2)
+    if not in_db:
+        return rd
+
+    rd_db = np.abs(rd)
+    rd_db += 1e-10
+    np.log10(rd_db, out=rd_db)
+    rd_db *= 20
+    return rd_db
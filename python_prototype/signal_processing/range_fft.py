@@ -1,12 +1,91 @@
 # python_prototype/signal_processing/range_fft.py
 
 import numpy as np 
+from collections import OrderedDict
 from typing import Tuple
 from python_prototype.waveform.chirp_generator import ChirpGenerator  
-from scipy.signal import windows
-from scipy.signal import find_peaks
+from python_prototype.waveform.radar_profile import RadarProfile, SPEED_OF_LIGHT
+from python_prototype.signal_processing.range_roi import RoiRangeProcessor
+from python_prototype.signal_processing.windowing import window_coefficients
+from python_prototype.detection.point_cloud import detections_from_peaks
+from python_prototype.detection.cfar_kernels import threshold_peaks
+from python_prototype.utils.profiling import profile_stage
 import warnings
 
+INTEGRATION_MODES = ('noncoherent', 'coherent')
+
+# Maximale Anzahl gecachter ROI-Pläne pro RangeProcessor (LRU)
+_ROI_PLAN_CACHE = 16
+
+
+class RangeIntegrator:
+    """
+    Integration der Range-Spektren vieler Chirps im linearen Bereich.
+
+    Modi:
+        'noncoherent'  Σ|X|² – Leistungsmittel, unabhängig von der Phase;
+                       glättet den Noise-Floor (Varianz ~ 1/N)
+        'coherent'     Σ X   – komplexes Mittel; bei phasenstabilen Zielen
+                       sinkt der Noise-Floor um 10·log10(N) dB
+
+    Die laufende Summe wird in-place aktualisiert; log10 wird nur einmal
+    pro Integrationsintervall in result() berechnet. Das Ergebnis hat die
+    Skalierung von range_fft (ein Chirp ergibt dasselbe Profil).
+
+    Beispiel:
+        integ = RangeIntegrator(profile, mode='coherent')
+        for frame in frames:
+            integ.add(frame)              # (n_chirps, n_samples) oder (n_samples,)
+        _, ranges, profile_db = integ.result(reset=True)
+    """
+
+    def __init__(self, profile: RadarProfile, mode: str = 'noncoherent',
+                 window: str = 'hann'):
+        if mode not in INTEGRATION_MODES:
+            raise ValueError(f"Unknown integration mode '{mode}', use one of {INTEGRATION_MODES}")
+        self.profile = profile
+        self.mode = mode
+        self._window = window_coefficients(window, profile.n_samples)
+        dtype = np.complex128 if mode == 'coherent' else np.float64
+        self._sum = np.zeros(profile.n_range_bins, dtype=dtype)
+        self.n_chirps = 0
+
+    def reset(self) -> None:
+        self._sum[...] = 0
+        self.n_chirps = 0
+
+    def add(self, beat_signal: np.ndarray) -> None:
+        """Addiert einen Chirp (n_samples,) oder beliebig viele (..., n_samples)."""
+        n_bins = self.profile.n_range_bins
+        spectrum = np.fft.rfft(np.asarray(beat_signal) * self._window, axis=-1)
+        spectrum = spectrum[..., :n_bins].reshape(-1, n_bins)
+        if self.mode == 'coherent':
+            self._sum += spectrum.sum(axis=0)
+        else:
+            power = spectrum.real ** 2
+            power += spectrum.imag ** 2
+            self._sum += power.sum(axis=0)
+        self.n_chirps += len(spectrum)
+
+    def result(self, reset: bool = False) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Integriertes Profil (Mittel über alle addierten Chirps).
+
+        Returns:
+            freq_bins, range_bins, range_profile_db
+        """
+        if self.n_chirps == 0:
+            raise ValueError("No chirps integrated yet")
+        if self.mode == 'coherent':
+            profile_db = 20 * np.log10(np.abs(self._sum) / self.n_chirps + 1e-10)
+        else:
+            # sqrt statt 10·log10, damit +1e-10 wie in range_fft wirkt
+            profile_db = 20 * np.log10(np.sqrt(self._sum / self.n_chirps) + 1e-10)
+        if reset:
+            self.reset()
+        return self.profile.freq_axis, self.profile.range_axis, profile_db
+
+
 class RangeProcessor:
     """
     Verarbeitet FMCW Chirps zu Range-Profiles.
@@ -21,6 +100,7 @@ class RangeProcessor:
         """
         # Speichere die Referenz auf den übergebenen Generator
         self.chirp_gen = chirp_generator 
+        self.profile = chirp_generator.profile
         
         # Extrahiere Parameter für spätere Verwendung
         self.f_start = chirp_generator.f_start
@@ -31,10 +111,25 @@ class RangeProcessor:
         self.n_samples = chirp_generator.n_samples
         
         # Konstanten
-        self.c = 3e8  # Lichtgeschwindigkeit [m/s]
+        self.c = SPEED_OF_LIGHT  # Lichtgeschwindigkeit [m/s]
 
+        # ROI-Pläne pro (range_min, range_max, window, method, n_chirps), LRU
+        self._roi_plans = OrderedDict()
 
+        # Optionale Interferenz-Stufe vor dem Fenster (InterferenceMitigator)
+        self.interference = None
+
+        # Integratoren pro (mode, window) für range_fft_integrated
+        self._integrators = {}
+
+    @classmethod
+    def from_profile(cls, profile: RadarProfile) -> "RangeProcessor":
+        """
+        Erzeugt RangeProcessor (inkl. ChirpGenerator) aus einem RadarProfile.
+        """
+        return cls(ChirpGenerator.from_profile(profile))
         
+    @profile_stage()
     def simulate_target(self, range_m: float, rcs: float = 1.0, 
                    velocity_mps: float = 0.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
@@ -89,35 +184,47 @@ class RangeProcessor:
         
         return time, tx_signal, rx_signal
 
+    @profile_stage()
     def mix_signals(self, tx, rx) -> Tuple[np.ndarray]:
         """
         Mischt TX und RX → Beat-Signal. Mixing / Heterodyning 
         """
         return tx * rx
 
+    @profile_stage()
     def apply_window(self, beatsignal, window_type='hann') -> Tuple[np.ndarray] :
         """
         Wendet Fenster-Funktion an. 
         """
         # Erstelle ein Fenster mit der gleichen Länge wie das Signal und
         # multipliziere das Signal damit; gebe das geglättete Signal zurück.
-        win = windows.get_window(window_type, len(beatsignal))
+        # Bei 2D-Eingabe (n_chirps, n_samples) wirkt das Fenster pro Chirp.
+        win = window_coefficients(window_type, np.shape(beatsignal)[-1])
         return beatsignal * win
 
+    @profile_stage()
     def range_fft(self, beat_signal, window='hann') -> Tuple[np.ndarray, np.ndarray] :
         """
         Führt Range-FFT durch.
+
+        beat_signal darf ein einzelner Chirp (n_samples,) oder ein Frame
+        (n_chirps, n_samples) sein; die FFT läuft über die letzte Achse.
         
         Returns:
             range_bins, range_profile_db
         """
-        signalfft=self.apply_window(beat_signal, 'hann')
-        fourier =np.fft.fft(signalfft)
-        magnitude_pos = np.abs(fourier[:self.n_samples//2])
+        if self.interference is not None:
+            beat_signal = self.interference.apply(beat_signal)
+        signalfft=self.apply_window(beat_signal, window)
+        fourier =np.fft.fft(signalfft, axis=-1)
+        magnitude_pos = np.abs(fourier[..., :self.n_samples//2])
         range_profile_db = 20*np.log10(magnitude_pos+ 1e-10)  # +epsilon gegen log(0))
 
-        # freq bins
-        freq = np.fft.fftfreq(len(beat_signal), d=1/self.sample_rate)
+        # freq bins: Standardfall aus dem Profil (einmal berechnet, read-only)
+        if np.shape(beat_signal)[-1] == self.n_samples:
+            return self.profile.freq_axis, self.profile.range_axis, range_profile_db
+
+        freq = np.fft.fftfreq(np.shape(beat_signal)[-1], d=1/self.sample_rate)
         freq_pos=freq[:self.n_samples//2]
 
         #transform frequencies into range
@@ -125,6 +232,57 @@ class RangeProcessor:
         
         return freq_pos, range_bins, range_profile_db 
 
+    @profile_stage()
+    def range_fft_integrated(self, beat_signal, mode='noncoherent',
+                             window='hann') -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Ein Range-Profil aus allen Chirps von beat_signal (..., n_samples),
+        integriert im linearen Bereich (siehe RangeIntegrator).
+
+        Statt range_fft pro Chirp und Mittelung in dB: eine FFT über alle
+        Chirps, laufende Summe, einmal log10.
+
+        Returns:
+            freq_bins, range_bins, range_profile_db (n_range_bins,)
+        """
+        key = (mode, window)
+        integrator = self._integrators.get(key)
+        if integrator is None:
+            integrator = RangeIntegrator(self.profile, mode, window)
+            self._integrators[key] = integrator
+        if self.interference is not None:
+            beat_signal = self.interference.apply(beat_signal)
+        integrator.add(beat_signal)
+        return integrator.result(reset=True)
+
+    @profile_stage()
+    def range_fft_roi(self, beat_signal, range_min: float, range_max: float,
+                      window='hann', method='auto') -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Range-Profil nur für den Bereich [range_min, range_max].
+
+        Wertet nur die benötigten Bins aus (Goertzel / Teil-DFT / Chirp-Z,
+        automatisch nach Kosten gewählt). Bins und Achsen sind identisch
+        zu range_fft.
+
+        Returns:
+            freq_bins, range_bins, range_profile_db (nur ROI)
+        """
+        n_chirps = int(np.prod(np.shape(beat_signal)[:-1]))
+        key = (range_min, range_max, window, method, n_chirps)
+        plan = self._roi_plans.get(key)
+        if plan is None:
+            plan = RoiRangeProcessor(self.profile, range_min, range_max,
+                                     window=window, method=method, n_chirps=n_chirps)
+            self._roi_plans[key] = plan
+            if len(self._roi_plans) > _ROI_PLAN_CACHE:
+                self._roi_plans.popitem(last=False)
+        else:
+            self._roi_plans.move_to_end(key)
+        if self.interference is not None:
+            beat_signal = self.interference.apply(beat_signal)
+        return plan.process(beat_signal)
+
     def freq_to_range(self, freq_hz: np.ndarray) -> np.ndarray:
         """
         Konvertiert Beat-Frequenz zu Range.
@@ -133,12 +291,49 @@ class RangeProcessor:
         """
         return freq_hz * self.c * self.chirp_duration / (2 * self.bandwidth)
         
+    def estimate_noise_floor(self, range_profile: np.ndarray) -> float:
+        """
+        Robuster Noise-Floor: Median des schwächsten Viertels der Bins [dB].
+        """
+        sorted_profile = np.sort(range_profile)
+        return np.median(sorted_profile[:len(sorted_profile)//4])
+
+    @profile_stage()
+    def detect_points(self, range_bins: np.ndarray, range_profile: np.ndarray,
+                      snr_db: float = 20, max_peaks: int = 10,
+                      frame: int = 0, timestamp: float = np.nan) -> np.ndarray:
+        """
+        Peak Detection mit strukturierter Ausgabe (Punktwolke).
+
+        Returns:
+            Structured Array (DETECTION_DTYPE) mit Range, SNR, Leistung,
+            Frame und Zeitstempel – sortiert nach Stärke
+        """
+        peaks = self.detect_peaks(range_profile, snr_db=snr_db, max_peaks=max_peaks)
+        return detections_from_peaks(peaks, range_bins, range_profile,
+                                     self.estimate_noise_floor(range_profile),
+                                     frame=frame, timestamp=timestamp)
+
+    @profile_stage()
     def detect_peaks(self, range_profile: np.ndarray,
                  snr_db: float = 20,
                  max_peaks: int = 10) -> np.ndarray:
         """
-        Robuste Peak Detection mit mehreren Fallback-Strategien.
-        
+        Peak Detection in einem Durchlauf über die Detektions-Kernel
+        (cfar_kernels: lokales Maximum + Schwelle + NMS, optional Numba).
+
+        Schwelle ist noise_floor + snr_db mit dem robusten globalen
+        Noise-Floor (estimate_noise_floor); die NMS unterdrückt schwächere
+        Peaks innerhalb ±2 Bins (Hauptkeule des Hann-Fensters).
+
+        Verhaltensänderung gegenüber der früheren find_peaks-Kaskade
+        (prominence=5 dB, distance=5, Fallbacks ohne Prominenz): es gibt
+        keine Prominenz-Bedingung mehr und Peaks dürfen ab 3 Bins Abstand
+        getrennt gemeldet werden. Jedes Ziel, das die alte Kaskade fand,
+        wird weiterhin gefunden (Regressionstest gegen die Referenz in
+        test_range_fft.py); zusätzlich können dicht benachbarte Ziele oder
+        Nebenkeulen starker Ziele über der Schwelle erscheinen.
+
         Args:
             range_profile: Range-Profile [dB]
             snr_db: Minimum Signal-to-Noise Ratio [dB]
@@ -147,70 +342,9 @@ class RangeProcessor:
         Returns:
             peak_indices: Array von Peak-Indizes (sortiert nach Stärke)
         """
-        from scipy.signal import find_peaks
-        
-        # Schätze Noise Floor (robuste Methode)
-        sorted_profile = np.sort(range_profile)
-        noise_floor = np.median(sorted_profile[:len(sorted_profile)//4])
-        
-        # Adaptive Threshold
+        noise_floor = self.estimate_noise_floor(range_profile)
         threshold = noise_floor + snr_db
-        
-        # DEBUG
-        print(f"\n[Peak Detection]")
-        print(f"  Profile range: [{np.min(range_profile):.1f}, {np.max(range_profile):.1f}] dB")
-        print(f"  Noise floor:   {noise_floor:.1f} dB")
-        print(f"  Threshold:     {threshold:.1f} dB")
-        print(f"  Above thresh:  {np.sum(range_profile > threshold)} bins")
-        
-        # Strategie 1: Mit moderaten Constraints
-        peaks, properties = find_peaks(
-            range_profile,
-            height=threshold,
-            prominence=5,          # Reduziert von 10 → 5 dB
-            distance=5,            # Reduziert von 10 → 5 bins (~3m)
-            width=(1, None)       # Reduziert von 2 → 1 bin
-        )
-        
-        print(f"  Strategy 1 (prominence=5): {len(peaks)} peaks")
-        
-        # Strategie 2: Falls wenig gefunden, lockere weiter
-        if len(peaks) < 2:
-            peaks, _ = find_peaks(
-                range_profile,
-                height=threshold,
-                distance=3  # Nur min. Abstand
-            )
-            print(f"  Strategy 2 (distance=3):   {len(peaks)} peaks")
-        
-        # Strategie 3: Falls immer noch wenig, nur Height
-        if len(peaks) < 1:
-            peaks, _ = find_peaks(
-                range_profile,
-                height=threshold
-            )
-            print(f"  Strategy 3 (height only):  {len(peaks)} peaks")
-        
-        # Strategie 4: Notfall - nimm stärkste Peaks über Threshold
-        if len(peaks) < 1:
-            above_threshold = np.where(range_profile > threshold)[0]
-            if len(above_threshold) > 0:
-                # Sortiere nach Stärke
-                sorted_idx = np.argsort(range_profile[above_threshold])[::-1]
-                peaks = above_threshold[sorted_idx[:max_peaks]]
-                print(f"  Strategy 4 (manual):       {len(peaks)} peaks")
-        
-        # Sortiere nach Stärke und limitiere
-        if len(peaks) > 0:
-            peak_magnitudes = range_profile[peaks]
-            sorted_idx = np.argsort(peak_magnitudes)[::-1]
-            peaks = peaks[sorted_idx]
-            
-            if len(peaks) > max_peaks:
-                peaks = peaks[:max_peaks]
-            
-            print(f"  Final peaks:   {len(peaks)}")
-        else:
-            print(f"  ❌ No peaks found!")
-        
-        return peaks
\ No newline at end of file
+        _, peaks, _ = threshold_peaks(range_profile, threshold, nms_radius=(0, 2))
+        # Randbins sind keine Peaks (wie bei find_peaks)
+        peaks = peaks[(peaks > 0) & (peaks < len(range_profile) - 1)]
+        return peaks[:max_peaks]
\ No newline at end of file
@@ -0,0 +1,169 @@
+# python_prototype/signal_processing/range_roi.py
+
+import numpy as np
+from functools import lru_cache
+from typing import Tuple
+from scipy.fft import next_fast_len
+from scipy.signal import CZT
+from python_prototype.waveform.radar_profile import RadarProfile
+from python_prototype.signal_processing.windowing import window_coefficients
+
+
+METHODS = ('goertzel', 'dft', 'czt', 'fft')
+# Kandidaten für method='auto'. Goertzel läuft hier als Python-Schleife über
+# die Samples und war in Messungen (N = 256…4096, 1…64 Chirps, 1…32 Bins)
+# 50–1000× langsamer als die Teil-DFT; es bleibt nur explizit wählbar
+# (Referenz für die Embedded-Portierung).
+AUTO_METHODS = ('dft', 'czt', 'fft')
+
+
+def estimate_cost(method: str, n_samples: int, n_bins: int, n_chirps: int = 1) -> float:
+    """
+    Geschätzte Kosten für n_chirps Chirps (grobe Operationszahl).
+
+        goertzel: 3·N·K pro Chirp (ohne Python-Schleifen-Overhead)
+        dft:      4·N·K (reelles Signal × komplexe Twiddle-Matrix)
+        czt:      3 FFTs der Länge M = next_fast_len(N + K - 1)
+        fft:      volle FFT der Länge N (danach Auswahl der Bins)
+    """
+    N, K = n_samples, n_bins
+    if method == 'goertzel':
+        return 3.0 * N * K * n_chirps
+    if method == 'dft':
+        return 4.0 * N * K * n_chirps
+    if method == 'czt':
+        M = next_fast_len(N + K - 1)
+        return 3 * 5.0 * M * np.log2(M) * n_chirps
+    if method == 'fft':
+        return 5.0 * N * np.log2(N) * n_chirps
+    raise ValueError(f"Unknown method '{method}', use one of {METHODS}")
+
+
+def choose_method(n_samples: int, n_bins: int, n_chirps: int = 1) -> str:
+    """Wählt die günstigste Methode laut Kostenmodell (aus AUTO_METHODS)."""
+    return min(AUTO_METHODS, key=lambda m: estimate_cost(m, n_samples, n_bins, n_chirps))
+
+
+@lru_cache(maxsize=64)
+def _dft_matrix(n_samples: int, k0: int, k1: int, window_type: str) -> np.ndarray:
+    """Twiddle-Matrix (N, K) inkl. Fenster: X = x @ W"""
+    n = np.arange(n_samples)[:, None]
+    k = np.arange(k0, k1)[None, :]
+    W = np.exp(-2j * np.pi * n * k / n_samples) * window_coefficients(window_type, n_samples)[:, None]
+    W.setflags(write=False)
+    return W
+
+
+@lru_cache(maxsize=64)
+def _czt_plan(n_samples: int, k0: int, k1: int) -> CZT:
+    return CZT(n_samples, k1 - k0, w=np.exp(-2j * np.pi / n_samples),
+               a=np.exp(2j * np.pi * k0 / n_samples))
+
+
+def goertzel_power(x: np.ndarray, bins: np.ndarray) -> np.ndarray:
+    """
+    Goertzel-Bank: |X[k]|² für die angegebenen Bins.
+
+    Vektorisiert über Bins und Chirps, rekursiv über die Samples:
+        s[n] = x[n] + 2cos(ω)·s[n-1] - s[n-2]
+        |X[k]|² = s1² + s2² - 2cos(ω)·s1·s2
+
+    Args:
+        x: Signal (..., N) – bereits gefenstert
+        bins: FFT-Bin-Indizes (K,)
+    """
+    N = x.shape[-1]
+    coeff = 2 * np.cos(2 * np.pi * np.asarray(bins) / N)
+    shape = x.shape[:-1] + (len(bins),)
+    s1 = np.zeros(shape)
+    s2 = np.zeros(shape)
+    s0 = np.empty(shape)
+    for n in range(N):
+        # s0 = x[n] + coeff*s1 - s2  (in-place, keine Zwischen-Arrays)
+        np.multiply(s1, coeff, out=s0)
+        s0 -= s2
+        s0 += x[..., n, None]
+        s1, s2, s0 = s0, s1, s2
+    # Rundungsfehler können minimal negative Werte erzeugen
+    return np.maximum(s1**2 + s2**2 - coeff * s1 * s2, 0.0)
+
+
+class RoiRangeProcessor:
+    """
+    Range-Verarbeitung nur für einen Range-Bereich (Region of Interest).
+
+    Statt alle N/2 Bins per FFT zu berechnen und zu log-skalieren, werden
+    nur die Bins zwischen range_min und range_max ausgewertet – per
+    Goertzel-Bank, Teil-DFT (Matrixprodukt) oder Chirp-Z-Transformation.
+    Die Methode wird automatisch nach Kostenmodell gewählt (Goertzel nur
+    explizit, siehe AUTO_METHODS).
+
+    Die Ausgabe ist bin-genau identisch zu RangeProcessor.range_fft
+    (gleiche Bins, gleiche Achsen aus dem RadarProfile).
+    """
+
+    def __init__(self, profile: RadarProfile, range_min: float, range_max: float,
+                 window: str = 'hann', method: str = 'auto', n_chirps: int = 1):
+        """
+        Args:
+            profile: Radar-Konfiguration
+            range_min, range_max: Range-Bereich [m] (inklusive)
+            window: Fenster-Typ (wie range_fft)
+            method: 'auto', 'goertzel', 'dft', 'czt' oder 'fft'
+            n_chirps: Erwartete Chirps pro Aufruf (für das Kostenmodell)
+        """
+        if range_max < range_min:
+            raise ValueError(f"range_max ({range_max}) < range_min ({range_min})")
+
+        N = profile.n_samples
+        bin_width = profile.sample_rate / N
+        k0 = max(int(np.ceil(profile.range_to_beat(range_min) / bin_width - 1e-9)), 0)
+        k1 = min(int(np.floor(profile.range_to_beat(range_max) / bin_width + 1e-9)) + 1,
+                 profile.n_range_bins)
+        if k1 <= k0:
+            raise ValueError(f"No range bins between {range_min} m and {range_max} m "
+                             f"(resolution {profile.range_resolution:.2f} m, "
+                             f"max range {profile.max_range:.1f} m)")
+
+        self.profile = profile
+        self.window = window
+        self.k0, self.k1 = k0, k1
+        self.bins = np.arange(k0, k1)
+        self.freq_bins = profile.freq_axis[k0:k1]
+        self.range_bins = profile.range_axis[k0:k1]
+
+        if method == 'auto':
+            method = choose_method(N, k1 - k0, n_chirps)
+        elif method not in METHODS:
+            raise ValueError(f"Unknown method '{method}', use one of {METHODS}")
+        self.method = method
+
+    @property
+    def n_bins(self) -> int:
+        return self.k1 - self.k0
+
+    def power(self, beat_signal: np.ndarray) -> np.ndarray:
+        """|X[k]|² der ROI-Bins, Form (..., K)."""
+        N = self.profile.n_samples
+        if self.method == 'dft':
+            # Fenster steckt bereits in der Twiddle-Matrix
+            spectrum = beat_signal @ _dft_matrix(N, self.k0, self.k1, self.window)
+            return spectrum.real**2 + spectrum.imag**2
+
+        xw = beat_signal * window_coefficients(self.window, N)
+        if self.method == 'goertzel':
+            return goertzel_power(xw, self.bins)
+        if self.method == 'czt':
+            spectrum = _czt_plan(N, self.k0, self.k1)(xw, axis=-1)
+        else:
+            spectrum = np.fft.rfft(xw, axis=-1)[..., self.k0:self.k1]
+        return spectrum.real**2 + spectrum.imag**2
+
+    def process(self, beat_signal: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns:
+            freq_bins, range_bins, range_profile_db – wie range_fft, nur ROI
+        """
+        # Gleiche Skalierung und Epsilon wie range_fft → identische dB-Werte
+        magnitude = np.sqrt(self.power(beat_signal))
+        return self.freq_bins, self.range_bins, 20 * np.log10(magnitude + 1e-10)
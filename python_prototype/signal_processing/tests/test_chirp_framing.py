@@ -0,0 +1,108 @@
+"""
+Unit Tests für das Chirp-Framing kontinuierlicher ADC-Streams
+"""
+
+import numpy as np
+import pytest
+from python_prototype.waveform.chirp_generator import ChirpGenerator
+from python_prototype.signal_processing.chirp_framing import ChirpFramer
+
+
+@pytest.fixture
+def gen():
+    return ChirpGenerator(24e9, 250e6, 256e-6, 1e6)
+
+
+def make_stream(gen, n_chirps, gaps, noise=0.01, seed=0):
+    """Chirps mit Idle-Lücken (Jitter) + Rauschen; liefert Stream und Starts"""
+    rng = np.random.default_rng(seed)
+    _, tx, _ = gen.generate_chirp()
+    parts, starts, pos = [], [], 0
+    for k in range(n_chirps):
+        parts.append(np.zeros(gaps[k]))
+        pos += gaps[k]
+        starts.append(pos)
+        parts.append(tx * (k + 1))       # Amplitude kennzeichnet den Chirp
+        pos += len(tx)
+    parts.append(np.zeros(50))
+    stream = np.concatenate(parts)
+    return stream + noise * rng.standard_normal(len(stream)), np.array(starts)
+
+
+def test_correlation_with_jitter(gen):
+    """Test: Chirp-Grenzen werden trotz Jitter exakt gefunden"""
+    gaps = [37, 20, 23, 19, 41, 20, 22, 21]
+    stream, starts = make_stream(gen, 8, gaps)
+
+    framer = ChirpFramer(gen, n_chirps=4)
+    frames = framer.push(stream)
+
+    assert len(frames) == 2
+    for f, frame in enumerate(frames):
+        assert frame.shape == (4, gen.n_samples)
+        for c in range(4):
+            k = 4 * f + c
+            assert np.allclose(frame[c], stream[starts[k]:starts[k] + gen.n_samples])
+
+
+def test_uniform_frames_are_views(gen):
+    """Test: Äquidistante Chirps → Strided-View ohne Kopie"""
+    stream, _ = make_stream(gen, 4, [30, 20, 20, 20], noise=0.0)
+
+    framer = ChirpFramer(gen, n_chirps=4)
+    frame, = framer.push(stream)
+
+    assert np.shares_memory(frame, framer._buf)
+    assert frame.strides == (276 * 8, 8)
+
+
+def test_chunked_stream_matches_single_push(gen):
+    """Test: Stückweises Einspeisen liefert dieselben Frames"""
+    gaps = [11, 25, 18, 30, 22, 17, 29, 24, 20, 26, 19, 21]
+    stream, _ = make_stream(gen, 12, gaps, seed=3)
+
+    reference = [f.copy() for f in ChirpFramer(gen, 3).push(stream)]
+
+    framer = ChirpFramer(gen, 3, capacity=600)
+    chunked = []
+    for block in np.array_split(stream, 17):
+        chunked.extend(f.copy() for f in framer.push(block))
+
+    assert len(chunked) == len(reference) == 4
+    for a, b in zip(chunked, reference):
+        assert np.array_equal(a, b)
+
+
+def test_trigger_mode_with_settle(gen):
+    """Test: Trigger-Flanken + Verwerfen des Einschwingvorgangs"""
+    stream, starts = make_stream(gen, 4, [10, 33, 12, 25], noise=0.0)
+    trigger = np.zeros_like(stream)
+    for s in starts:
+        trigger[s:s + 5] = 1.0
+
+    framer = ChirpFramer(gen, n_chirps=4, mode='trigger', settle_samples=16)
+    frame, = framer.push(stream, sync=trigger)
+
+    assert frame.shape == (4, gen.n_samples - 16)
+    assert np.array_equal(frame[2], stream[starts[2] + 16:starts[2] + gen.n_samples])
+    with pytest.raises(ValueError):
+        framer.push(stream)
+
+
+@pytest.mark.parametrize("mode", ["correlation", "trigger"])
+def test_single_chirp_frames_and_start_at_sample_zero(gen, mode):
+    """Test: n_chirps=1 und ein Chirp direkt ab Sample 0"""
+    stream, starts = make_stream(gen, 3, [0, 20, 31], noise=0.0)
+    trigger = np.zeros_like(stream)
+    for s in starts:
+        trigger[s:s + 5] = 1.0
+
+    framer = ChirpFramer(gen, n_chirps=1, mode=mode)
+    frames = framer.push(stream, sync=trigger if mode == 'trigger' else None)
+
+    assert len(frames) == 3
+    for frame, s in zip(frames, starts):
+        assert frame.shape == (1, gen.n_samples)
+        assert np.array_equal(frame[0], stream[s:s + gen.n_samples])
+    with pytest.raises(ValueError):
+        ChirpFramer(gen, n_chirps=0)
@@ -0,0 +1,85 @@
+"""
+Unit Tests für die Polyphasen-Dezimation vor der Range-FFT
+"""
+
+import numpy as np
+import pytest
+from python_prototype.waveform.radar_profile import load_profile
+from python_prototype.signal_processing.range_fft import RangeProcessor
+from python_prototype.signal_processing.decimation import Decimator, get_decimator
+
+
+@pytest.fixture
+def setup():
+    profile = load_profile('k24_long_range')       # 10 MHz, max ~768 m
+    proc = RangeProcessor.from_profile(profile)
+    return profile, proc
+
+
+def beat_for(proc, targets):
+    rx_total = 0
+    for range_m, rcs in targets:
+        _, tx, rx = proc.simulate_target(range_m, rcs)
+        rx_total = rx_total + rx
+    return proc.mix_signals(tx, rx_total)
+
+
+def test_decimation_factor_and_profile(setup):
+    """Test: Faktor teilt n_samples, Auflösung bleibt erhalten"""
+    profile, _ = setup
+    dec = Decimator(profile, max_range_m=80.0)
+
+    assert dec.decimation > 1
+    assert profile.n_samples % dec.decimation == 0
+    assert dec.output_profile.n_samples == dec.n_out
+    assert dec.output_profile.range_resolution == profile.range_resolution
+    assert dec.output_profile.max_range >= 80.0
+    assert np.allclose(dec.output_profile.range_axis[:5], profile.range_axis[:5])
+
+
+def test_targets_preserved_after_decimation(setup):
+    """Test: Targets im Bereich werden an gleicher Range detektiert"""
+    profile, proc = setup
+    beat = beat_for(proc, [(25.0, 1.0), (60.0, 10.0)])
+    frame = np.tile(beat, (4, 1))
+
+    dec = Decimator(profile, max_range_m=80.0)
+    decimated = dec.process(frame)
+    assert decimated.shape == (4, dec.n_out)
+
+    _, range_bins, profile_db = dec.processor.range_fft(decimated)
+    _, range_full, profile_full = proc.range_fft(beat)
+    floor = np.median(profile_db[0])
+    for target in (25.0, 60.0):
+        k = np.argmin(np.abs(range_bins - target))
+        assert range_bins[k] == range_full[k]
+        assert np.max(profile_db[0, k - 1:k + 2]) > floor + 20
+        # Kohärente FFT-Verstärkung sinkt mit der Sample-Anzahl (Faktor D)
+        assert np.max(profile_db[0, k - 1:k + 2]) == pytest.approx(
+            np.max(profile_full[k - 1:k + 2]) - 20 * np.log10(dec.decimation), abs=1.0)
+
+
+def test_out_of_band_target_rejected(setup):
+    """Test: Ziel jenseits max_range wird gefiltert statt gefaltet (Aliasing)"""
+    profile, proc = setup
+    dec = Decimator(profile, max_range_m=80.0)
+    fs_out = dec.output_profile.sample_rate
+
+    # Beat-Ton knapp oberhalb der neuen Nyquist-Frequenz (würde sonst falten)
+    t = profile.time_axis
+    f_alias = 1.4 * fs_out / 2
+    tone = np.cos(2 * np.pi * f_alias * t)
+    naive = tone[::dec.decimation]
+    filtered = dec.process(tone)
+
+    # Rand-Einschwingen des FIR ausblenden
+    interior = filtered[16:-16]
+    assert np.std(interior) < 1e-3 * np.std(naive)
+
+
+def test_cached_decimator_and_validation(setup):
+    profile, _ = setup
+    assert get_decimator(profile, 80.0) is get_decimator(profile, 80.0)
+    assert get_decimator(profile, 80.0).taps is Decimator(profile, 80.0).taps
+    with pytest.raises(ValueError):
+        Decimator(profile, max_range_m=5000.0)
@@ -0,0 +1,40 @@
+"""
+Unit Tests für die Range-Doppler-Verarbeitung
+"""
+
+import numpy as np
+import pytest
+from python_prototype.waveform.radar_profile import RadarProfile
+from python_prototype.signal_processing.doppler import range_doppler_map
+
+PROFILE = RadarProfile(24e9, 250e6, 64e-6, 1e6, n_chirps=32)
+
+
+def _frame(range_m, velocity_mps):
+    """Beat-Ton mit Doppler-Phasendrehung 4π·v·T/λ von Chirp zu Chirp"""
+    t = PROFILE.time_axis
+    k = np.arange(PROFILE.n_chirps)[:, None]
+    phase = 4 * np.pi * velocity_mps * PROFILE.chirp_duration / PROFILE.wavelength
+    return np.cos(2 * np.pi * PROFILE.range_to_beat(range_m) * t + phase * k)
+
+
+@pytest.mark.parametrize("velocity", [0.0, 12.0, -20.0])
+def test_peak_at_range_and_velocity(velocity):
+    rd = range_doppler_map(_frame(10.0, velocity), PROFILE)
+    assert rd.shape == (PROFILE.n_chirps, PROFILE.n_range_bins)
+    row, col = np.unravel_index(np.argmax(rd), rd.shape)
+    assert abs(PROFILE.range_axis[col] - 10.0) <= PROFILE.range_resolution
+    assert abs(PROFILE.velocity_axis[row] - velocity) <= PROFILE.velocity_resolution
+
+
+def test_batched_frames():
+    frames = np.stack([_frame(5.0, 0.0), _frame(12.0, 8.0)])
+    rd = range_doppler_map(frames, PROFILE)
+    assert rd.shape == (2, PROFILE.n_chirps, PROFILE.n_range_bins)
+    assert np.allclose(rd[1], range_doppler_map(frames[1], PROFILE))
+    assert np.iscomplexobj(range_doppler_map(frames, PROFILE, in_db=False))
+
+
+def test_wrong_sample_count():
+    with pytest.raises(ValueError):
+        range_doppler_map(np.zeros((PROFILE.n_chirps, 10)), PROFILE)
@@ -0,0 +1,77 @@
+"""
+Unit Tests für die Range-ROI-Verarbeitung (Goertzel / Teil-DFT / Chirp-Z)
+"""
+
+import numpy as np
+import pytest
+from python_prototype.waveform.radar_profile import RadarProfile
+from python_prototype.signal_processing.range_fft import RangeProcessor
+from python_prototype.signal_processing.range_roi import (
+    RoiRangeProcessor, choose_method, estimate_cost)
+
+
+@pytest.fixture
+def setup():
+    profile = RadarProfile(24e9, 250e6, 256e-6, 1e6, n_chirps=8)
+    proc = RangeProcessor.from_profile(profile)
+    rx_total = 0
+    for range_m, rcs in [(12.0, 0.1), (40.0, 1.0), (65.0, 1.0)]:
+        time, tx, rx = proc.simulate_target(range_m, rcs)
+        rx_total = rx_total + rx
+    beat = proc.mix_signals(tx, rx_total)
+    rng = np.random.default_rng(0)
+    frame = beat + 1e-12 * rng.standard_normal((8, profile.n_samples))
+    return profile, proc, frame
+
+
+@pytest.mark.parametrize("method", ['goertzel', 'dft', 'czt', 'fft'])
+def test_roi_matches_full_fft(setup, method):
+    """Test: ROI-Bins identisch zum entsprechenden Ausschnitt der Range-FFT"""
+    profile, proc, frame = setup
+    _, range_full, profile_full = proc.range_fft(frame)
+
+    roi = RoiRangeProcessor(profile, 5.0, 50.0, method=method)
+    freq_bins, range_bins, profile_db = roi.process(frame)
+
+    sl = slice(roi.k0, roi.k1)
+    assert np.array_equal(range_bins, range_full[sl])
+    assert range_bins[0] >= 5.0 and range_bins[-1] <= 50.0
+    assert profile_db.shape == (8, roi.n_bins)
+    assert np.allclose(profile_db, profile_full[:, sl], atol=1e-6)
+
+
+def test_roi_peak_location(setup):
+    """Test: Target bei 40m ist stärkster Bin im ROI 30..60m"""
+    profile, proc, frame = setup
+    _, range_bins, profile_db = proc.range_fft_roi(frame[0], 30.0, 60.0)
+    assert abs(range_bins[np.argmax(profile_db)] - 40.0) < profile.range_resolution
+
+
+def test_roi_plan_cache_is_bounded(setup):
+    """Test: Wechselnde ROIs (z.B. Tracking-Fenster) füllen den Cache nicht unbegrenzt"""
+    _, proc, frame = setup
+    proc.range_fft_roi(frame[0], 30.0, 60.0)
+    for k in range(40):
+        proc.range_fft_roi(frame[0], 5.0 + k * 0.5, 20.0 + k * 0.5)
+        proc.range_fft_roi(frame[0], 30.0, 60.0)      # häufig benutzt → bleibt
+    assert len(proc._roi_plans) <= 16
+    assert (30.0, 60.0, 'hann', 'auto', 1) in proc._roi_plans
+
+
+def test_auto_method_by_cost():
+    """Test: Wenige Bins → Teil-DFT, viele Bins → volle FFT"""
+    assert choose_method(256, 3, n_chirps=64) == 'dft'
+    assert choose_method(4096, 2000, n_chirps=64) == 'fft'
+    # Goertzel (Python-Schleife) wird nie automatisch gewählt
+    assert all(choose_method(n, k, c) != 'goertzel'
+               for n in (64, 256, 4096) for k in (1, 2) for c in (1, 64))
+    with pytest.raises(ValueError):
+        estimate_cost('wavelet', 256, 4)
+
+
+def test_invalid_roi():
+    profile = RadarProfile(24e9, 250e6, 256e-6, 1e6)
+    with pytest.raises(ValueError):
+        RoiRangeProcessor(profile, 100.0, 200.0)      # jenseits max_range
+    with pytest.raises(ValueError):
+        RoiRangeProcessor(profile, 50.0, 10.0)
@@ -0,0 +1,71 @@
+"""
+Unit Tests für den allokationsfreien RangeWorkspace
+"""
+
+import tracemalloc
+import numpy as np
+import pytest
+from scipy.signal import windows
+from python_prototype.waveform.radar_profile import RadarProfile
+from python_prototype.signal_processing.range_fft import RangeProcessor
+from python_prototype.signal_processing.workspace import _FFT_HAS_OUT, RangeWorkspace
+from python_prototype.signal_processing.windowing import window_coefficients
+
+
+@pytest.fixture
+def profile():
+    return RadarProfile(24e9, 250e6, 256e-6, 1e6)
+
+
+def _signals(profile, n_chirps):
+    proc = RangeProcessor.from_profile(profile)
+    _, tx, rx = proc.simulate_target(40.0, rcs=1.0)
+    rng = np.random.default_rng(0)
+    rx = rx + 1e-9 * rng.standard_normal((n_chirps, profile.n_samples))
+    return proc, np.broadcast_to(tx, rx.shape), rx
+
+
+@pytest.mark.parametrize("n_chirps", [1, 8])
+def test_matches_range_processor(profile, n_chirps):
+    proc, tx, rx = _signals(profile, n_chirps)
+    ws = RangeWorkspace(profile, rx.shape)
+
+    freq, ranges, db = ws.process_signals(tx, rx)
+    freq_ref, ranges_ref, db_ref = proc.range_fft(proc.mix_signals(tx, rx))
+
+    assert np.array_equal(freq, freq_ref) and np.array_equal(ranges, ranges_ref)
+    assert np.allclose(db, db_ref, atol=1e-6)
+    assert np.shares_memory(db, ws.profile_db)
+
+
+@pytest.mark.skipif(not _FFT_HAS_OUT, reason="rfft(out=...) requires NumPy >= 2.0")
+def test_steady_state_allocates_nothing(profile):
+    _, tx, rx = _signals(profile, 16)
+    ws = RangeWorkspace(profile, rx.shape)
+    ws.process_signals(tx, rx)                 # Warm-up (FFT-Plan, Caches)
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        for _ in range(20):
+            ws.process_signals(tx, rx)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # Ein Frame-Array wären 16·256·8 = 32 kB; erlaubt sind nur Python-Kleinkram
+    assert peak - start < 4096
+    assert current - start < 1024
+
+
+def test_rejects_wrong_frame_shape(profile):
+    with pytest.raises(ValueError, match="n_samples"):
+        RangeWorkspace(profile, (4, 100))
+
+
+def test_window_coefficients_shared_and_read_only():
+    win = window_coefficients('hann', 64)
+    assert win is window_coefficients('hann', 64)
+    assert not win.flags.writeable
+    assert np.array_equal(win, windows.get_window('hann', 64))
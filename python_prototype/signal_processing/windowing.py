@@ -0,0 +1,28 @@
+# python_prototype/signal_processing/windowing.py
+"""
+Gemeinsamer Cache für Fensterfunktionen.
+
+Range-, ROI- und Doppler-Verarbeitung brauchen pro Frame dieselben wenigen
+Fenster (Typ, Länge); sie werden einmal berechnet und read-only geteilt.
+"""
+
+import numpy as np
+from functools import lru_cache
+from scipy.signal import windows
+
+
+@lru_cache(maxsize=64)
+def window_coefficients(window_type: str, n: int) -> np.ndarray:
+    """
+    Fensterkoeffizienten (wie scipy.signal.get_window), gecacht.
+
+    Args:
+        window_type: Fenster-Typ, z.B. 'hann', 'hamming', 'blackman'
+        n: Fensterlänge [Samples]
+
+    Returns:
+        Read-only Array der Länge n (geteilt – nicht verändern)
+    """
+    win = windows.get_window(window_type, n)
+    win.setflags(write=False)
+    return win
@@ -0,0 +1,123 @@
+# python_prototype/signal_processing/workspace.py
+"""
+Vorallokierter Arbeitsbereich für die Range-Kette.
+
+mix_signals → apply_window → range_fft erzeugen pro Aufruf neue Arrays
+(Produkt, gefenstertes Signal, FFT, Betrag, Log, Frequenzachse). Der
+RangeWorkspace besitzt alle Zwischenpuffer und rechnet mit out=-Semantik:
+im eingeschwungenen Zustand wird pro Frame kein Speicher allokiert.
+Einschränkung: np.fft.rfft(out=...) gibt es erst ab NumPy 2.0; mit
+NumPy 1.x entsteht pro Frame weiterhin ein temporäres Spektrum.
+
+Die Ergebnisse sind Views auf die internen Puffer und nur bis zum
+nächsten Aufruf gültig (bei Bedarf kopieren).
+"""
+
+import numpy as np
+from typing import Tuple
+from python_prototype.waveform.radar_profile import RadarProfile
+from python_prototype.signal_processing.windowing import window_coefficients
+
+# np.fft.rfft(out=...) gibt es erst ab NumPy 2.0
+_FFT_HAS_OUT = np.lib.NumpyVersion(np.__version__) >= '2.0.0'
+
+
+class RangeWorkspace:
+    """
+    Allokationsfreie Range-Verarbeitung für eine feste Frame-Form.
+
+    Ergebnisse entsprechen RangeProcessor.mix_signals / apply_window /
+    range_fft (positive Bins, 20·log10(|X| + 1e-10)).
+
+    Beispiel:
+        ws = RangeWorkspace(profile, (profile.n_chirps, profile.n_samples))
+        for tx, rx in frames:
+            freq, ranges, profile_db = ws.process_signals(tx, rx)
+    """
+
+    def __init__(self, profile: RadarProfile, frame_shape: Tuple[int, ...] = None,
+                 window: str = 'hann'):
+        """
+        Args:
+            profile: Radar-Konfiguration
+            frame_shape: (..., n_samples); Standard: ein Chirp (n_samples,)
+            window: Fenster-Typ
+        """
+        if frame_shape is None:
+            frame_shape = (profile.n_samples,)
+        frame_shape = tuple(int(s) for s in frame_shape)
+        if frame_shape[-1] != profile.n_samples:
+            raise ValueError(f"Last axis of frame_shape must be n_samples="
+                             f"{profile.n_samples}, got {frame_shape[-1]}")
+
+        N = profile.n_samples
+        n_bins = profile.n_range_bins
+        batch = frame_shape[:-1]
+
+        self.profile = profile
+        self.frame_shape = frame_shape
+        # Fenster auf volle Frame-Form ausgerollt: gebroadcastete Operanden
+        # lassen NumPy pro Aufruf einen Iterator-Puffer (bis 64 kB) anlegen
+        self.window = np.ascontiguousarray(np.broadcast_to(window_coefficients(window, N), frame_shape))
+        self._tx = np.empty(frame_shape)
+        self.beat = np.empty(frame_shape)
+        self.windowed = np.empty(frame_shape)
+        self.spectrum = np.empty(batch + (N // 2 + 1,), dtype=np.complex128)
+        # Betrag/dB über alle N/2+1 rfft-Bins (zusammenhängend, ohne
+        # Iterator-Puffer); ausgegeben wird die View auf die N/2 Range-Bins
+        self._db_full = np.empty(batch + (N // 2 + 1,))
+        self.profile_db = self._db_full[..., :n_bins]
+
+    @property
+    def nbytes(self) -> int:
+        """Gesamtgröße aller Puffer [Byte]."""
+        return sum(a.nbytes for a in (self.window, self._tx, self.beat, self.windowed,
+                                      self.spectrum, self._db_full))
+
+    def _is_frame(self, x) -> bool:
+        return (isinstance(x, np.ndarray) and x.shape == self.frame_shape
+                and x.flags.c_contiguous)
+
+    def mix(self, tx: np.ndarray, rx: np.ndarray) -> np.ndarray:
+        """
+        Beat-Signal tx · rx in den internen Puffer.
+
+        tx/rx dürfen gebroadcastet werden (z.B. ein TX-Chirp für alle
+        Chirps); sie werden dann zuerst in einen zusammenhängenden
+        Frame-Puffer kopiert.
+        """
+        if not self._is_frame(tx):
+            np.copyto(self._tx, tx)
+            tx = self._tx
+        if not self._is_frame(rx):
+            np.copyto(self.beat, rx)
+            rx = self.beat
+        return np.multiply(tx, rx, out=self.beat)
+
+    def apply_window(self, beat_signal: np.ndarray) -> np.ndarray:
+        return np.multiply(beat_signal, self.window, out=self.windowed)
+
+    def range_fft(self, beat_signal: np.ndarray
+                  ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns:
+            freq_bins, range_bins, range_profile_db (Achsen aus dem Profil,
+            read-only; Profil = View auf den Workspace)
+        """
+        windowed = self.apply_window(beat_signal)
+        if _FFT_HAS_OUT:
+            np.fft.rfft(windowed, axis=-1, out=self.spectrum)
+        else:  # pragma: no cover - NumPy < 2.0: ein Spektrum pro Frame
+            self.spectrum[...] = np.fft.rfft(windowed, axis=-1)
+
+        out = self._db_full
+        np.abs(self.spectrum, out=out)
+        out += 1e-10
+        np.log10(out, out=out)
+        out *= 20
+        return self.profile.freq_axis, self.profile.range_axis, self.profile_db
+
+    def process_signals(self, tx: np.ndarray, rx: np.ndarray
+                        ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Komplette Kette: Mischen → Fenster → FFT → dB."""
+        return self.range_fft(self.mix(tx, rx))
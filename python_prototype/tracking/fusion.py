@@ -0,0 +1,281 @@
+# python_prototype/tracking/fusion.py
+"""
+Fusion der Detektionen mehrerer Radar-Knoten zu einem Lagebild.
+
+Jeder Knoten verarbeitet seine Daten selbstständig (eigener Prozess oder
+Rechner) und liefert nur Detektionen (DETECTION_DTYPE, Zeitstempel in
+Knoten-Zeit). Die Fusionszentrale
+
+    1. richtet die Zeit aus (SensorPose.time_offset_s → gemeinsame Zeit),
+    2. transformiert in ein gemeinsames x/y-Koordinatensystem (Pose),
+    3. ordnet die Messungen eines Zeitfensters in zeitlicher Reihenfolge
+       per KD-Tree den prädizierten Tracks zu, mittelt pro Track und
+       Zeitstempel leistungsgewichtet über alle Knoten und aktualisiert mit
+       einem Alpha-Beta-Filter,
+    4. bündelt übrige Messungen desselben Zeitstempels (auch
+       knotenübergreifend) zu neuen Tracks, denen spätere Zeitstempel
+       bereits zugeordnet werden.
+
+Die Schritte 3 und 4 sind innerhalb eines Zeitstempels über Messungen und
+Tracks vektorisiert. Die Zeitstempel selbst werden nacheinander verarbeitet
+(jedes Update prädiziert vom vorherigen aus), eine Python-Iteration pro
+Zeitstempel und nicht pro Messung: Aufwand O(G · T + M log T) bei G
+Zeitstempeln, M Messungen und T Tracks, statt Knoten × Detektionen × Tracks.
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import cKDTree
+
+TRACK_DTYPE = np.dtype([
+    ('track_id', np.int64),
+    ('time', np.float64),        # Zeit der letzten Aktualisierung (gemeinsame Zeit)
+    ('x', np.float64),
+    ('y', np.float64),
+    ('vx', np.float64),
+    ('vy', np.float64),
+    ('power_db', np.float32),
+    ('hits', np.int32),
+    ('sensors', np.int64),       # Bitmaske der beitragenden Knoten
+])
+
+# Messungen, deren Zeitstempel näher als _TIME_EPS beieinander liegen, gelten
+# als gleichzeitig (eine Update-Gruppe, keine Geschwindigkeitsschätzung) [s]
+_TIME_EPS = 1e-6
+
+
+@dataclass(frozen=True)
+class SensorPose:
+    """
+    Einbaulage eines Radar-Knotens im gemeinsamen Koordinatensystem.
+
+    Attributes:
+        x, y: Position [m]
+        yaw_deg: Blickrichtung (Boresight) gegen die x-Achse [°]
+        time_offset_s: Knoten-Zeit + Offset = gemeinsame Zeit [s]
+    """
+    x: float = 0.0
+    y: float = 0.0
+    yaw_deg: float = 0.0
+    time_offset_s: float = 0.0
+
+    def to_common_frame(self, detections: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Detektionen → gemeinsame Zeit und x/y-Position.
+
+        Fehlt der Winkel (Einzelantenne, angle_deg = NaN), wird die
+        Detektion auf die Boresight-Achse gelegt.
+
+        Returns:
+            times (n,), positions (n, 2)
+        """
+        angle = np.nan_to_num(detections['angle_deg'].astype(np.float64), nan=0.0)
+        theta = np.deg2rad(self.yaw_deg + angle)
+        r = detections['range_m'].astype(np.float64)
+        positions = np.empty((len(detections), 2))
+        positions[:, 0] = self.x + r * np.cos(theta)
+        positions[:, 1] = self.y + r * np.sin(theta)
+        return detections['timestamp'] + self.time_offset_s, positions
+
+
+class FusionCenter:
+    """
+    Führt die Detektionsströme von N Knoten zu einem Track-Bild zusammen.
+
+    Beispiel:
+        fusion = FusionCenter({0: SensorPose(0, 0, 45), 1: SensorPose(20, 0, 135)})
+        fusion.ingest(0, dets_node0)
+        fusion.ingest(1, dets_node1)
+        tracks = fusion.step(t_now)
+    """
+
+    def __init__(self, poses: Dict[int, SensorPose], gate_m: float = 3.0,
+                 merge_m: float = 2.0, alpha: float = 0.5, beta: float = 0.2,
+                 max_age_s: float = 1.0, latency_s: float = 0.0):
+        """
+        Args:
+            poses: Pose pro Knoten-ID (0..62, wegen Sensor-Bitmaske)
+            gate_m: Zuordnungsradius Messung ↔ prädizierter Track [m]
+            merge_m: Radius, in dem neue Messungen zu einem Objekt gebündelt werden
+            alpha, beta: Alpha-Beta-Filter-Gewichte (Position, Geschwindigkeit)
+            max_age_s: Tracks ohne Update länger als max_age_s werden gelöscht
+            latency_s: Wartezeit auf verspätete Knoten; step(t) fusioniert
+                       nur Messungen bis t - latency_s
+        """
+        if any(not 0 <= node < 63 for node in poses):
+            raise ValueError("node ids must be in 0..62")
+        self.poses = dict(poses)
+        self.gate_m = gate_m
+        self.merge_m = merge_m
+        self.alpha, self.beta = alpha, beta
+        self.max_age_s = max_age_s
+        self.latency_s = latency_s
+
+        self.tracks = np.zeros(0, dtype=TRACK_DTYPE)
+        self._next_id = 0
+        # Eingangspuffer: Spalten (Zeit, x, y, Leistung, Knoten)
+        self._pending = []
+
+    def ingest(self, node_id: int, detections: np.ndarray) -> None:
+        """Nimmt die Detektionen eines Knotens entgegen (beliebige Reihenfolge)."""
+        if len(detections) == 0:
+            return
+        pose = self.poses[node_id]
+        times, positions = pose.to_common_frame(detections)
+        block = np.empty((len(detections), 5))
+        block[:, 0] = times
+        block[:, 1:3] = positions
+        block[:, 3] = detections['power_db']
+        block[:, 4] = node_id
+        self._pending.append(block)
+
+    def _take_pending(self, t_until: float) -> np.ndarray:
+        if not self._pending:
+            return np.empty((0, 5))
+        pending = np.concatenate(self._pending)
+        ready = pending[:, 0] <= t_until
+        rest = pending[~ready]
+        self._pending = [rest] if len(rest) else []
+        batch = pending[ready]
+        return batch[np.argsort(batch[:, 0], kind='stable')]
+
+    def step(self, t: float) -> np.ndarray:
+        """
+        Fusioniert alle Messungen bis t - latency_s.
+
+        Returns:
+            Aktuelles Track-Array (TRACK_DTYPE), Positionen zur Zeit der
+            letzten Aktualisierung
+        """
+        t_fuse = t - self.latency_s
+        meas = self._take_pending(t_fuse)
+        if len(meas):
+            self._update_tracks(meas)
+        self._drop_stale(t_fuse)
+        return self.tracks
+
+    def predict(self, t: float) -> np.ndarray:
+        """Track-Positionen zur Zeit t (konstante Geschwindigkeit), (T, 2)."""
+        dt = t - self.tracks['time']
+        return np.stack((self.tracks['x'] + self.tracks['vx'] * dt,
+                         self.tracks['y'] + self.tracks['vy'] * dt), axis=1)
+
+    def _update_tracks(self, meas: np.ndarray) -> None:
+        """
+        Zuordnung, Update und Track-Start in zeitlicher Reihenfolge (meas
+        ist nach Zeit sortiert).
+
+        Gleichzeitige Messungen (innerhalb _TIME_EPS) werden gemeinsam
+        verarbeitet. Nicht zugeordnete Messungen starten sofort neue Tracks,
+        spätere Zeitstempel prädizieren von den bereits aktualisierten bzw.
+        neuen Tracks aus (ein bewegtes Ziel über mehrere Frames ergibt einen
+        Track mit Geschwindigkeit, nicht einen gemittelten pro Fenster).
+        """
+        bounds = np.flatnonzero(np.diff(meas[:, 0]) > _TIME_EPS) + 1
+        for lo, hi in zip(np.r_[0, bounds], np.r_[bounds, len(meas)]):
+            group = meas[lo:hi]
+            if len(self.tracks):
+                group = group[self._update_group(group)]
+            self._start_tracks(group)
+
+    def _update_group(self, meas: np.ndarray) -> np.ndarray:
+        """
+        Update mit gleichzeitigen Messungen.
+
+        Pro Track gilt für dt = t_Messung - t_Track:
+            dt > _TIME_EPS:   Alpha-Beta-Update (Position und Geschwindigkeit)
+            |dt| <= _TIME_EPS: nur Position (keine Basis für eine Geschwindigkeit)
+            dt < -_TIME_EPS:  veraltete Messung (out-of-order), verworfen; sie
+                              gilt als zugeordnet und startet keinen neuen Track
+        """
+        n_tracks = len(self.tracks)
+        t_meas = meas[:, 0].mean()
+        predicted = self.predict(t_meas)
+        dist, idx = cKDTree(predicted).query(meas[:, 1:3], distance_upper_bound=self.gate_m)
+        assigned = np.isfinite(dist)
+        if not assigned.any():
+            return ~assigned
+
+        # Leistungsgewichtetes Mittel aller Messungen pro Track (alle Knoten)
+        k = idx[assigned]
+        m = meas[assigned]
+        w = 10 ** (m[:, 3] / 10)
+        w_sum = np.bincount(k, w, minlength=n_tracks)
+        dt_all = t_meas - self.tracks['time']
+        updated = (w_sum > 0) & (dt_all >= -_TIME_EPS)
+        z = np.stack([np.bincount(k, w * m[:, c], minlength=n_tracks) for c in (1, 2)],
+                     axis=1)[updated] / w_sum[updated, None]
+        sensors = np.zeros(n_tracks, dtype=np.int64)
+        np.bitwise_or.at(sensors, k, (1 << m[:, 4].astype(np.int64)))
+
+        tr = self.tracks[updated]
+        dt = np.maximum(dt_all[updated], 0.0)
+        moving = dt > _TIME_EPS
+        px = tr['x'] + tr['vx'] * dt
+        py = tr['y'] + tr['vy'] * dt
+        rx, ry = z[:, 0] - px, z[:, 1] - py
+        tr['x'] = px + self.alpha * rx
+        tr['y'] = py + self.alpha * ry
+        tr['vx'][moving] += self.beta * rx[moving] / dt[moving]
+        tr['vy'][moving] += self.beta * ry[moving] / dt[moving]
+        tr['time'] = np.maximum(tr['time'], t_meas)
+        tr['power_db'] = 10 * np.log10(w_sum[updated])
+        tr['hits'] += 1
+        tr['sensors'] = sensors[updated]
+        self.tracks[updated] = tr
+        return ~assigned
+
+    def _start_tracks(self, meas: np.ndarray) -> None:
+        """Bündelt nicht zugeordnete Messungen (knotenübergreifend) zu neuen Tracks."""
+        if len(meas) == 0:
+            return
+        pairs = cKDTree(meas[:, 1:3]).query_pairs(self.merge_m, output_type='ndarray')
+        graph = coo_matrix((np.ones(len(pairs)), (pairs[:, 0], pairs[:, 1])),
+                           shape=(len(meas), len(meas)))
+        n_new, labels = connected_components(graph, directed=False)
+
+        w = 10 ** (meas[:, 3] / 10)
+        w_sum = np.bincount(labels, w, minlength=n_new)
+        centroid = np.stack([np.bincount(labels, w * meas[:, c], minlength=n_new)
+                             for c in (0, 1, 2)], axis=1) / w_sum[:, None]
+        sensors = np.zeros(n_new, dtype=np.int64)
+        np.bitwise_or.at(sensors, labels, (1 << meas[:, 4].astype(np.int64)))
+
+        new = np.zeros(n_new, dtype=TRACK_DTYPE)
+        new['track_id'] = np.arange(self._next_id, self._next_id + n_new)
+        new['time'] = centroid[:, 0]
+        new['x'] = centroid[:, 1]
+        new['y'] = centroid[:, 2]
+        new['power_db'] = 10 * np.log10(w_sum)
+        new['hits'] = 1
+        new['sensors'] = sensors
+        self._next_id += n_new
+        self.tracks = np.concatenate((self.tracks, new))
+
+    def _drop_stale(self, t: float) -> None:
+        if len(self.tracks):
+            self.tracks = self.tracks[t - self.tracks['time'] <= self.max_age_s]
+
+    def confirmed(self, min_hits: int = 3) -> np.ndarray:
+        """Tracks mit mindestens min_hits Updates."""
+        return self.tracks[self.tracks['hits'] >= min_hits]
+
+    def run(self, streams: Iterable[Tuple[float, int, np.ndarray]],
+            frame_period: float) -> Iterable[Tuple[float, np.ndarray]]:
+        """
+        Verarbeitet einen zeitlich sortierten Strom (t, node_id, detections)
+        und liefert alle frame_period Sekunden (t, tracks).
+        """
+        t_next: Optional[float] = None
+        for t, node_id, detections in streams:
+            if t_next is None:
+                t_next = t + frame_period
+            while t >= t_next:
+                yield t_next, self.step(t_next).copy()
+                t_next += frame_period
+            self.ingest(node_id, detections)
+        if t_next is not None:
+            yield t_next, self.step(t_next).copy()
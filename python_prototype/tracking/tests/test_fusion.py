@@ -0,0 +1,126 @@
+"""
+Unit Tests für die Multi-Radar-Fusion
+"""
+
+import numpy as np
+import pytest
+from python_prototype.detection.point_cloud import empty_detections
+from python_prototype.tracking.fusion import FusionCenter, SensorPose
+
+POSES = {0: SensorPose(0.0, 0.0, 45.0), 1: SensorPose(40.0, 0.0, 135.0, time_offset_s=0.5)}
+
+
+def _observe(pose: SensorPose, points: np.ndarray, t_common: float, power_db=-120.0):
+    """Ideale Detektionen eines Knotens (Zeitstempel in Knoten-Zeit)."""
+    d = points - [pose.x, pose.y]
+    dets = empty_detections(len(points))
+    dets['range_m'] = np.hypot(d[:, 0], d[:, 1])
+    dets['angle_deg'] = np.rad2deg(np.arctan2(d[:, 1], d[:, 0])) - pose.yaw_deg
+    dets['timestamp'] = t_common - pose.time_offset_s
+    dets['power_db'] = power_db
+    return dets
+
+
+def _targets(t):
+    return np.array([[10.0 + 2.0 * t, 20.0], [30.0, 25.0 - 1.0 * t]])
+
+
+def test_common_frame_roundtrip():
+    points = np.array([[12.0, 7.0], [30.0, 30.0]])
+    for pose in POSES.values():
+        times, xy = pose.to_common_frame(_observe(pose, points, 3.0))
+        assert np.allclose(xy, points, atol=1e-4)
+        assert np.allclose(times, 3.0)
+
+
+def test_two_sensors_one_track_per_target():
+    fusion = FusionCenter(POSES, gate_m=3.0)
+    period = 0.1
+    for k in range(30):
+        t = k * period
+        for node, pose in POSES.items():
+            fusion.ingest(node, _observe(pose, _targets(t), t))
+        tracks = fusion.step(t)
+
+    assert len(tracks) == 2
+    assert np.all(tracks['sensors'] == 0b11)
+    order = np.argsort(tracks['x'])
+    t_end = 29 * period
+    est = np.stack((tracks['x'], tracks['y']), axis=1)[order]
+    assert np.allclose(est, _targets(t_end), atol=0.5)
+    vel = np.stack((tracks['vx'], tracks['vy']), axis=1)[order]
+    assert np.allclose(vel, [[2.0, 0.0], [0.0, -1.0]], atol=0.3)
+    assert len(fusion.confirmed(min_hits=10)) == 2
+
+
+def test_latency_waits_for_late_node():
+    fusion = FusionCenter(POSES, latency_s=0.2)
+    fusion.ingest(0, _observe(POSES[0], _targets(1.0), 1.0))
+    assert len(fusion.step(1.1)) == 0            # noch im Latenzfenster
+    assert len(fusion.step(1.2)) == 2
+
+
+def test_stale_tracks_are_dropped():
+    fusion = FusionCenter(POSES, max_age_s=0.5)
+    fusion.ingest(0, _observe(POSES[0], _targets(0.0), 0.0))
+    assert len(fusion.step(0.0)) == 2
+    assert len(fusion.step(1.0)) == 0
+
+
+def test_equal_and_out_of_order_timestamps():
+    fusion = FusionCenter(POSES, latency_s=0.0)
+    point = np.array([[10.0, 20.0]])
+    fusion.ingest(0, _observe(POSES[0], point, 1.0))
+    fusion.step(1.0)
+
+    # Gleicher Zeitstempel, anderer Knoten, 0.3 m Versatz → nur Position
+    fusion.ingest(1, _observe(POSES[1], point + [0.3, 0.0], 1.0))
+    tracks = fusion.step(1.1)
+    assert len(tracks) == 1 and tracks['hits'][0] == 2
+    assert tracks['vx'][0] == 0.0 and tracks['vy'][0] == 0.0
+    assert np.isclose(tracks['x'][0], 10.15, atol=1e-4)
+
+    # Verspätete (ältere) Messung: verworfen, kein neuer Track
+    before = tracks.copy()
+    fusion.ingest(0, _observe(POSES[0], point + [1.0, 0.0], 0.9))
+    tracks = fusion.step(1.2)
+    assert len(tracks) == 1
+    assert tracks['x'][0] == before['x'][0] and tracks['hits'][0] == before['hits'][0]
+
+
+def test_batch_is_processed_in_time_order():
+    # Beide Knoten in einem Batch, aber zu verschiedenen Zeiten
+    fusion = FusionCenter(POSES, alpha=1.0, beta=1.0)
+    fusion.ingest(0, _observe(POSES[0], _targets(0.0)[:1], 0.0))
+    fusion.step(0.0)
+    fusion.ingest(1, _observe(POSES[1], _targets(0.2)[:1], 0.2))
+    fusion.ingest(0, _observe(POSES[0], _targets(0.1)[:1], 0.1))
+    tracks = fusion.step(0.2)
+    assert len(tracks) == 1 and tracks['hits'][0] == 3
+    assert np.isclose(tracks['time'][0], 0.2)
+    assert np.allclose([tracks['vx'][0], tracks['vy'][0]], [2.0, 0.0], atol=1e-3)
+
+
+def test_first_batch_starts_tracks_then_associates():
+    # Erster Batch ohne Tracks: fünf Frames eines bewegten Ziels
+    fusion = FusionCenter(POSES, alpha=1.0, beta=1.0)
+    for k in range(5):
+        fusion.ingest(0, _observe(POSES[0], _targets(0.1 * k)[:1], 0.1 * k))
+    tracks = fusion.step(0.4)
+    assert len(tracks) == 1 and tracks['hits'][0] == 5
+    assert np.allclose([tracks['x'][0], tracks['y'][0]], _targets(0.4)[0], atol=1e-3)
+    assert np.allclose([tracks['vx'][0], tracks['vy'][0]], [2.0, 0.0], atol=1e-3)
+
+
+def test_run_stream():
+    fusion = FusionCenter(POSES)
+    stream = [(k * 0.05, k % 2, _observe(POSES[k % 2], _targets(k * 0.05), k * 0.05))
+              for k in range(40)]
+    frames = list(fusion.run(stream, frame_period=0.1))
+    assert len(frames) == 20
+    assert len(frames[-1][1]) == 2
+
+
+def test_rejects_invalid_node_ids():
+    with pytest.raises(ValueError):
+        FusionCenter({63: SensorPose()})
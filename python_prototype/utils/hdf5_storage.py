@@ -0,0 +1,300 @@
+# python_prototype/utils/hdf5_storage.py
+
+import h5py
+import numpy as np
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+from python_prototype.waveform.chirp_generator import ChirpGenerator
+from python_prototype.waveform.radar_profile import RadarProfile
+
+
+# Parameter des ChirpGenerators, die als Metadaten gespeichert werden
+RADAR_ATTRS = ('f_start', 'bandwidth', 'chirp_duration', 'sample_rate',
+               'n_samples', 'chirp_rate', 'range_resolution', 'max_range',
+               'max_velocity', 'n_chirps', 'window', 'name')
+
+# Zielgröße eines Chunks (unkomprimiert), falls nicht explizit angegeben
+_TARGET_CHUNK_BYTES = 1 << 20
+
+
+def radar_metadata(radar: Union[ChirpGenerator, RadarProfile]) -> Dict[str, float]:
+    """Extrahiert die Radar-Konfiguration als flaches Dict."""
+    if isinstance(radar, ChirpGenerator):
+        radar = radar.profile
+    return {name: getattr(radar, name) for name in RADAR_ATTRS}
+
+
+class RadarH5Writer:
+    """
+    Schreibt verarbeitete Radar-Daten Frame für Frame in eine HDF5-Datei.
+
+    Zwei Arten von Datasets:
+      - Frame-Arrays (z.B. range_profile, rd_map): Form (n_frames, *frame_shape),
+        Chunks sind an Frame-Grenzen ausgerichtet und komprimiert.
+      - Record-Listen (z.B. detections, tracks): variable Anzahl pro Frame,
+        als 1D-Compound-Dataset + Index (start, count) pro Frame.
+
+    Das Schema wird beim Öffnen festgelegt, danach läuft die Datei im
+    SWMR-Modus: parallele Leser (RadarH5Reader) können bereits geschriebene
+    Frames streamen, während der Writer noch anhängt.
+    """
+
+    def __init__(self, path: str,
+                 frame_shapes: Optional[Dict[str, Tuple[int, ...]]] = None,
+                 record_dtypes: Optional[Dict[str, np.dtype]] = None,
+                 chirp_generator: Optional[Union[ChirpGenerator, RadarProfile]] = None,
+                 metadata: Optional[Dict] = None,
+                 dtype=np.float32, frames_per_chunk: Optional[int] = None,
+                 compression: str = 'gzip', compression_opts: int = 4,
+                 swmr: bool = True):
+        """
+        Args:
+            path: Zieldatei (wird überschrieben)
+            frame_shapes: Dataset-Name → Form eines Frames
+            record_dtypes: Dataset-Name → Structured dtype der Records
+            chirp_generator: Radar-Konfiguration (ChirpGenerator oder
+                             RadarProfile) für die Metadaten
+            metadata: Zusätzliche Attribute (z.B. Szenario-Beschreibung)
+            dtype: Datentyp der Frame-Arrays
+            frames_per_chunk: Frames pro Chunk (Default: ~1 MiB pro Chunk)
+            compression: HDF5-Filter ('gzip', 'lzf' oder None)
+            compression_opts: Kompressionsstufe (nur gzip)
+            swmr: Single-Writer/Multiple-Reader aktivieren
+        """
+        self.path = path
+        self._file = h5py.File(path, 'w', libver='latest')
+        self._arrays: Dict[str, h5py.Dataset] = {}
+        self._records: Dict[str, Tuple[h5py.Dataset, h5py.Dataset]] = {}
+        self.n_frames = 0
+
+        opts = dict(compression=compression, shuffle=compression is not None)
+        if compression == 'gzip':
+            opts['compression_opts'] = compression_opts
+
+        # ===== METADATEN =====
+        radar = self._file.create_group('radar')
+        if chirp_generator is not None:
+            radar.attrs.update(radar_metadata(chirp_generator))
+        if metadata:
+            self._file.attrs.update(metadata)
+
+        # ===== SCHEMA =====
+        self._timestamps = self._file.create_dataset(
+            'timestamps', shape=(0,), maxshape=(None,), dtype=np.float64,
+            chunks=(4096,))
+
+        for name, frame_shape in (frame_shapes or {}).items():
+            frame_shape = tuple(int(s) for s in frame_shape)
+            frame_bytes = int(np.prod(frame_shape)) * np.dtype(dtype).itemsize
+            n_chunk = frames_per_chunk or max(1, _TARGET_CHUNK_BYTES // frame_bytes)
+            # Fehlende Frames bleiben NaN (Fill-Value, kein Schreibzugriff nötig)
+            fill = np.nan if np.dtype(dtype).kind in 'fc' else None
+            self._arrays[name] = self._file.create_dataset(
+                name, shape=(0,) + frame_shape, maxshape=(None,) + frame_shape,
+                dtype=dtype, chunks=(n_chunk,) + frame_shape, fillvalue=fill,
+                **opts)
+
+        for name, rec_dtype in (record_dtypes or {}).items():
+            rec_dtype = np.dtype(rec_dtype)
+            n_chunk = max(1, (64 << 10) // rec_dtype.itemsize)
+            data = self._file.create_dataset(
+                name, shape=(0,), maxshape=(None,), dtype=rec_dtype,
+                chunks=(n_chunk,), **opts)
+            index = self._file.create_dataset(
+                name + '_index', shape=(0, 2), maxshape=(None, 2),
+                dtype=np.int64, chunks=(4096, 2))
+            self._records[name] = (data, index)
+
+        if swmr:
+            self._file.swmr_mode = True
+
+    def write_frame(self, timestamp: float = np.nan, **data) -> int:
+        """
+        Hängt einen Frame an.
+
+        Args:
+            timestamp: Zeitstempel des Frames [s]
+            **data: Dataset-Name → Frame-Array bzw. Record-Array
+
+        Returns:
+            Index des geschriebenen Frames
+        """
+        unknown = set(data) - set(self._arrays) - set(self._records)
+        if unknown:
+            raise KeyError(f"Datasets not declared in schema: {sorted(unknown)}")
+
+        # Alle Eingaben vor dem ersten Resize umwandeln und prüfen, sonst
+        # bliebe bei einem Fehler ein halber Frame mit ungleichen Längen stehen
+        frames = {}
+        for name, ds in self._arrays.items():
+            if data.get(name) is not None:
+                frame = np.asarray(data[name], dtype=ds.dtype)
+                try:
+                    frames[name] = np.broadcast_to(frame, ds.shape[1:])
+                except ValueError:
+                    raise ValueError(f"'{name}': expected frame shape {ds.shape[1:]}, "
+                                     f"got {frame.shape}") from None
+        records = {name: np.asarray(data[name], dtype=ds.dtype).reshape(-1)
+                   for name, (ds, _) in self._records.items()
+                   if data.get(name) is not None}
+
+        k = self.n_frames
+        self._timestamps.resize((k + 1,))
+        self._timestamps[k] = timestamp
+
+        for name, ds in self._arrays.items():
+            ds.resize(k + 1, axis=0)
+            if name in frames:
+                ds[k] = frames[name]
+
+        for name, (ds, index) in self._records.items():
+            count = len(records[name]) if name in records else 0
+            start = ds.shape[0]
+            if count:
+                ds.resize((start + count,))
+                ds[start:] = records[name]
+            index.resize((k + 1, 2))
+            index[k] = (start, count)
+
+        self.n_frames = k + 1
+        self.flush()
+        return k
+
+    def write_frames(self, timestamps: np.ndarray, **data) -> int:
+        """
+        Hängt mehrere Frames mit einem Resize/Flush pro Dataset an
+        (Batch-Verarbeitung; write_frame flusht nach jedem Frame).
+
+        Args:
+            timestamps: Zeitstempel der n Frames [s]
+            **data: Frame-Arrays mit führender Achse n bzw. für Records
+                    eine Liste von n Record-Arrays (eines pro Frame)
+
+        Returns:
+            Index des ersten geschriebenen Frames
+        """
+        unknown = set(data) - set(self._arrays) - set(self._records)
+        if unknown:
+            raise KeyError(f"Datasets not declared in schema: {sorted(unknown)}")
+
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        n = len(timestamps)
+        # Vor dem ersten Resize prüfen, sonst bliebe ein halber Block stehen
+        for name, values in data.items():
+            if values is not None and len(values) != n:
+                raise ValueError(f"'{name}': expected {n} frames, got {len(values)}")
+        k = self.n_frames
+        self._timestamps.resize((k + n,))
+        self._timestamps[k:] = timestamps
+
+        for name, ds in self._arrays.items():
+            ds.resize(k + n, axis=0)
+            if data.get(name) is not None:
+                ds[k:] = data[name]
+
+        for name, (ds, index) in self._records.items():
+            per_frame = data.get(name)
+            if per_frame is None:
+                per_frame = [()] * n
+            counts = np.array([len(r) for r in per_frame], dtype=np.int64)
+            start = ds.shape[0]
+            total = int(counts.sum())
+            if total:
+                ds.resize((start + total,))
+                ds[start:] = np.concatenate([np.asarray(r, dtype=ds.dtype)
+                                             for r in per_frame if len(r)])
+            index.resize((k + n, 2))
+            index[k:, 0] = start + np.cumsum(counts) - counts
+            index[k:, 1] = counts
+
+        self.n_frames = k + n
+        self.flush()
+        return k
+
+    def flush(self) -> None:
+        """Macht geschriebene Daten für SWMR-Leser sichtbar."""
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class RadarH5Reader:
+    """
+    Liest Radar-Daten aus einer mit RadarH5Writer erzeugten Datei.
+
+    Zugriffe lesen nur die betroffenen Chunks; die Datei wird nie komplett
+    dekomprimiert. Im SWMR-Modus kann parallel zum Writer gelesen werden
+    (refresh() aktualisiert die sichtbare Länge).
+    """
+
+    def __init__(self, path: str, swmr: bool = True):
+        self._file = h5py.File(path, 'r', libver='latest', swmr=swmr)
+        self.radar_params = dict(self._file['radar'].attrs)
+        self.metadata = dict(self._file.attrs)
+
+    @property
+    def n_frames(self) -> int:
+        return self._file['timestamps'].shape[0]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._file['timestamps'][:]
+
+    def refresh(self) -> None:
+        """Übernimmt vom Writer neu angehängte Frames (SWMR)."""
+        for ds in self._file.values():
+            if isinstance(ds, h5py.Dataset):
+                ds.refresh()
+
+    def read(self, name: str, frames=slice(None)) -> np.ndarray:
+        """Liest ein Frame-Array (einzelner Index oder Slice)."""
+        return self._file[name][frames]
+
+    def iter_frames(self, name: str, batch: Optional[int] = None,
+                    start: int = 0, stop: Optional[int] = None
+                    ) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Streamt ein Frame-Array in Blöcken von batch Frames.
+
+        Default-Batchgröße ist die Chunk-Länge, sodass jeder Chunk genau
+        einmal gelesen und dekomprimiert wird.
+
+        Yields:
+            (start_frame, frames)
+        """
+        ds = self._file[name]
+        batch = batch or ds.chunks[0]
+        stop = ds.shape[0] if stop is None else min(stop, ds.shape[0])
+        for k in range(start, stop, batch):
+            yield k, ds[k:min(k + batch, stop)]
+
+    def records(self, name: str, frame: int) -> np.ndarray:
+        """Liest die Records (z.B. Detektionen) eines Frames."""
+        start, count = self._file[name + '_index'][frame]
+        return self._file[name][start:start + count]
+
+    def records_range(self, name: str, frames: slice) -> np.ndarray:
+        """Liest die Records mehrerer aufeinanderfolgender Frames am Stück."""
+        index = self._file[name + '_index'][frames]
+        if len(index) == 0:
+            return self._file[name][0:0]
+        start = index[0, 0]
+        stop = index[-1, 0] + index[-1, 1]
+        return self._file[name][start:stop]
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
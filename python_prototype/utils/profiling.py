@@ -0,0 +1,294 @@
+# python_prototype/utils/profiling.py
+"""
+Profiling der Verarbeitungs-Stufen (Laufzeit, Allokationen, Aufrufe).
+
+Stufen werden mit @profile_stage markiert. Solange das Profiling aus ist,
+kostet ein Aufruf nur eine zusätzliche Flag-Abfrage. Einschalten über
+
+    FMCW_PROFILE=1 python examples/test_range.py   (Report am Ende auf stderr)
+oder
+    from python_prototype.utils import profiling
+    profiling.enable()
+
+Pro Stufe werden Aufrufe, Gesamt- und Eigenzeit (ohne verschachtelte
+Stufen), netto allokierter Speicher und Speicher-Peak (tracemalloc)
+erfasst. Verschachtelte Aufrufe ergeben Stacks im "folded"-Format für
+Flamegraph-Tools (flamegraph.pl, speedscope, inferno).
+
+CLI (Standard-Szenario):
+    python -m python_prototype.utils.profiling --profile k24_short_range
+    python -m python_prototype.utils.profiling --folded stages.folded
+"""
+
+import argparse
+import atexit
+import contextlib
+import functools
+import io
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+ENV_VAR = 'FMCW_PROFILE'
+
+# tracemalloc.reset_peak() gibt es erst ab Python 3.9; ohne wird der Peak
+# einer Stufe durch den Speicherstand beim Verlassen angenähert
+_HAS_RESET_PEAK = hasattr(tracemalloc, 'reset_peak')
+
+
+@dataclass
+class StageStats:
+    """Gesammelte Messwerte einer Stufe."""
+    calls: int = 0
+    total_s: float = 0.0
+    self_s: float = 0.0
+    alloc_bytes: int = 0        # Netto-Allokationen (nach - vor)
+    peak_bytes: int = 0         # Größter Peak über einen Aufruf
+
+    @property
+    def mean_s(self) -> float:
+        return self.total_s / self.calls if self.calls else 0.0
+
+
+class _Profiler:
+    """
+    Sammelt die Messwerte aller Threads. Der Stufen-Stack ist pro Thread
+    (threading.local), die Summen in stats/folded sind gemeinsam und werden
+    unter einem Lock aktualisiert. tracemalloc misst prozessweit: laufen
+    Stufen parallel in mehreren Threads, enthalten Alloc/Peak auch deren
+    Allokationen.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.trace_memory = False
+        self._started_tracemalloc = False
+        self.stats: Dict[str, StageStats] = defaultdict(StageStats)
+        self.folded: Dict[str, float] = defaultdict(float)   # Stack → Eigenzeit [s]
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def _stack(self) -> List[list]:
+        """Stack des aktuellen Threads; Einträge: [name, Zeit in Unterstufen,
+        Speicher vorher, Peak der Unterstufen]"""
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def enter(self, name: str):
+        frame = [name, 0.0, 0, 0]
+        self._stack.append(frame)
+        if self.trace_memory:
+            frame[2] = tracemalloc.get_traced_memory()[0]
+            if _HAS_RESET_PEAK:
+                tracemalloc.reset_peak()
+        return frame, time.perf_counter()
+
+    def exit(self, frame, t0: float) -> None:
+        elapsed = time.perf_counter() - t0
+        stack = self._stack
+        name, child_s, mem_before, child_peak = frame
+        key = ';'.join(f[0] for f in stack)
+        with self._lock:
+            stats = self.stats[name]
+            stats.calls += 1
+            stats.total_s += elapsed
+            stats.self_s += elapsed - child_s
+            if self.trace_memory:
+                current, peak = tracemalloc.get_traced_memory()
+                if not _HAS_RESET_PEAK:
+                    peak = current
+                # reset_peak() der Unterstufen hat den eigenen Peak überschrieben
+                peak = max(peak, child_peak)
+                stats.alloc_bytes += current - mem_before
+                stats.peak_bytes = max(stats.peak_bytes, peak - mem_before)
+                if len(stack) > 1:
+                    stack[-2][3] = max(stack[-2][3], peak)
+            self.folded[key] += elapsed - child_s
+
+        stack.pop()
+        if stack:
+            stack[-1][1] += elapsed
+
+
+_profiler = _Profiler()
+
+
+def enable(trace_memory: bool = True) -> None:
+    """Schaltet das Profiling ein (optional mit tracemalloc)."""
+    _profiler.enabled = True
+    _profiler.trace_memory = trace_memory
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _profiler._started_tracemalloc = True
+
+
+def disable() -> None:
+    """Schaltet das Profiling aus; gesammelte Werte bleiben erhalten."""
+    _profiler.enabled = False
+    if _profiler._started_tracemalloc:
+        tracemalloc.stop()
+        _profiler._started_tracemalloc = False
+    _profiler.trace_memory = False
+
+
+def is_enabled() -> bool:
+    return _profiler.enabled
+
+
+def reset() -> None:
+    """Verwirft alle gesammelten Werte."""
+    with _profiler._lock:
+        _profiler.stats.clear()
+        _profiler.folded.clear()
+
+
+def get_stats() -> Dict[str, StageStats]:
+    return dict(_profiler.stats)
+
+
+def profile_stage(name: Optional[str] = None):
+    """
+    Decorator: markiert eine Funktion/Methode als Profiling-Stufe.
+
+    Args:
+        name: Stufen-Name (Standard: Klasse.methode)
+    """
+    def decorator(func):
+        stage = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _profiler.enabled:
+                return func(*args, **kwargs)
+            frame, t0 = _profiler.enter(stage)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _profiler.exit(frame, t0)
+        return wrapper
+    return decorator
+
+
+@contextlib.contextmanager
+def stage(name: str):
+    """Context Manager für Code-Blöcke, die keine eigene Funktion sind."""
+    if not _profiler.enabled:
+        yield
+        return
+    frame, t0 = _profiler.enter(name)
+    try:
+        yield
+    finally:
+        _profiler.exit(frame, t0)
+
+
+def report(sort_by: str = 'self_s', top: Optional[int] = None) -> str:
+    """
+    Nach Kosten sortierte Tabelle aller Stufen.
+
+    Args:
+        sort_by: 'self_s', 'total_s', 'calls', 'alloc_bytes' oder 'peak_bytes'
+        top: Nur die teuersten n Stufen
+    """
+    stats = sorted(_profiler.stats.items(), key=lambda kv: getattr(kv[1], sort_by),
+                   reverse=True)[:top]
+    total_self = sum(s.self_s for _, s in _profiler.stats.items()) or 1.0
+
+    lines = [f"{'Stage':<36} {'Calls':>7} {'Total [ms]':>11} {'Self [ms]':>10} "
+             f"{'Self %':>7} {'Mean [ms]':>10} {'Alloc [MB]':>11} {'Peak [MB]':>10}",
+             "-" * 108]
+    for name, s in stats:
+        lines.append(f"{name:<36} {s.calls:>7} {s.total_s*1e3:>11.2f} {s.self_s*1e3:>10.2f} "
+                     f"{100*s.self_s/total_self:>6.1f}% {s.mean_s*1e3:>10.3f} "
+                     f"{s.alloc_bytes/1e6:>11.2f} {s.peak_bytes/1e6:>10.2f}")
+    return "\n".join(lines)
+
+
+def write_folded(path) -> None:
+    """
+    Schreibt die Stacks im "folded"-Format (eine Zeile "a;b;c <µs>"),
+    z.B. für flamegraph.pl oder speedscope.
+    """
+    with open(path, 'w') as f:
+        for stack, seconds in sorted(_profiler.folded.items()):
+            f.write(f"{stack} {int(round(seconds * 1e6))}\n")
+
+
+def _report_at_exit() -> None:
+    if _profiler.stats:
+        print("\n" + report(), file=sys.stderr)
+
+
+if os.environ.get(ENV_VAR, '').lower() in ('1', 'true', 'yes', 'on'):
+    # Über die Umgebung aktiviert: Report beim Prozessende auf stderr
+    enable(trace_memory=os.environ.get(ENV_VAR + '_MEMORY', '1') != '0')
+    atexit.register(_report_at_exit)
+
+
+# ===== CLI =====
+
+def run_scenario(profile_name: str = 'k24_short_range', n_frames: int = 20,
+                 targets=((20.0, 1.0), (45.0, 10.0))) -> None:
+    """Standard-Szenario: Chirp → Ziel-Simulation → Mischen → FFT → Detektion."""
+    from python_prototype.waveform.radar_profile import load_profile
+    from python_prototype.waveform.chirp_generator import ChirpGenerator
+    from python_prototype.signal_processing.range_fft import RangeProcessor
+
+    profile = load_profile(profile_name)
+    # Debug-Ausgaben der Stufen nicht in den Report mischen
+    with contextlib.redirect_stdout(io.StringIO()):
+        gen = ChirpGenerator.from_profile(profile)
+        proc = RangeProcessor(gen)
+        for frame in range(n_frames):
+            gen.generate_chirp()
+            rx_total = 0.0
+            for range_m, rcs in targets:
+                _, tx, rx = proc.simulate_target(range_m, rcs=rcs)
+                rx_total = rx_total + rx
+            beat = proc.mix_signals(tx, rx_total)
+            _, range_bins, profile_db = proc.range_fft(beat)
+            proc.detect_points(range_bins, profile_db, snr_db=20, frame=frame)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Profiliert die Radar-Verarbeitungskette (Standard-Szenario)")
+    parser.add_argument('--profile', default='k24_short_range',
+                        help="Radar-Profil (YAML-Name), Standard: k24_short_range")
+    parser.add_argument('--frames', type=int, default=20, help="Anzahl Frames")
+    parser.add_argument('--sort', default='self_s',
+                        choices=('self_s', 'total_s', 'calls', 'alloc_bytes', 'peak_bytes'))
+    parser.add_argument('--no-memory', action='store_true',
+                        help="tracemalloc aus (geringerer Overhead, genauere Zeiten)")
+    parser.add_argument('--folded', metavar='PATH',
+                        help="Stacks im folded-Format für Flamegraphs schreiben")
+    args = parser.parse_args(argv)
+
+    reset()
+    enable(trace_memory=not args.no_memory)
+    try:
+        run_scenario(args.profile, args.frames)
+    finally:
+        disable()
+
+    print(f"Profil: {args.profile}, {args.frames} Frames\n")
+    print(report(sort_by=args.sort))
+    if args.folded:
+        write_folded(args.folded)
+        print(f"\nFolded stacks → {args.folded}")
+    return 0
+
+
+if __name__ == '__main__':
+    # Als Skript läuft dieses Modul als __main__; die Decorators in der
+    # Pipeline hängen aber an python_prototype.utils.profiling.
+    from python_prototype.utils import profiling
+    sys.exit(profiling.main())
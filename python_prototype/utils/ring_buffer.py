@@ -0,0 +1,139 @@
+# python_prototype/utils/ring_buffer.py
+
+import numpy as np
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+
+
+class BlockRingBuffer:
+    """
+    Lock-freier Single-Producer/Single-Consumer Ringpuffer für Sample-Blöcke.
+
+    Alle Slots werden einmal vorab allokiert. Der Producer schreibt nur den
+    Head-Zähler, der Consumer nur den Tail-Zähler; dadurch wird kein Lock
+    benötigt. Ist der Puffer voll, schlägt try_push() fehl und der Aufrufer
+    zählt den Block als verworfen (kein Blockieren der Akquisition).
+
+    Mit shared=True liegen Daten und Zähler in einem SharedMemory-Segment,
+    sodass der Consumer auch in einem anderen Prozess laufen kann
+    (siehe attach()).
+    """
+
+    # Layout des Kontrollblocks (int64): [head, tail]
+    _HEAD = 0
+    _TAIL = 1
+
+    def __init__(self, n_slots: int, block_shape: Tuple[int, ...],
+                 dtype=np.float64, shared: bool = False,
+                 _shm_name: Optional[str] = None):
+        """
+        Args:
+            n_slots: Anzahl Slots (Kapazität in Blöcken)
+            block_shape: Form eines einzelnen Blocks, z.B. (n_chirps, n_samples)
+            dtype: Datentyp der Samples
+            shared: Puffer in SharedMemory anlegen (für Consumer-Prozesse)
+        """
+        if n_slots < 1:
+            raise ValueError(f"n_slots must be >= 1, got {n_slots}")
+
+        self.n_slots = int(n_slots)
+        self.block_shape = tuple(int(s) for s in block_shape)
+        self.dtype = np.dtype(dtype)
+
+        n_block = int(np.prod(self.block_shape)) * self.dtype.itemsize
+        n_data = self.n_slots * n_block
+        n_meta = self.n_slots * 8 * 2          # Zeitstempel + Sequenznummer
+        n_ctrl = 2 * 8                         # head, tail
+        n_total = n_ctrl + n_meta + n_data
+
+        self._shm = None
+        self._owner = False
+        if shared or _shm_name is not None:
+            if _shm_name is None:
+                self._shm = shared_memory.SharedMemory(create=True, size=n_total)
+                self._owner = True
+            else:
+                self._shm = shared_memory.SharedMemory(name=_shm_name)
+            raw = np.ndarray((n_total,), dtype=np.uint8, buffer=self._shm.buf)
+        else:
+            raw = np.zeros(n_total, dtype=np.uint8)
+
+        self._ctrl = raw[:n_ctrl].view(np.int64)
+        self._stamps = raw[n_ctrl:n_ctrl + self.n_slots * 8].view(np.float64)
+        self._seq = raw[n_ctrl + self.n_slots * 8:n_ctrl + n_meta].view(np.int64)
+        self._data = raw[n_ctrl + n_meta:].view(self.dtype).reshape(
+            (self.n_slots,) + self.block_shape)
+
+        if self._owner:
+            self._ctrl[:] = 0
+
+    @classmethod
+    def attach(cls, name: str, n_slots: int, block_shape: Tuple[int, ...],
+               dtype=np.float64) -> "BlockRingBuffer":
+        """Verbindet sich mit einem bestehenden SharedMemory-Ringpuffer."""
+        return cls(n_slots, block_shape, dtype, _shm_name=name)
+
+    @property
+    def name(self) -> Optional[str]:
+        """Name des SharedMemory-Segments (None bei lokalem Puffer)."""
+        return self._shm.name if self._shm is not None else None
+
+    def __len__(self) -> int:
+        return int(self._ctrl[self._HEAD] - self._ctrl[self._TAIL])
+
+    @property
+    def capacity(self) -> int:
+        return self.n_slots
+
+    # ===== PRODUCER =====
+
+    def try_push(self, block: np.ndarray, timestamp: float = 0.0,
+                 seq: int = 0) -> bool:
+        """
+        Kopiert einen Block in den nächsten freien Slot.
+
+        Returns:
+            False, wenn der Puffer voll ist (Block verworfen)
+        """
+        head = int(self._ctrl[self._HEAD])
+        if head - int(self._ctrl[self._TAIL]) >= self.n_slots:
+            return False
+
+        slot = head % self.n_slots
+        self._data[slot] = block
+        self._stamps[slot] = timestamp
+        self._seq[slot] = seq
+        # Erst nach dem Schreiben der Daten veröffentlichen
+        self._ctrl[self._HEAD] = head + 1
+        return True
+
+    # ===== CONSUMER =====
+
+    def peek(self) -> Optional[Tuple[np.ndarray, float, int]]:
+        """
+        Liefert den ältesten Block als View (ohne Kopie), oder None.
+
+        Der Slot bleibt reserviert, bis release() aufgerufen wird.
+        """
+        tail = int(self._ctrl[self._TAIL])
+        if tail == int(self._ctrl[self._HEAD]):
+            return None
+        slot = tail % self.n_slots
+        return self._data[slot], float(self._stamps[slot]), int(self._seq[slot])
+
+    def release(self) -> None:
+        """Gibt den mit peek() gelesenen Slot frei."""
+        self._ctrl[self._TAIL] = self._ctrl[self._TAIL] + 1
+
+    # ===== CLEANUP =====
+
+    def close(self) -> None:
+        """Schließt (und entfernt als Besitzer) das SharedMemory-Segment."""
+        if self._shm is None:
+            return
+        # Views vor dem Schließen freigeben, sonst BufferError
+        self._ctrl = self._stamps = self._seq = self._data = None
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+        self._shm = None
@@ -0,0 +1,213 @@
+# python_prototype/utils/scene_cache.py
+"""
+Inhaltsadressierter Disk-Cache für simulierte Szenen.
+
+Schlüssel = SHA-256 über (Radar-Profil, Target-Liste, Seed, weitere
+Parameter). Gleiche Eingaben → gleiche Datei; jede Änderung am Profil
+oder an den Targets ergibt automatisch einen neuen Eintrag, ein
+Invalidieren ist nie nötig.
+
+- Arrays liegen als .npy und werden per Memory-Map (read-only) geladen.
+- Schreiben ist atomar (temporäre Datei + os.replace): parallele
+  pytest-Worker (pytest-xdist) sehen nie halbe Dateien; schreiben zwei
+  Worker denselben Eintrag, gewinnt einfach der letzte – der Inhalt ist
+  identisch.
+- Die Gesamtgröße ist begrenzt; verdrängt werden die am längsten nicht
+  benutzten Einträge (LRU über die mtime, die bei jedem Treffer
+  aktualisiert wird).
+
+Cache-Verzeichnis: Argument, Umgebungsvariable FMCW_SCENE_CACHE oder
+~/.cache/fmcw_radar/scenes.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import numpy as np
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from python_prototype.waveform.radar_profile import RadarProfile
+
+ENV_VAR = 'FMCW_SCENE_CACHE'
+# Erhöhen, wenn sich die Simulation ändert (alte Einträge werden dann nicht mehr getroffen)
+CACHE_VERSION = 1
+
+
+def scene_key(profile: RadarProfile, targets: List[Dict[str, float]],
+              seed: Optional[int] = None, **params) -> str:
+    """
+    SHA-256-Schlüssel einer Szene.
+
+    Args:
+        profile: Radar-Konfiguration (der Profil-Name zählt nicht)
+        targets: Liste von Dicts, z.B. {'range_m': 50.0, 'rcs': 1.0}; nur die
+                 simulierten Felder range_m und rcs zählen (nicht z.B. 'name')
+        seed: RNG-Seed (None für deterministische Szenen)
+        **params: Weitere Parameter, z.B. n_chirps, noise_std
+    """
+    profile_data = profile.to_dict()
+    profile_data.pop('name', None)
+    payload = {'version': CACHE_VERSION, 'profile': profile_data,
+               'targets': [{'range_m': float(t['range_m']),
+                            'rcs': float(t.get('rcs', 1.0))} for t in targets],
+               'seed': seed, 'params': params}
+    text = json.dumps(payload, sort_keys=True, default=float)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class SceneCache:
+    """Größenbegrenzter .npy-Cache mit LRU-Verdrängung."""
+
+    def __init__(self, directory=None, max_bytes: int = 2 * 1024**3):
+        """
+        Args:
+            directory: Cache-Verzeichnis (None → FMCW_SCENE_CACHE oder ~/.cache)
+            max_bytes: Maximale Gesamtgröße aller Einträge
+        """
+        if directory is None:
+            directory = os.environ.get(ENV_VAR) or \
+                Path.home() / '.cache' / 'fmcw_radar' / 'scenes'
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.npy"
+
+    def __contains__(self, key: str) -> bool:
+        return self._path(key).exists()
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Read-only Memory-Map des Eintrags oder None."""
+        path = self._path(key)
+        try:
+            data = np.load(path, mmap_mode='r')
+            os.utime(path)                    # LRU: zuletzt benutzt
+        except FileNotFoundError:             # auch: parallel verdrängt
+            return None
+        return data
+
+    def put(self, key: str, array: np.ndarray) -> np.ndarray:
+        """
+        Speichert array atomar und gibt die Memory-Map zurück.
+        """
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix='.tmp-', suffix='.npy')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.save(f, np.asarray(array))
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+        self.evict(keep=key)
+        return np.load(self._path(key), mmap_mode='r')
+
+    def get_or_create(self, key: str, factory: Callable[[], np.ndarray]) -> np.ndarray:
+        """Eintrag laden oder mit factory() erzeugen und speichern."""
+        data = self.get(key)
+        if data is None:
+            data = self.put(key, factory())
+        return data
+
+    def _entries(self):
+        entries = []
+        for path in self.directory.glob('*.npy'):
+            if path.name.startswith('.'):     # temporäre Dateien laufender put()
+                continue
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, path))
+        return entries
+
+    def size_bytes(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self, keep: Optional[str] = None) -> int:
+        """
+        Entfernt die ältesten Einträge, bis max_bytes eingehalten ist.
+
+        Args:
+            keep: Schlüssel, der nie verdrängt wird (gerade geschrieben)
+
+        Returns:
+            Anzahl entfernter Einträge
+        """
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if keep is not None and path.stem == keep:
+                continue
+            try:
+                path.unlink()                 # offene Memory-Maps bleiben gültig (POSIX)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        for _, _, path in self._entries():
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+_default_cache: Optional[SceneCache] = None
+
+
+def default_cache() -> SceneCache:
+    """Prozessweiter Cache im Standard-Verzeichnis."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = SceneCache()
+    return _default_cache
+
+
+def simulate_scene(profile: RadarProfile, targets: List[Dict[str, float]],
+                   n_chirps: int = 1, noise_std: float = 0.0,
+                   seed: Optional[int] = None,
+                   cache: Optional[SceneCache] = None) -> np.ndarray:
+    """
+    Beat-Signal einer Szene, (n_chirps, n_samples) – gecacht auf Disk.
+
+    Args:
+        profile: Radar-Konfiguration
+        targets: Liste von Dicts mit 'range_m' und optional 'rcs'
+        n_chirps: Anzahl Chirps
+        noise_std: Standardabweichung des additiven Rauschens
+        seed: Seed für das Rauschen (ohne Seed wird verrauschtes Signal nie
+              gecacht, jeder Aufruf zieht neues Rauschen)
+        cache: SceneCache (None → default_cache(); False → ohne Cache)
+
+    Returns:
+        Read-only Array (Memory-Map, falls gecacht)
+    """
+    def build() -> np.ndarray:
+        from python_prototype.signal_processing.range_fft import RangeProcessor
+        proc = RangeProcessor.from_profile(profile)
+        rx_total = np.zeros(profile.n_samples)
+        _, tx, _ = proc.chirp_gen.generate_chirp()
+        for target in targets:
+            _, tx, rx = proc.simulate_target(target['range_m'], rcs=target.get('rcs', 1.0))
+            rx_total += rx
+        frame = np.tile(proc.mix_signals(tx, rx_total), (n_chirps, 1))
+        if noise_std > 0:
+            frame += noise_std * np.random.default_rng(seed).standard_normal(frame.shape)
+        return frame
+
+    if cache is False or (noise_std > 0 and seed is None):
+        frame = build()
+        frame.setflags(write=False)
+        return frame
+    cache = cache or default_cache()
+    key = scene_key(profile, targets, seed, n_chirps=n_chirps, noise_std=noise_std)
+    return cache.get_or_create(key, build)
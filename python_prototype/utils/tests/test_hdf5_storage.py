@@ -0,0 +1,158 @@
+"""
+Unit Tests für die HDF5-Ablage von Range-Profilen, RD-Maps und Detektionen
+"""
+
+import numpy as np
+import pytest
+from python_prototype.waveform.chirp_generator import ChirpGenerator
+from python_prototype.utils.hdf5_storage import RadarH5Reader, RadarH5Writer
+
+DET_DTYPE = np.dtype([('range_m', 'f4'), ('snr_db', 'f4')])
+
+
+@pytest.fixture
+def gen():
+    return ChirpGenerator(24e9, 250e6, 256e-6, 1e6)
+
+
+@pytest.fixture
+def h5_file(gen, tmp_path):
+    """10 Frames mit Range-Profil, RD-Map und 0..2 Detektionen pro Frame"""
+    path = str(tmp_path / 'run.h5')
+    rng = np.random.default_rng(0)
+    profiles = rng.standard_normal((10, 128)).astype(np.float32)
+    rd_maps = rng.standard_normal((10, 16, 128)).astype(np.float32)
+
+    with RadarH5Writer(path, frame_shapes={'range_profile': (128,),
+                                           'rd_map': (16, 128)},
+                       record_dtypes={'detections': DET_DTYPE},
+                       chirp_generator=gen, metadata={'scenario': 'unit'}) as w:
+        for k in range(10):
+            dets = np.array([(10.0 * k + i, 20.0) for i in range(k % 3)],
+                            dtype=DET_DTYPE)
+            w.write_frame(timestamp=0.1 * k, range_profile=profiles[k],
+                          rd_map=rd_maps[k], detections=dets)
+    return path, profiles, rd_maps
+
+
+def test_metadata_roundtrip(gen, h5_file):
+    """Test: Radar-Konfiguration wird mitgespeichert"""
+    path, _, _ = h5_file
+    with RadarH5Reader(path) as r:
+        assert r.n_frames == 10
+        assert r.radar_params['bandwidth'] == gen.bandwidth
+        assert r.radar_params['n_samples'] == gen.n_samples
+        assert r.metadata['scenario'] == 'unit'
+        assert np.allclose(r.timestamps, 0.1 * np.arange(10))
+
+
+def test_frame_aligned_chunks_and_slices(h5_file):
+    """Test: Chunks enthalten ganze Frames, Slices lesen korrekt"""
+    path, profiles, rd_maps = h5_file
+    with RadarH5Reader(path) as r:
+        ds = r._file['rd_map']
+        assert ds.chunks[1:] == (16, 128)
+        assert ds.compression == 'gzip'
+
+        assert np.array_equal(r.read('rd_map', 7), rd_maps[7])
+        assert np.array_equal(r.read('range_profile', slice(2, 5)), profiles[2:5])
+
+        streamed = np.concatenate([f for _, f in r.iter_frames('range_profile', batch=3)])
+        assert np.array_equal(streamed, profiles)
+
+
+def test_detections_per_frame(h5_file):
+    """Test: Variable Anzahl Detektionen pro Frame über den Index"""
+    path, _, _ = h5_file
+    with RadarH5Reader(path) as r:
+        assert len(r.records('detections', 0)) == 0
+        dets = r.records('detections', 5)
+        assert list(dets['range_m']) == [50.0, 51.0]
+        assert len(r.records_range('detections', slice(0, 10))) == 9
+
+
+def test_swmr_reader_sees_appends(gen, tmp_path):
+    """Test: Paralleler Leser sieht neue Frames nach refresh()"""
+    path = str(tmp_path / 'live.h5')
+    writer = RadarH5Writer(path, frame_shapes={'range_profile': (64,)},
+                           chirp_generator=gen)
+    writer.write_frame(0.0, range_profile=np.ones(64))
+
+    reader = RadarH5Reader(path)
+    assert reader.n_frames == 1
+
+    writer.write_frame(1.0, range_profile=np.full(64, 2.0))
+    writer.write_frame(2.0)                    # Frame ohne Profil → NaN
+    reader.refresh()
+    assert reader.n_frames == 3
+    assert np.all(reader.read('range_profile', 1) == 2.0)
+    assert np.all(np.isnan(reader.read('range_profile', 2)))
+
+    with pytest.raises(KeyError):
+        writer.write_frame(3.0, unknown=np.ones(3))
+
+    reader.close()
+    writer.close()
+
+
+def test_write_frames_matches_write_frame(gen, h5_file, tmp_path):
+    """Test: Blockweises Schreiben ergibt dieselbe Datei wie frameweises"""
+    ref_path, profiles, rd_maps = h5_file
+    path = str(tmp_path / 'batch.h5')
+    dets = [np.array([(10.0 * k + i, 20.0) for i in range(k % 3)], dtype=DET_DTYPE)
+            for k in range(10)]
+    with RadarH5Writer(path, frame_shapes={'range_profile': (128,), 'rd_map': (16, 128)},
+                       record_dtypes={'detections': DET_DTYPE}, chirp_generator=gen) as w:
+        assert w.write_frames(0.1 * np.arange(4), range_profile=profiles[:4],
+                              rd_map=rd_maps[:4], detections=dets[:4]) == 0
+        assert w.write_frames(0.1 * np.arange(4, 10), range_profile=profiles[4:],
+                              rd_map=rd_maps[4:], detections=dets[4:]) == 4
+
+    with RadarH5Reader(path) as r, RadarH5Reader(ref_path) as ref:
+        assert r.n_frames == 10
+        assert np.allclose(r.timestamps, ref.timestamps)
+        assert np.array_equal(r.read('rd_map'), ref.read('rd_map'))
+        assert np.array_equal(r._file['detections_index'][:],
+                              ref._file['detections_index'][:])
+        for k in range(10):
+            assert np.array_equal(r.records('detections', k), ref.records('detections', k))
+
+
+def test_write_frames_record_containers(gen, tmp_path):
+    """Test: Records als Objekt-Array, fehlende Records → leere Frames"""
+    path = str(tmp_path / 'records.h5')
+    per_frame = np.empty(3, dtype=object)
+    for k in range(3):
+        per_frame[k] = np.array([(1.0 * k, 2.0)] * k, dtype=DET_DTYPE)
+    with RadarH5Writer(path, frame_shapes={'range_profile': (128,)},
+                       record_dtypes={'detections': DET_DTYPE}, chirp_generator=gen) as w:
+        w.write_frames(np.arange(3.0), detections=per_frame)
+        w.write_frames(np.arange(3.0, 5.0), range_profile=np.zeros((2, 128)))
+        with pytest.raises(ValueError):
+            w.write_frames(np.arange(2.0), detections=per_frame)
+
+    with RadarH5Reader(path) as r:
+        assert r.n_frames == 5
+        assert [len(r.records('detections', k)) for k in range(5)] == [0, 1, 2, 0, 0]
+        assert np.isnan(r.read('range_profile', 0)).all()
+
+
+def test_write_frame_rejects_bad_input_atomically(gen, tmp_path):
+    """Test: Ungültige Eingabe hinterlässt keinen halben Frame"""
+    path = str(tmp_path / 'atomic.h5')
+    with RadarH5Writer(path, frame_shapes={'range_profile': (128,), 'rd_map': (16, 128)},
+                       record_dtypes={'detections': DET_DTYPE}, chirp_generator=gen) as w:
+        w.write_frame(0.0, range_profile=np.zeros(128))
+        with pytest.raises(ValueError):
+            w.write_frame(0.1, range_profile=np.zeros(128), rd_map=np.zeros((8, 128)))
+        with pytest.raises((ValueError, TypeError)):
+            w.write_frame(0.1, range_profile=np.zeros(128), detections=[('x', 'y', 'z')])
+        assert w.n_frames == 1
+        w.write_frame(0.2, rd_map=np.ones((16, 128)))
+
+    with RadarH5Reader(path) as r:
+        assert r.n_frames == 2
+        assert r.read('range_profile').shape == (2, 128)
+        assert r.read('rd_map').shape == (2, 16, 128)
+        assert r._file['detections_index'].shape == (2, 2)
+        assert np.array_equal(r.timestamps, [0.0, 0.2])
@@ -0,0 +1,98 @@
+"""
+Unit Tests für das Stufen-Profiling
+"""
+
+import threading
+import numpy as np
+import pytest
+from python_prototype.utils import profiling
+from python_prototype.utils.profiling import profile_stage
+
+
+@pytest.fixture
+def profiler():
+    profiling.reset()
+    profiling.enable()
+    yield profiling
+    profiling.disable()
+    profiling.reset()
+
+
+@profile_stage('outer')
+def _outer():
+    _inner()
+    _inner()
+    return np.ones(100_000)
+
+
+@profile_stage('inner')
+def _inner():
+    return np.ones(1000).sum()
+
+
+def test_disabled_records_nothing():
+    profiling.reset()
+    assert not profiling.is_enabled()
+    _outer()
+    assert profiling.get_stats() == {}
+
+
+def test_calls_time_and_allocations(profiler):
+    _outer()
+    _outer()
+    stats = profiler.get_stats()
+
+    assert stats['outer'].calls == 2
+    assert stats['inner'].calls == 4
+    assert stats['outer'].total_s >= stats['inner'].total_s
+    # Eigenzeit = Gesamtzeit minus verschachtelte Stufen
+    assert stats['outer'].self_s == pytest.approx(
+        stats['outer'].total_s - stats['inner'].total_s, abs=1e-9)
+    # Rückgabe-Array (800 kB) bleibt nicht am Leben, Peak aber sichtbar
+    assert stats['outer'].peak_bytes >= 800_000
+
+
+def test_folded_stacks_and_report(profiler, tmp_path):
+    _outer()
+    path = tmp_path / 'stages.folded'
+    profiler.write_folded(path)
+    stacks = dict(line.rsplit(' ', 1) for line in path.read_text().splitlines())
+    assert set(stacks) == {'outer', 'outer;inner'}
+    assert all(int(v) >= 0 for v in stacks.values())
+
+    text = profiler.report(sort_by='calls')
+    lines = text.splitlines()
+    assert lines[2].startswith('inner') and lines[3].startswith('outer')
+
+
+def test_threads_have_separate_stacks(profiler, tmp_path):
+    barrier = threading.Barrier(4)
+
+    def work():
+        barrier.wait()
+        for _ in range(50):
+            _outer()
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    stats = profiler.get_stats()
+    assert stats['outer'].calls == 200 and stats['inner'].calls == 400
+    path = tmp_path / 'stages.folded'
+    profiler.write_folded(path)
+    stacks = [line.rsplit(' ', 1)[0] for line in path.read_text().splitlines()]
+    assert sorted(stacks) == ['outer', 'outer;inner']
+
+
+def test_cli_runs_scenario(tmp_path, capsys):
+    path = tmp_path / 'out.folded'
+    assert profiling.main(['--frames', '2', '--no-memory', '--folded', str(path)]) == 0
+    out = capsys.readouterr().out
+    assert 'RangeProcessor.range_fft' in out
+    assert 'ChirpGenerator.generate_chirp' in out
+    assert 'RangeProcessor.detect_points;RangeProcessor.detect_peaks' in path.read_text()
+    assert not profiling.is_enabled()
+    profiling.reset()
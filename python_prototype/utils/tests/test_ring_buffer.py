@@ -0,0 +1,68 @@
+"""
+Unit Tests für den lock-freien Ringpuffer
+"""
+
+import numpy as np
+import pytest
+from python_prototype.utils.ring_buffer import BlockRingBuffer
+
+
+def test_push_peek_release_order():
+    """Test: Blöcke kommen in FIFO-Reihenfolge mit Metadaten zurück"""
+    ring = BlockRingBuffer(4, (2, 3))
+
+    for k in range(3):
+        assert ring.try_push(np.full((2, 3), k), timestamp=k * 0.5, seq=k)
+    assert len(ring) == 3
+
+    for k in range(3):
+        block, stamp, seq = ring.peek()
+        assert np.all(block == k)
+        assert stamp == k * 0.5
+        assert seq == k
+        ring.release()
+
+    assert ring.peek() is None
+
+
+def test_full_buffer_drops():
+    """Test: Voller Puffer verweigert weitere Blöcke statt zu blockieren"""
+    ring = BlockRingBuffer(2, (4,))
+
+    assert ring.try_push(np.ones(4))
+    assert ring.try_push(np.ones(4))
+    assert not ring.try_push(np.ones(4))
+
+    ring.peek()
+    ring.release()
+    assert ring.try_push(np.ones(4))
+
+
+def test_peek_is_zero_copy():
+    """Test: peek() liefert eine View auf den Slot"""
+    ring = BlockRingBuffer(2, (8,))
+    ring.try_push(np.arange(8.0))
+    block, _, _ = ring.peek()
+    assert not block.flags.owndata
+
+
+def test_shared_attach():
+    """Test: Zweite Instanz sieht die Daten über SharedMemory"""
+    ring = BlockRingBuffer(4, (16,), dtype=np.float32, shared=True)
+    try:
+        other = BlockRingBuffer.attach(ring.name, 4, (16,), np.float32)
+        ring.try_push(np.arange(16, dtype=np.float32), timestamp=1.0, seq=7)
+
+        block, stamp, seq = other.peek()
+        assert np.array_equal(block, np.arange(16))
+        assert seq == 7
+        other.release()
+        assert len(ring) == 0
+        other.close()
+    finally:
+        ring.close()
+
+
+def test_invalid_slots():
+    with pytest.raises(ValueError):
+        BlockRingBuffer(0, (4,))
@@ -0,0 +1,103 @@
+"""
+Unit Tests für den inhaltsadressierten Szenen-Cache
+"""
+
+import multiprocessing
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from python_prototype.waveform.radar_profile import RadarProfile
+from python_prototype.utils.scene_cache import SceneCache, scene_key, simulate_scene
+
+PROFILE = RadarProfile(24e9, 250e6, 256e-6, 1e6)
+TARGETS = [{'range_m': 20.0, 'rcs': 1.0}, {'range_m': 50.0, 'rcs': 0.1}]
+
+
+def _write_same_entry(directory):
+    cache = SceneCache(directory)
+    data = simulate_scene(PROFILE, TARGETS, n_chirps=4, noise_std=1e-9, seed=3,
+                          cache=cache)
+    return float(np.sum(data))
+
+
+def test_scene_key():
+    key = scene_key(PROFILE, TARGETS, seed=1, n_chirps=4)
+    assert len(key) == 64
+    # Reihenfolge der Dict-Keys und Profil-Name zählen nicht
+    reordered = [{'rcs': 1.0, 'range_m': 20.0}, {'rcs': 0.1, 'range_m': 50.0}]
+    assert scene_key(PROFILE.with_changes(name='x'), reordered, seed=1, n_chirps=4) == key
+    # Nicht-physikalische Felder und Defaults ebenfalls nicht
+    labeled = [{'range_m': 20, 'name': 'Drohne'}, dict(TARGETS[1], name='Vogel')]
+    assert scene_key(PROFILE, labeled, seed=1, n_chirps=4) == key
+    # Jede inhaltliche Änderung ergibt einen neuen Schlüssel
+    assert scene_key(PROFILE, TARGETS, seed=2, n_chirps=4) != key
+    assert scene_key(PROFILE, TARGETS[:1], seed=1, n_chirps=4) != key
+    assert scene_key(PROFILE.with_changes(bandwidth=200e6), TARGETS, seed=1,
+                     n_chirps=4) != key
+
+
+def test_put_get_memmap(tmp_path):
+    cache = SceneCache(tmp_path)
+    assert cache.get('abc') is None
+    cache.put('abc', np.arange(10.0))
+    data = cache.get('abc')
+    assert isinstance(data, np.memmap)
+    assert not data.flags.writeable
+    assert np.array_equal(data, np.arange(10.0))
+    assert not list(tmp_path.glob('.tmp-*'))
+
+
+def test_lru_eviction(tmp_path):
+    entry_bytes = np.zeros(1000).nbytes + 128
+    cache = SceneCache(tmp_path, max_bytes=int(2.5 * entry_bytes))
+    for i, key in enumerate(['a', 'b']):
+        cache.put(key, np.zeros(1000))
+        os.utime(cache._path(key), ns=(i * 10**9, i * 10**9))
+
+    cache.get('a')                      # 'a' zuletzt benutzt → 'b' ist am ältesten
+    cache.put('c', np.zeros(1000))
+
+    assert 'a' in cache and 'c' in cache
+    assert 'b' not in cache
+    assert cache.size_bytes() <= cache.max_bytes
+
+
+def test_simulate_scene_cached(tmp_path):
+    cache = SceneCache(tmp_path)
+    first = simulate_scene(PROFILE, TARGETS, n_chirps=4, noise_std=1e-9, seed=3,
+                           cache=cache)
+    again = simulate_scene(PROFILE, TARGETS, n_chirps=4, noise_std=1e-9, seed=3,
+                           cache=cache)
+    uncached = simulate_scene(PROFILE, TARGETS, n_chirps=4, noise_std=1e-9, seed=3,
+                              cache=False)
+
+    assert first.shape == (4, PROFILE.n_samples)
+    assert np.array_equal(first, again)
+    assert np.array_equal(first, uncached)
+    assert len(list(tmp_path.glob('*.npy'))) == 1
+
+
+def test_unseeded_noise_is_not_cached(tmp_path):
+    cache = SceneCache(tmp_path)
+    first = simulate_scene(PROFILE, TARGETS, noise_std=1e-9, cache=cache)
+    second = simulate_scene(PROFILE, TARGETS, noise_std=1e-9, cache=cache)
+    assert not np.array_equal(first, second)
+    assert not list(tmp_path.glob('*.npy'))
+
+
+def test_temp_files_are_not_entries(tmp_path):
+    cache = SceneCache(tmp_path, max_bytes=0)
+    (tmp_path / '.tmp-writer.npy').write_bytes(b'x' * 4096)
+    cache.put('a', np.zeros(10))
+    assert (tmp_path / '.tmp-writer.npy').exists()
+    assert cache.size_bytes() == cache._path('a').stat().st_size
+
+
+def test_concurrent_writers(tmp_path):
+    # spawn: fork nach Numba-/asyncio-Threads anderer Tests kann hängen bleiben
+    ctx = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=4, mp_context=ctx) as pool:
+        sums = list(pool.map(_write_same_entry, [tmp_path] * 8))
+    assert len(set(sums)) == 1
+    assert len(list(tmp_path.glob('*.npy'))) == 1
+    assert not list(tmp_path.glob('.tmp-*'))
@@ -1,5 +1,7 @@
 import numpy as np
-from typing import Tuple
+from typing import Optional, Tuple
+from python_prototype.waveform.radar_profile import RadarProfile
+from python_prototype.utils.profiling import profile_stage
 
 class ChirpGenerator:
     """
@@ -14,29 +16,43 @@ class ChirpGenerator:
         self.xxx Gilt für die GESAMTE Klasse, in ALLEN Methoden!
         """
     def __init__(self, f_start: float, bandwidth: float, 
-                 chirp_duration: float, sample_rate: float):
+                 chirp_duration: float, sample_rate: float,
+                 verbose: bool = True,
+                 profile: Optional[RadarProfile] = None):
     
-        self.f_start=f_start 
-        self.bandwidth=bandwidth
-        self.chirp_duration=chirp_duration
-        self.sample_rate=sample_rate
+        # Alle abgeleiteten Größen kommen aus dem (validierten) RadarProfile
+        if profile is None:
+            profile = RadarProfile(f_start, bandwidth, chirp_duration, sample_rate)
+        self.profile = profile
 
-        self.f_stop=f_start+bandwidth
-        self.chirp_rate=bandwidth/chirp_duration
-        self.n_samples = int(sample_rate * chirp_duration)
+        self.f_start=profile.f_start 
+        self.bandwidth=profile.bandwidth
+        self.chirp_duration=profile.chirp_duration
+        self.sample_rate=profile.sample_rate
 
+        self.f_stop=profile.f_stop
+        self.chirp_rate=profile.chirp_rate
+        self.n_samples = profile.n_samples
 
-        speedOfLight=3e8 #m/s
-       
         'maxrange is limited by samplerate. Nyquist theorem'
-        if sample_rate < bandwidth/2:
-            fbeat_max=sample_rate/2
-            self.max_range = fbeat_max*speedOfLight*chirp_duration/(2*bandwidth)
-        else:
-            self.max_range = speedOfLight*chirp_duration/2
-            fbeat_max=bandwidth
-        self.range_resolution=speedOfLight/(2*bandwidth)
-        self.max_velocity=(speedOfLight/f_start) / (4*chirp_duration)
+        self.max_range = profile.max_range
+        self.range_resolution=profile.range_resolution
+        self.max_velocity=profile.max_velocity
+
+        if verbose:
+            self.print_summary()
+
+    @classmethod
+    def from_profile(cls, profile: RadarProfile, verbose: bool = False) -> "ChirpGenerator":
+        """
+        Erzeugt einen ChirpGenerator aus einem RadarProfile (ohne Banner).
+        """
+        return cls(profile.f_start, profile.bandwidth, profile.chirp_duration,
+                   profile.sample_rate, verbose=verbose, profile=profile)
+
+    def print_summary(self) -> None:
+        f_start, bandwidth = self.f_start, self.bandwidth
+        chirp_duration, sample_rate = self.chirp_duration, self.sample_rate
 
         # ===== KONSOLEN-AUSGABE =====
         print("\n" + "="*60)
@@ -55,10 +71,11 @@ class ChirpGenerator:
         print("="*60 + "\n")
         
     
+    @profile_stage()
     def generate_chirp(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
      
-        #1. time vector
-        t=np.linspace(0, self.chirp_duration, self.n_samples)  
+        #1. time vector (einmal im Profil berechnet)
+        t=self.profile.time_axis
 
         #2. instantaneous frequency#
         f_t=self.get_instantaneous_frequency(t)
@@ -0,0 +1,258 @@
+# python_prototype/waveform/design_sweep.py
+"""
+Parallele Parameterstudie über Wellenform-Parameter.
+
+Für jede Kombination aus f_start, bandwidth, chirp_duration, sample_rate
+und n_chirps werden berechnet:
+
+    analytisch (vektorisiert über das ganze Gitter):
+        n_samples, range_resolution, max_range, max_velocity,
+        velocity_resolution
+    simuliert (Prozess-Pool, pro Konfiguration):
+        Pd, mittlerer Range-Fehler und Fehlalarme auf einer Standard-Szene
+
+Die rauschfreien Beat-Signale kommen aus dem Szenen-Cache (SceneCache),
+Fenster und Puffer werden pro Konfiguration einmal angelegt und für alle
+Rausch-Realisierungen wiederverwendet. Es werden keine ChirpGenerator-
+Banner ausgegeben.
+
+CLI:
+    fmcw-sweep --bandwidth 100e6 250e6 500e6 --chirp-duration 64e-6 256e-6 \\
+               --sample-rate 1e6 2e6 --out sweep.csv --workers 8
+"""
+
+import argparse
+import itertools
+import multiprocessing
+import os
+import time
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+from python_prototype.waveform.radar_profile import RadarProfile, SPEED_OF_LIGHT
+
+PARAMETERS = ('f_start', 'bandwidth', 'chirp_duration', 'sample_rate', 'n_chirps')
+
+# Standard-Szene: RCS ~ R^4, damit alle Echos etwa gleich stark sind
+# (simulate_target skaliert mit sqrt(rcs)/R²). Sonst bestimmt nur der
+# Abstand zum stärksten Ziel, ob ein fernes Ziel über dem Mischprodukt-
+# Untergrund liegt, und nicht die Wellenform.
+STANDARD_SCENE = (
+    {'range_m': 15.0, 'rcs': 1.0},
+    {'range_m': 40.0, 'rcs': 50.0},
+    {'range_m': 70.0, 'rcs': 500.0},
+    {'range_m': 150.0, 'rcs': 1e4},
+)
+
+
+def parameter_grid(f_start: Sequence[float] = (24e9,),
+                   bandwidth: Sequence[float] = (250e6,),
+                   chirp_duration: Sequence[float] = (256e-6,),
+                   sample_rate: Sequence[float] = (1e6,),
+                   n_chirps: Sequence[int] = (64,)) -> pd.DataFrame:
+    """Kartesisches Produkt aller Parameterwerte als DataFrame."""
+    rows = list(itertools.product(f_start, bandwidth, chirp_duration, sample_rate, n_chirps))
+    grid = pd.DataFrame(rows, columns=PARAMETERS)
+    grid['n_chirps'] = grid['n_chirps'].astype(int)
+    return grid
+
+
+def analytic_metrics(grid: pd.DataFrame) -> pd.DataFrame:
+    """
+    Abgeleitete Größen für alle Zeilen auf einmal (gleiche Formeln wie
+    RadarProfile, aber über Spalten vektorisiert).
+
+    Returns:
+        grid plus n_samples, range_resolution, max_range, max_velocity,
+        velocity_resolution, valid
+    """
+    f0 = grid['f_start'].to_numpy(float)
+    B = grid['bandwidth'].to_numpy(float)
+    T = grid['chirp_duration'].to_numpy(float)
+    fs = grid['sample_rate'].to_numpy(float)
+    n_chirps = grid['n_chirps'].to_numpy(int)
+
+    wavelength = SPEED_OF_LIGHT / f0
+    out = grid.copy()
+    out['n_samples'] = np.rint(fs * T).astype(int)
+    out['range_resolution'] = SPEED_OF_LIGHT / (2 * B)
+    out['max_range'] = np.where(fs < B / 2,
+                                (fs / 2) * SPEED_OF_LIGHT * T / (2 * B),
+                                SPEED_OF_LIGHT * T / 2)
+    out['max_velocity'] = wavelength / (4 * T)
+    out['velocity_resolution'] = wavelength / (2 * n_chirps * T)
+    out['valid'] = ((f0 > 0) & (B > 0) & (T > 0) & (fs > 0) & (n_chirps >= 1)
+                    & (out['n_samples'] >= 2))
+    return out
+
+
+def simulate_metrics(profile: RadarProfile, scene=STANDARD_SCENE, n_trials: int = 8,
+                     noise_std: float = 1e-10, seed: int = 0, cache=None,
+                     threshold_db: float = 15.0) -> Dict[str, float]:
+    """
+    Detektions-Kennzahlen einer Konfiguration auf einer Szene.
+
+    Alle Rausch-Realisierungen laufen als ein Frame (n_trials, n_samples)
+    durch den RangeWorkspace; detektiert wird pro Zeile mit CA-CFAR.
+
+    Returns:
+        pd: Anteil erkannter Ziele (nur Ziele innerhalb max_range)
+        range_error_m: Mittlerer |Fehler| der erkannten Ziele
+        false_alarms: Nicht zugeordnete Detektionen pro Frame
+        n_in_range: Anzahl Ziele innerhalb max_range
+    """
+    from python_prototype.utils.scene_cache import simulate_scene
+    from python_prototype.signal_processing.workspace import RangeWorkspace
+    from python_prototype.detection.cfar_kernels import cfar_peaks_2d
+
+    scene = list(scene)
+    # Ziele knapp unter max_range liegen im Übergangsbereich → Rand lassen
+    limit = 0.95 * profile.max_range
+    in_range = [t for t in scene if t['range_m'] < limit]
+    expected = np.array([t['range_m'] for t in in_range])
+
+    clean = simulate_scene(profile, in_range, n_chirps=1, cache=cache)
+    noise = np.random.default_rng(seed).standard_normal((n_trials, profile.n_samples))
+    frame = noise * noise_std + clean
+
+    ws = RangeWorkspace(profile, frame.shape)
+    _, range_axis, profile_db = ws.range_fft(frame)
+
+    tolerance = 2 * profile.range_resolution
+    hits, errors, false_alarms = 0, [], 0
+    for row in profile_db:
+        _, cols, _ = cfar_peaks_2d(row, threshold_db=threshold_db)
+        detected = range_axis[cols]
+        if len(expected) == 0:
+            false_alarms += len(detected)
+            continue
+        if len(detected) == 0:
+            continue
+        dist = np.abs(expected[:, None] - detected[None, :])
+        nearest = dist.min(axis=1)
+        found = nearest <= tolerance
+        hits += int(found.sum())
+        errors.extend(nearest[found])
+        false_alarms += int(np.sum(dist.min(axis=0) > tolerance))
+
+    n_expected = len(expected) * n_trials
+    return {'pd': hits / n_expected if n_expected else np.nan,
+            'range_error_m': float(np.mean(errors)) if errors else np.nan,
+            'false_alarms': false_alarms / n_trials,
+            'n_in_range': len(expected)}
+
+
+def _evaluate_chunk(rows: List[dict], scene, n_trials: int, noise_std: float,
+                    seed: int, cache_dir: Optional[str]) -> List[dict]:
+    from python_prototype.utils.scene_cache import SceneCache
+    cache = SceneCache(cache_dir) if cache_dir else False
+    results = []
+    for row in rows:
+        try:
+            profile = RadarProfile(**{k: row[k] for k in PARAMETERS})
+            metrics = simulate_metrics(profile, scene, n_trials, noise_std, seed, cache)
+        except ValueError as exc:
+            metrics = {'pd': np.nan, 'range_error_m': np.nan, 'false_alarms': np.nan,
+                       'n_in_range': 0, 'error': str(exc)}
+        results.append(metrics)
+    return results
+
+
+def run_sweep(grid: pd.DataFrame, scene=STANDARD_SCENE, simulate: bool = True,
+              n_trials: int = 8, noise_std: float = 1e-10, seed: int = 0,
+              n_workers: Optional[int] = None, chunksize: int = 64,
+              cache: bool = True, cache_dir: Optional[str] = None) -> pd.DataFrame:
+    """
+    Wertet ein Parameter-Gitter aus.
+
+    Args:
+        grid: DataFrame mit den Spalten PARAMETERS (z.B. parameter_grid())
+        scene: Liste von Zielen {'range_m', 'rcs'}
+        simulate: Auch simulierte Kennzahlen berechnen
+        n_trials: Rausch-Realisierungen pro Konfiguration
+        noise_std: Rauschen relativ zu den (sehr kleinen) Beat-Amplituden
+        n_workers: Prozesse (None = os.cpu_count(), 1 = ohne Pool)
+        chunksize: Konfigurationen pro Pool-Auftrag
+        cache: Rauschfreie Szenen im SceneCache ablegen
+        cache_dir: Cache-Verzeichnis (None = Standard)
+
+    Returns:
+        DataFrame: Parameter, analytische und simulierte Kennzahlen
+    """
+    table = analytic_metrics(grid).reset_index(drop=True)
+    if not simulate:
+        return table
+
+    cache_path = None
+    if cache:
+        from python_prototype.utils.scene_cache import SceneCache
+        cache_path = str(SceneCache(cache_dir).directory)
+
+    valid_idx = np.flatnonzero(table['valid'].to_numpy())
+    rows = table.loc[valid_idx, list(PARAMETERS)].to_dict('records')
+    chunks = [rows[i:i + chunksize] for i in range(0, len(rows), chunksize)]
+    args = (scene, n_trials, noise_std, seed, cache_path)
+
+    n_workers = n_workers or os.cpu_count() or 1
+    if n_workers == 1 or len(chunks) <= 1:
+        results = [_evaluate_chunk(chunk, *args) for chunk in chunks]
+    else:
+        # spawn: Worker erben keine Threads (Numba, asyncio) des Elternprozesses
+        ctx = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=min(n_workers, len(chunks)),
+                                 mp_context=ctx) as pool:
+            results = list(pool.map(_evaluate_chunk, chunks,
+                                    *[[a] * len(chunks) for a in args]))
+
+    simulated = pd.DataFrame([m for chunk in results for m in chunk], index=valid_idx)
+    return table.join(simulated)
+
+
+def write_table(table: pd.DataFrame, path: str) -> None:
+    """Speichert die Ergebnisse (.csv, .parquet oder .h5 nach Endung)."""
+    if path.endswith('.parquet'):
+        table.to_parquet(path)
+    elif path.endswith(('.h5', '.hdf5')):
+        table.to_hdf(path, key='sweep', mode='w')
+    else:
+        table.to_csv(path, index=False)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Parameterstudie für FMCW-Wellenformen")
+    parser.add_argument('--f-start', type=float, nargs='+', default=[24e9])
+    parser.add_argument('--bandwidth', type=float, nargs='+', default=[250e6])
+    parser.add_argument('--chirp-duration', type=float, nargs='+', default=[256e-6])
+    parser.add_argument('--sample-rate', type=float, nargs='+', default=[1e6])
+    parser.add_argument('--n-chirps', type=int, nargs='+', default=[64])
+    parser.add_argument('--trials', type=int, default=8, help="Rausch-Realisierungen")
+    parser.add_argument('--noise', type=float, default=1e-10)
+    parser.add_argument('--analytic-only', action='store_true')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--no-cache', action='store_true')
+    parser.add_argument('--out', default='waveform_sweep.csv',
+                        help="Ergebnis-Tabelle (.csv, .parquet, .h5)")
+    args = parser.parse_args(argv)
+
+    grid = parameter_grid(args.f_start, args.bandwidth, args.chirp_duration,
+                          args.sample_rate, args.n_chirps)
+    t0 = time.perf_counter()
+    table = run_sweep(grid, simulate=not args.analytic_only, n_trials=args.trials,
+                      noise_std=args.noise, n_workers=args.workers,
+                      cache=not args.no_cache)
+    elapsed = time.perf_counter() - t0
+    write_table(table, args.out)
+
+    print(f"{len(table)} Konfigurationen in {elapsed:.1f} s → {args.out}")
+    columns = [c for c in ('bandwidth', 'chirp_duration', 'sample_rate', 'range_resolution',
+                           'max_range', 'pd', 'range_error_m') if c in table]
+    sort_by = 'pd' if 'pd' in table else 'range_resolution'
+    print(table.sort_values(sort_by, ascending=sort_by != 'pd')[columns]
+          .head(10).to_string(index=False))
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,203 @@
+# python_prototype/waveform/radar_profile.py
+
+import os
+import numpy as np
+import yaml
+from dataclasses import dataclass, field, fields, replace
+from functools import cached_property, lru_cache
+from typing import Any, Dict, Optional
+
+SPEED_OF_LIGHT = 3e8  # m/s
+
+# Mitgelieferte Profile: python_prototype/waveform/profiles/<name>.yaml
+PROFILE_DIR = os.path.join(os.path.dirname(__file__), 'profiles')
+
+
+def _readonly(a: np.ndarray) -> np.ndarray:
+    a.setflags(write=False)
+    return a
+
+
+@dataclass(frozen=True)
+class RadarProfile:
+    """
+    Unveränderliche, hashbare Radar-Konfiguration.
+
+    Enthält nur die Grundparameter; alle abgeleiteten Größen (Auflösung,
+    Reichweite, Achsen, ...) werden beim ersten Zugriff einmal berechnet
+    und danach wiederverwendet. Da das Objekt hashbar ist, können Caches
+    (FFT-Pläne, Filter, Workspaces) direkt darauf schlüsseln.
+
+    Der Name ist nur informativ und geht nicht in Vergleich/Hash ein.
+    """
+    f_start: float
+    bandwidth: float
+    chirp_duration: float
+    sample_rate: float
+    n_chirps: int = 64
+    window: str = 'hann'
+    max_range_m: Optional[float] = None
+    name: str = field(default='custom', compare=False)
+
+    def __post_init__(self):
+        # Typen normalisieren (YAML liefert z.B. '24e9' als String)
+        for name in ('f_start', 'bandwidth', 'chirp_duration', 'sample_rate'):
+            object.__setattr__(self, name, float(getattr(self, name)))
+        if self.max_range_m is not None:
+            object.__setattr__(self, 'max_range_m', float(self.max_range_m))
+        object.__setattr__(self, 'n_chirps', int(self.n_chirps))
+        self.validate()
+
+    def __reduce__(self):
+        # Nur Grundparameter pickeln (Worker berechnen Achsen selbst)
+        return (self.__class__, tuple(getattr(self, f.name) for f in fields(self)))
+
+    # ===== VALIDIERUNG =====
+
+    def validate(self) -> None:
+        """Prüft physikalische Konsistenz; wirft ValueError bei Verstößen."""
+        for name in ('f_start', 'bandwidth', 'chirp_duration', 'sample_rate'):
+            if not getattr(self, name) > 0:
+                raise ValueError(f"{name} must be positive, got {getattr(self, name)}")
+        if self.n_chirps < 1:
+            raise ValueError(f"n_chirps must be >= 1, got {self.n_chirps}")
+        if self.n_samples < 2:
+            raise ValueError(f"sample_rate * chirp_duration gives only "
+                             f"{self.n_samples} samples per chirp")
+
+        # Nyquist: Beat-Frequenz der gewünschten Max-Range muss < fs/2 sein
+        if self.max_range_m is not None and self.max_range_m > self.max_range:
+            f_beat = self.range_to_beat(self.max_range_m)
+            raise ValueError(
+                f"max_range_m={self.max_range_m:.1f} m needs beat frequency "
+                f"{f_beat/1e3:.1f} kHz, but Nyquist limit is "
+                f"{self.sample_rate/2e3:.1f} kHz (max range {self.max_range:.1f} m)")
+
+    # ===== ABGELEITETE PARAMETER =====
+
+    @cached_property
+    def c(self) -> float:
+        return SPEED_OF_LIGHT
+
+    @cached_property
+    def f_stop(self) -> float:
+        return self.f_start + self.bandwidth
+
+    @cached_property
+    def chirp_rate(self) -> float:
+        return self.bandwidth / self.chirp_duration
+
+    @cached_property
+    def n_samples(self) -> int:
+        # round statt int(): z.B. 1e5 * 70e-6 ergibt in float 6.999...
+        return int(round(self.sample_rate * self.chirp_duration))
+
+    @cached_property
+    def n_range_bins(self) -> int:
+        return self.n_samples // 2
+
+    @cached_property
+    def wavelength(self) -> float:
+        return SPEED_OF_LIGHT / self.f_start
+
+    @cached_property
+    def range_resolution(self) -> float:
+        return SPEED_OF_LIGHT / (2 * self.bandwidth)
+
+    @cached_property
+    def max_range(self) -> float:
+        # Max-Range ist durch die Abtastrate begrenzt (Nyquist)
+        if self.sample_rate < self.bandwidth / 2:
+            fbeat_max = self.sample_rate / 2
+            return fbeat_max * SPEED_OF_LIGHT * self.chirp_duration / (2 * self.bandwidth)
+        return SPEED_OF_LIGHT * self.chirp_duration / 2
+
+    @cached_property
+    def max_velocity(self) -> float:
+        return self.wavelength / (4 * self.chirp_duration)
+
+    @cached_property
+    def velocity_resolution(self) -> float:
+        return self.wavelength / (2 * self.n_chirps * self.chirp_duration)
+
+    # ===== ACHSEN (read-only) =====
+
+    @cached_property
+    def time_axis(self) -> np.ndarray:
+        return _readonly(np.linspace(0, self.chirp_duration, self.n_samples))
+
+    @cached_property
+    def freq_axis(self) -> np.ndarray:
+        """Beat-Frequenzen der positiven FFT-Bins (wie range_fft)."""
+        freq = np.fft.fftfreq(self.n_samples, d=1/self.sample_rate)
+        return _readonly(freq[:self.n_range_bins].copy())
+
+    @cached_property
+    def range_axis(self) -> np.ndarray:
+        return _readonly(self.beat_to_range(self.freq_axis))
+
+    @cached_property
+    def velocity_axis(self) -> np.ndarray:
+        """Geschwindigkeiten der (fftshift-sortierten) Doppler-Bins."""
+        bins = np.arange(self.n_chirps) - self.n_chirps // 2
+        return _readonly(bins * self.velocity_resolution)
+
+    # ===== UMRECHNUNG =====
+
+    def beat_to_range(self, freq_hz):
+        """R = (f_beat × c × T) / (2 × B)"""
+        return freq_hz * SPEED_OF_LIGHT * self.chirp_duration / (2 * self.bandwidth)
+
+    def range_to_beat(self, range_m):
+        """f_beat = 2 × B × R / (c × T)"""
+        return 2 * self.bandwidth * range_m / (SPEED_OF_LIGHT * self.chirp_duration)
+
+    def range_to_bin(self, range_m):
+        """Range [m] → (gerundeter) FFT-Bin-Index."""
+        k = np.rint(self.range_to_beat(range_m) * self.n_samples / self.sample_rate)
+        return k.astype(int) if isinstance(k, np.ndarray) else int(k)
+
+    # ===== LADEN / SPEICHERN =====
+
+    def with_changes(self, **changes) -> "RadarProfile":
+        """Neues (validiertes) Profil mit geänderten Parametern."""
+        return replace(self, **changes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], name: Optional[str] = None) -> "RadarProfile":
+        known = {f.name for f in fields(cls)}
+        unknown = set(data) - known
+        if unknown:
+            raise ValueError(f"Unknown radar profile keys: {sorted(unknown)}")
+        if name is not None and 'name' not in data:
+            data = dict(data, name=name)
+        return cls(**data)
+
+    @classmethod
+    def from_yaml(cls, path: str) -> "RadarProfile":
+        with open(path) as fh:
+            data = yaml.safe_load(fh) or {}
+        name = os.path.splitext(os.path.basename(path))[0]
+        return cls.from_dict(data, name=name)
+
+    def to_yaml(self, path: str) -> None:
+        with open(path, 'w') as fh:
+            yaml.safe_dump(self.to_dict(), fh, sort_keys=False)
+
+
+@lru_cache(maxsize=None)
+def load_profile(name: str) -> RadarProfile:
+    """
+    Lädt ein Profil per Name (mitgeliefert) oder Pfad zu einer YAML-Datei.
+
+    Ergebnisse werden pro Prozess gecacht – Worker-Prozesse können so
+    billig aus einem Profilnamen starten.
+    """
+    path = name if name.endswith(('.yaml', '.yml')) else os.path.join(PROFILE_DIR, name + '.yaml')
+    if not os.path.exists(path):
+        available = sorted(os.path.splitext(f)[0] for f in os.listdir(PROFILE_DIR))
+        raise ValueError(f"Unknown radar profile '{name}', available: {available}")
+    return RadarProfile.from_yaml(path)
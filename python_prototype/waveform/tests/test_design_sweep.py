@@ -0,0 +1,59 @@
+"""
+Unit Tests für die Wellenform-Parameterstudie
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from python_prototype.waveform.radar_profile import RadarProfile
+from python_prototype.waveform.design_sweep import (
+    PARAMETERS, analytic_metrics, parameter_grid, run_sweep, write_table)
+
+
+@pytest.fixture
+def grid():
+    return parameter_grid(bandwidth=[100e6, 250e6], chirp_duration=[64e-6, 256e-6],
+                          sample_rate=[1e6, 4e6])
+
+
+def test_analytic_metrics_match_profile(grid):
+    table = analytic_metrics(grid)
+    assert len(table) == 8
+    for _, row in table.iterrows():
+        profile = RadarProfile(**{k: row[k] for k in PARAMETERS})
+        assert row['n_samples'] == profile.n_samples
+        assert row['range_resolution'] == pytest.approx(profile.range_resolution)
+        assert row['max_range'] == pytest.approx(profile.max_range)
+        assert row['max_velocity'] == pytest.approx(profile.max_velocity)
+        assert row['velocity_resolution'] == pytest.approx(profile.velocity_resolution)
+    assert table['valid'].all()
+
+
+def test_invalid_configurations_are_marked():
+    grid = parameter_grid(sample_rate=[1e6, 1e3])        # 1 kHz → 0 Samples
+    table = run_sweep(grid, n_workers=1, cache=False)
+    assert list(table['valid']) == [True, False]
+    assert np.isnan(table.loc[1, 'pd'])
+
+
+def test_sweep_serial_and_parallel_agree(grid, tmp_path):
+    serial = run_sweep(grid, n_trials=4, n_workers=1, cache_dir=tmp_path)
+    parallel = run_sweep(grid, n_trials=4, n_workers=2, chunksize=3, cache_dir=tmp_path)
+
+    pd.testing.assert_frame_equal(serial, parallel)
+    assert len(list(tmp_path.glob('*.npy'))) == len(grid)
+    assert serial['pd'].between(0, 1).all()
+
+    # Standard-Konfiguration (250 MHz, 256 µs, 4 MHz) sieht alle Ziele im Bereich
+    best = serial[(serial.bandwidth == 250e6) & (serial.chirp_duration == 256e-6)
+                  & (serial.sample_rate == 4e6)].iloc[0]
+    assert best['n_in_range'] == 4
+    assert best['pd'] == 1.0
+    assert best['range_error_m'] <= best['range_resolution']
+
+
+def test_write_table(grid, tmp_path):
+    table = analytic_metrics(grid)
+    path = str(tmp_path / 'sweep.csv')
+    write_table(table, path)
+    assert len(pd.read_csv(path)) == len(table)
@@ -0,0 +1,77 @@
+import pickle
+import numpy as np
+import pytest
+from python_prototype.waveform.chirp_generator import ChirpGenerator
+from python_prototype.waveform.radar_profile import RadarProfile, load_profile
+
+
+def test_derived_parameters_match_chirp_generator():
+    """Test: Abgeleitete Größen identisch zum ChirpGenerator"""
+    profile = RadarProfile(24e9, 250e6, 256e-6, 1e6)
+    gen = ChirpGenerator(24e9, 250e6, 256e-6, 1e6, verbose=False)
+
+    assert profile.n_samples == gen.n_samples == 256
+    assert profile.range_resolution == pytest.approx(0.6)
+    assert profile.max_range == pytest.approx(76.8)
+    assert profile.max_velocity == gen.max_velocity
+    assert profile.range_axis[1] == pytest.approx(profile.range_resolution)
+    assert len(profile.velocity_axis) == profile.n_chirps
+
+
+def test_n_samples_rounding():
+    """Test: n_samples wird gerundet statt abgeschnitten"""
+    assert RadarProfile(24e9, 250e6, 70e-6, 1e5).n_samples == 7
+
+
+def test_hashable_and_immutable():
+    """Test: Profil ist hashbar, Name geht nicht in den Hash ein"""
+    a = RadarProfile(24e9, 250e6, 256e-6, 1e6, name='a')
+    b = RadarProfile(24.0e9, 250e6, 256e-6, 1e6, name='b')
+    assert a == b and hash(a) == hash(b)
+    assert len({a, b, a.with_changes(sample_rate=2e6)}) == 2
+
+    with pytest.raises(AttributeError):
+        a.bandwidth = 1e6
+    with pytest.raises(ValueError):
+        a.range_axis[0] = 1.0
+
+    assert pickle.loads(pickle.dumps(a)) == a
+
+
+def test_validation():
+    """Test: Nyquist-/Max-Range-Verletzungen werden abgelehnt"""
+    with pytest.raises(ValueError, match="Nyquist"):
+        RadarProfile(24e9, 250e6, 256e-6, 1e6, max_range_m=100.0)
+    with pytest.raises(ValueError):
+        RadarProfile(24e9, -250e6, 256e-6, 1e6)
+    with pytest.raises(ValueError):
+        RadarProfile(24e9, 250e6, 1e-6, 1e6)
+
+    assert RadarProfile(24e9, 250e6, 256e-6, 1e6, max_range_m=70).max_range_m == 70.0
+
+
+def test_yaml_roundtrip(tmp_path):
+    """Test: Profile aus YAML laden und zurückschreiben"""
+    profile = load_profile('k24_short_range')
+    assert profile.name == 'k24_short_range'
+    assert profile.sample_rate == 1e6
+    assert load_profile('k24_short_range') is profile   # Prozess-Cache
+
+    path = str(tmp_path / 'mine.yaml')
+    profile.with_changes(n_chirps=32).to_yaml(path)
+    loaded = RadarProfile.from_yaml(path)
+    assert loaded.n_chirps == 32 and loaded.bandwidth == profile.bandwidth
+
+    with pytest.raises(ValueError):
+        load_profile('does_not_exist')
+    with pytest.raises(ValueError):
+        RadarProfile.from_dict({'f_start': 24e9, 'speed': 1})
+
+
+def test_chirp_generator_from_profile(capsys):
+    """Test: ChirpGenerator aus Profil, ohne Konsolen-Banner"""
+    gen = ChirpGenerator.from_profile(load_profile('k24_long_range'))
+    assert gen.n_samples == 2560
+    assert capsys.readouterr().out == ""
+    t, s, _ = gen.generate_chirp()
+    assert np.array_equal(t, gen.profile.time_axis)
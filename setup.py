@@ -4,11 +4,31 @@ setup(
     name="fmcw-radar-project",
     version="0.1.0",
     packages=find_packages(),
+    package_data={
+        'python_prototype.waveform': ['profiles/*.yaml'],
+    },
     install_requires=[
         'numpy',
         'scipy',
         'matplotlib',
         'pytest',
+        'pyyaml',
+        # HDF5-Ausgabe (fmcw-batch), Sweep-Tabellen (fmcw-sweep), Klassifikator
+        'h5py>=3.8.0',
+        'pandas>=2.0.0',
+        'scikit-learn>=1.2.0',
+        'joblib',
     ],
+    extras_require={
+        # Kompilierte CFAR-Kernels (ohne: NumPy-Fallback)
+        'numba': ['numba>=0.57'],
+    },
+    entry_points={
+        'console_scripts': [
+            'fmcw-profile=python_prototype.utils.profiling:main',
+            'fmcw-sweep=python_prototype.waveform.design_sweep:main',
+            'fmcw-batch=hardware_integration.batch_processing:main',
+        ],
+    },
     python_requires='>=3.8',
 )